@@ -38,6 +38,15 @@ from app.models.pipeline_stage import PipelineStage
 from app.models.user_preferences import UserPreferences
 from app.models.requisition import JobRequisition, RequisitionLog
 from app.models.invitation import UserInvitation
+from app.models.resume_document import ResumeDocument
+from app.models.llm_cache import LLMCacheEntry
+from app.models.queued_task import QueuedTask
+from app.models.candidate_skill import CandidateSkill
+from app.models.access_scope import UserVisibleCandidate, UserVisibleJob
+from app.models.application_stage_event import ApplicationStageEvent
+from app.models.funnel_rollup import StageRollupHourly, StageRollupDaily, HireDurationRollup
+from app.models.dashboard_snapshot import DashboardSnapshot
+from app.models.similarity_index_removal import SimilarityIndexRemoval
 target_metadata = Base.metadata
 
 # other values from the config, defined by the needs of env.py,
@@ -0,0 +1,30 @@
+"""add ai_input_hash to job_applications
+
+Revision ID: a4d7b2e9c3f1
+Revises: f3a9c1e5b7d2
+Create Date: 2026-03-09 14:05:37.220981
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4d7b2e9c3f1'
+down_revision: Union[str, Sequence[str], None] = 'f3a9c1e5b7d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job_applications', sa.Column('ai_input_hash', sa.String(length=64), nullable=True))
+    op.add_column('job_applications', sa.Column('ai_screened_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('job_applications', 'ai_screened_at')
+    op.drop_column('job_applications', 'ai_input_hash')
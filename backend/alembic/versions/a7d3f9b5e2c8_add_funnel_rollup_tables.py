@@ -0,0 +1,94 @@
+"""add hourly / daily stage rollups and hire duration rollups for the funnel
+
+Revision ID: a7d3f9b5e2c8
+Revises: f6b2d8e4c1a9
+Create Date: 2026-03-24 16:41:08.553912
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a7d3f9b5e2c8'
+down_revision: Union[str, Sequence[str], None] = 'f6b2d8e4c1a9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Each application's first entry into each stage, with the stage id resolved to its
+# name in the job's pipeline_config; same rules as app.services.stage_history
+# (re-entries are not counted again, template migrations are not progress)
+_NAMED_EVENTS = """
+    WITH first_entries AS (
+        SELECT * FROM (
+            SELECT e.*, row_number() OVER (PARTITION BY e.application_id, e.to_stage ORDER BY e.occurred_at) AS entry
+            FROM application_stage_events e
+        ) ranked
+        WHERE entry = 1
+    ), named AS (
+        SELECT e.job_id, e.occurred_at, e.source, ja.applied_at,
+            coalesce((
+                SELECT s->>'name'
+                FROM jobs j, jsonb_array_elements(coalesce(j.pipeline_config, '[]'::jsonb)) s
+                WHERE j.id = e.job_id AND s->>'id' = e.to_stage
+                LIMIT 1
+            ), e.to_stage) AS stage
+        FROM first_entries e
+        JOIN job_applications ja ON ja.id = e.application_id
+        WHERE e.source <> 'template_migration' AND e.to_stage IS NOT NULL
+    )
+"""
+
+
+def _utc_floor(unit: str) -> str:
+    return f"date_trunc('{unit}', occurred_at AT TIME ZONE 'UTC') AT TIME ZONE 'UTC'"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in ('stage_rollups_hourly', 'stage_rollups_daily'):
+        op.create_table(table,
+        sa.Column('job_id', postgresql.UUID(as_uuid=True), nullable=False),
+        sa.Column('bucket', sa.DateTime(timezone=True), nullable=False),
+        sa.Column('stage', sa.String(), nullable=False),
+        sa.Column('entered', sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('job_id', 'bucket', 'stage')
+        )
+    op.create_table('hire_duration_rollups',
+    sa.Column('job_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('bucket', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('days', sa.Integer(), nullable=False),
+    sa.Column('hires', sa.Integer(), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('job_id', 'bucket', 'days')
+    )
+
+    # Backfill from the stage history recorded so far
+    for table, unit in (('stage_rollups_hourly', 'hour'), ('stage_rollups_daily', 'day')):
+        op.execute(f"""
+            {_NAMED_EVENTS}
+            INSERT INTO {table} (job_id, bucket, stage, entered)
+            SELECT job_id, {_utc_floor(unit)}, stage, count(*)
+            FROM named
+            GROUP BY 1, 2, 3
+        """)
+    # Backfilled events are dated applied_at, so they carry no time to hire
+    op.execute(f"""
+        {_NAMED_EVENTS}
+        INSERT INTO hire_duration_rollups (job_id, bucket, days, hires)
+        SELECT job_id, {_utc_floor('day')}, greatest(extract(day FROM occurred_at - applied_at)::int, 0), count(*)
+        FROM named
+        WHERE lower(stage) = 'hired' AND source <> 'backfill' AND applied_at IS NOT NULL
+        GROUP BY 1, 2, 3
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('hire_duration_rollups')
+    op.drop_table('stage_rollups_daily')
+    op.drop_table('stage_rollups_hourly')
@@ -0,0 +1,30 @@
+"""add prescreen_score to job_applications
+
+Revision ID: b6e1f4a8d2c5
+Revises: a4d7b2e9c3f1
+Create Date: 2026-03-11 10:18:44.906731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b6e1f4a8d2c5'
+down_revision: Union[str, Sequence[str], None] = 'a4d7b2e9c3f1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('job_applications', sa.Column('prescreen_score', sa.Float(), nullable=True))
+    op.create_index('ix_job_applications_job_id_prescreen_score', 'job_applications', ['job_id', 'prescreen_score'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_applications_job_id_prescreen_score', table_name='job_applications')
+    op.drop_column('job_applications', 'prescreen_score')
@@ -0,0 +1,35 @@
+"""add dashboard_snapshots for the cached dashboard overview
+
+Revision ID: b8e4a2c6f3d1
+Revises: a7d3f9b5e2c8
+Create Date: 2026-03-26 10:12:37.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e4a2c6f3d1'
+down_revision: Union[str, Sequence[str], None] = 'a7d3f9b5e2c8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'dashboard_snapshots',
+        sa.Column('key', sa.String(), nullable=False),
+        sa.Column('data', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('computed_at', sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint('key'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('dashboard_snapshots')
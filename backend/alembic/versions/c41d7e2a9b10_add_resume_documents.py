@@ -0,0 +1,44 @@
+"""add resume_documents content-addressed store
+
+Revision ID: c41d7e2a9b10
+Revises: b218f210c9dc
+Create Date: 2026-03-02 10:12:44.310265
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c41d7e2a9b10'
+down_revision: Union[str, Sequence[str], None] = 'b218f210c9dc'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'resume_documents',
+        sa.Column('sha256', sa.String(length=64), primary_key=True, nullable=False),
+        sa.Column('file_path', sa.String(), nullable=False),
+        sa.Column('original_filename', sa.String(), nullable=True),
+        sa.Column('size_bytes', sa.Integer(), nullable=True),
+        sa.Column('parsed_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True),
+        sa.Column('parsed_at', sa.DateTime(timezone=True), nullable=True),
+        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    )
+    op.add_column('candidates', sa.Column('resume_hash', sa.String(length=64), nullable=True))
+    op.create_index(op.f('ix_candidates_resume_hash'), 'candidates', ['resume_hash'], unique=False)
+    op.create_foreign_key('fk_candidates_resume_hash', 'candidates', 'resume_documents', ['resume_hash'], ['sha256'])
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_constraint('fk_candidates_resume_hash', 'candidates', type_='foreignkey')
+    op.drop_index(op.f('ix_candidates_resume_hash'), table_name='candidates')
+    op.drop_column('candidates', 'resume_hash')
+    op.drop_table('resume_documents')
@@ -0,0 +1,44 @@
+"""keep stage events of removed applications and candidates
+
+Revision ID: c5a9d3e7b1f4
+Revises: b8e4a2c6f3d1
+Create Date: 2026-03-27 09:48:21.630174
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c5a9d3e7b1f4'
+down_revision: Union[str, Sequence[str], None] = 'b8e4a2c6f3d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_REFERENCES = (
+    ('application_id', 'job_applications'),
+    ('candidate_id', 'candidates'),
+)
+
+
+def _replace_foreign_keys(ondelete: str) -> None:
+    for column, table in _REFERENCES:
+        name = f'application_stage_events_{column}_fkey'
+        op.drop_constraint(name, 'application_stage_events', type_='foreignkey')
+        op.create_foreign_key(name, 'application_stage_events', table, [column], ['id'], ondelete=ondelete)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for column, _ in _REFERENCES:
+        op.alter_column('application_stage_events', column, nullable=True)
+    _replace_foreign_keys('SET NULL')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DELETE FROM application_stage_events WHERE application_id IS NULL OR candidate_id IS NULL")
+    _replace_foreign_keys('CASCADE')
+    for column, _ in _REFERENCES:
+        op.alter_column('application_stage_events', column, nullable=False)
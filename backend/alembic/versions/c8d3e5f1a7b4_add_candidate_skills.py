@@ -0,0 +1,53 @@
+"""add candidate_skills inverted index
+
+Revision ID: c8d3e5f1a7b4
+Revises: b6e1f4a8d2c5
+Create Date: 2026-03-14 09:41:27.315208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c8d3e5f1a7b4'
+down_revision: Union[str, Sequence[str], None] = 'b6e1f4a8d2c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('candidate_skills',
+    sa.Column('skill', sa.String(length=100), nullable=False),
+    sa.Column('candidate_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.ForeignKeyConstraint(['candidate_id'], ['candidates.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('skill', 'candidate_id')
+    )
+    op.create_index('ix_candidate_skills_candidate_id', 'candidate_skills', ['candidate_id'], unique=False)
+
+    # Backfill from the existing JSONB lists; normalisation mirrors skill_index.normalize_skill
+    # for the common cases (case, surrounding whitespace/punctuation, repeated spaces)
+    op.execute("""
+        INSERT INTO candidate_skills (skill, candidate_id)
+        SELECT DISTINCT normalised, id
+        FROM (
+            SELECT c.id,
+                   left(btrim(regexp_replace(lower(s.value), '\\s+', ' ', 'g'), ' ,;:/|'), 100) AS normalised
+            FROM candidates c
+            CROSS JOIN LATERAL jsonb_array_elements_text(
+                CASE WHEN jsonb_typeof(c.skills) = 'array' THEN c.skills ELSE '[]'::jsonb END
+            ) AS s(value)
+        ) AS expanded
+        WHERE normalised <> ''
+        ON CONFLICT DO NOTHING
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_candidate_skills_candidate_id', table_name='candidate_skills')
+    op.drop_table('candidate_skills')
@@ -0,0 +1,48 @@
+"""add candidate search_vector and trigram indexes
+
+Revision ID: c9e4f2a6b8d1
+Revises: c8d3e5f1a7b4
+Create Date: 2026-03-17 14:05:52.128440
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c9e4f2a6b8d1'
+down_revision: Union[str, Sequence[str], None] = 'c8d3e5f1a7b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column('candidates', sa.Column('search_vector', postgresql.TSVECTOR(), nullable=True))
+
+    # Same document as candidate_search._REFRESH_SQL
+    op.execute("""
+        UPDATE candidates c SET search_vector =
+            setweight(to_tsvector('english', concat_ws(' ', c.first_name, c.last_name, c.email)), 'A') ||
+            setweight(to_tsvector('english', concat_ws(' ', c.current_position, c.current_company)), 'B') ||
+            setweight(jsonb_to_tsvector('english', coalesce(c.skills, '[]'::jsonb), '["string"]'), 'B') ||
+            setweight(to_tsvector('english', coalesce(
+                (SELECT left(d.extracted_text, 60000) FROM resume_documents d WHERE d.sha256 = c.resume_hash), ''
+            )), 'D')
+    """)
+
+    op.create_index('ix_candidates_search_vector', 'candidates', ['search_vector'], unique=False, postgresql_using='gin')
+    op.execute("CREATE INDEX ix_candidates_full_name_trgm ON candidates USING gin ((first_name || ' ' || last_name) gin_trgm_ops)")
+    op.execute("CREATE INDEX ix_candidates_email_trgm ON candidates USING gin (email gin_trgm_ops)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_candidates_email_trgm', table_name='candidates')
+    op.drop_index('ix_candidates_full_name_trgm', table_name='candidates')
+    op.drop_index('ix_candidates_search_vector', table_name='candidates')
+    op.drop_column('candidates', 'search_vector')
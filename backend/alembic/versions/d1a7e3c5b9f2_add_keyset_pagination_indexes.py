@@ -0,0 +1,31 @@
+"""add (created_at, id) indexes for keyset pagination
+
+Revision ID: d1a7e3c5b9f2
+Revises: c9e4f2a6b8d1
+Create Date: 2026-03-18 10:22:37.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd1a7e3c5b9f2'
+down_revision: Union[str, Sequence[str], None] = 'c9e4f2a6b8d1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('candidates', 'jobs', 'scheduled_activities', 'job_requisitions', 'feedbacks')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in _TABLES:
+        op.create_index(f'ix_{table}_created_at_id', table, ['created_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in reversed(_TABLES):
+        op.drop_index(f'ix_{table}_created_at_id', table_name=table)
@@ -0,0 +1,86 @@
+"""add user_visible_candidates / user_visible_jobs scope tables
+
+Revision ID: d4b8f2e6a1c3
+Revises: d1a7e3c5b9f2
+Create Date: 2026-03-20 11:48:03.771925
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4b8f2e6a1c3'
+down_revision: Union[str, Sequence[str], None] = 'd1a7e3c5b9f2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('user_visible_candidates',
+    sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('candidate_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['candidate_id'], ['candidates.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'candidate_id')
+    )
+    op.create_index('ix_user_visible_candidates_candidate_id', 'user_visible_candidates', ['candidate_id'], unique=False)
+    op.create_table('user_visible_jobs',
+    sa.Column('user_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('job_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('user_id', 'job_id')
+    )
+    op.create_index('ix_user_visible_jobs_job_id', 'user_visible_jobs', ['job_id'], unique=False)
+
+    # Lookups used when the scope of one candidate or user is recomputed
+    op.create_index('ix_job_applications_candidate_id', 'job_applications', ['candidate_id'], unique=False)
+    op.create_index('ix_scheduled_activities_candidate_id', 'scheduled_activities', ['candidate_id'], unique=False)
+    op.create_index('ix_activity_assignees_user_id', 'activity_assignees', ['user_id'], unique=False)
+
+    # Backfill; same rules as app.services.access_scope
+    op.execute("""
+        INSERT INTO user_visible_candidates (user_id, candidate_id)
+        SELECT d.owner_id, ja.candidate_id
+        FROM departments d
+        JOIN jobs j ON j.department_id = d.id
+        JOIN job_applications ja ON ja.job_id = j.id
+        JOIN users u ON u.id = d.owner_id
+        WHERE u.role = 'HIRING_MANAGER'
+        UNION
+        SELECT aa.user_id, sa.candidate_id
+        FROM activity_assignees aa
+        JOIN scheduled_activities sa ON sa.id = aa.activity_id
+        JOIN users u ON u.id = aa.user_id
+        WHERE u.role = 'INTERVIEWER' AND sa.candidate_id IS NOT NULL
+    """)
+    op.execute("""
+        INSERT INTO user_visible_jobs (user_id, job_id)
+        SELECT d.owner_id, j.id
+        FROM departments d
+        JOIN jobs j ON j.department_id = d.id
+        JOIN users u ON u.id = d.owner_id
+        WHERE u.role = 'HIRING_MANAGER'
+        UNION
+        SELECT aa.user_id, sa.job_id
+        FROM activity_assignees aa
+        JOIN scheduled_activities sa ON sa.id = aa.activity_id
+        JOIN users u ON u.id = aa.user_id
+        WHERE u.role = 'INTERVIEWER' AND sa.job_id IS NOT NULL
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_activity_assignees_user_id', table_name='activity_assignees')
+    op.drop_index('ix_scheduled_activities_candidate_id', table_name='scheduled_activities')
+    op.drop_index('ix_job_applications_candidate_id', table_name='job_applications')
+    op.drop_index('ix_user_visible_jobs_job_id', table_name='user_visible_jobs')
+    op.drop_table('user_visible_jobs')
+    op.drop_index('ix_user_visible_candidates_candidate_id', table_name='user_visible_candidates')
+    op.drop_table('user_visible_candidates')
@@ -0,0 +1,34 @@
+"""add extracted text to resume_documents
+
+Revision ID: d5e8a1f3c2b7
+Revises: c41d7e2a9b10
+Create Date: 2026-03-03 14:05:19.662810
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd5e8a1f3c2b7'
+down_revision: Union[str, Sequence[str], None] = 'c41d7e2a9b10'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('resume_documents', sa.Column('extracted_text', sa.Text(), nullable=True))
+    op.add_column('resume_documents', sa.Column('text_bytes', sa.Integer(), nullable=True))
+    op.add_column('resume_documents', sa.Column('page_count', sa.Integer(), nullable=True))
+    op.add_column('resume_documents', sa.Column('extracted_at', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('resume_documents', 'extracted_at')
+    op.drop_column('resume_documents', 'page_count')
+    op.drop_column('resume_documents', 'text_bytes')
+    op.drop_column('resume_documents', 'extracted_text')
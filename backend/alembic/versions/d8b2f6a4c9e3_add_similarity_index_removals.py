@@ -0,0 +1,33 @@
+"""add similarity_index_removals for candidates the similarity index must drop
+
+Revision ID: d8b2f6a4c9e3
+Revises: c5a9d3e7b1f4
+Create Date: 2026-03-27 11:05:52.318406
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd8b2f6a4c9e3'
+down_revision: Union[str, Sequence[str], None] = 'c5a9d3e7b1f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('similarity_index_removals',
+    sa.Column('candidate_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('removed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('candidate_id')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('similarity_index_removals')
@@ -0,0 +1,40 @@
+"""order the keyset pagination indexes newest first, missing timestamps last
+
+Revision ID: e2c6a8f4d7b5
+Revises: d8b2f6a4c9e3
+Create Date: 2026-03-27 14:36:10.942751
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e2c6a8f4d7b5'
+down_revision: Union[str, Sequence[str], None] = 'd8b2f6a4c9e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# app.utils.pagination orders by (timestamp DESC NULLS LAST, id DESC)
+_INDEXES = [
+    (f'ix_{table}_created_at_id', table, [], 'created_at')
+    for table in ('candidates', 'jobs', 'scheduled_activities', 'job_requisitions', 'feedbacks')
+] + [
+    ('ix_job_applications_job_id_stage_applied_at', 'job_applications', ['job_id', 'current_stage'], 'applied_at'),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for name, table, prefix, timestamp in _INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, [*prefix, sa.text(f'{timestamp} DESC NULLS LAST'), sa.text('id DESC')], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for name, table, prefix, timestamp in _INDEXES:
+        op.drop_index(name, table_name=table)
+        op.create_index(name, table, [*prefix, timestamp, 'id'], unique=False)
@@ -0,0 +1,30 @@
+"""add (job_id, current_stage, applied_at, id) index for the pipeline board
+
+Revision ID: e3c9a1f7d2b4
+Revises: d4b8f2e6a1c3
+Create Date: 2026-03-21 09:14:52.408816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e3c9a1f7d2b4'
+down_revision: Union[str, Sequence[str], None] = 'd4b8f2e6a1c3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_job_applications_job_id_stage_applied_at', 'job_applications',
+        ['job_id', 'current_stage', 'applied_at', 'id'], unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_applications_job_id_stage_applied_at', table_name='job_applications')
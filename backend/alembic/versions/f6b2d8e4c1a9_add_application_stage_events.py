@@ -0,0 +1,55 @@
+"""add application_stage_events history table
+
+Revision ID: f6b2d8e4c1a9
+Revises: e3c9a1f7d2b4
+Create Date: 2026-03-23 14:05:19.227340
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f6b2d8e4c1a9'
+down_revision: Union[str, Sequence[str], None] = 'e3c9a1f7d2b4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('application_stage_events',
+    sa.Column('id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('application_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('job_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('candidate_id', postgresql.UUID(as_uuid=True), nullable=False),
+    sa.Column('from_stage', sa.String(), nullable=True),
+    sa.Column('to_stage', sa.String(), nullable=True),
+    sa.Column('source', sa.String(), nullable=False),
+    sa.Column('changed_by_user_id', postgresql.UUID(as_uuid=True), nullable=True),
+    sa.Column('occurred_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.ForeignKeyConstraint(['application_id'], ['job_applications.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['candidate_id'], ['candidates.id'], ondelete='CASCADE'),
+    sa.ForeignKeyConstraint(['changed_by_user_id'], ['users.id'], ondelete='SET NULL'),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('ix_application_stage_events_job_id_occurred_at', 'application_stage_events', ['job_id', 'occurred_at'], unique=False)
+    op.create_index('ix_application_stage_events_application_id', 'application_stage_events', ['application_id'], unique=False)
+
+    # History starts with the stage every application is in today, dated when it applied
+    op.execute("""
+        INSERT INTO application_stage_events (id, application_id, job_id, candidate_id, from_stage, to_stage, source, changed_by_user_id, occurred_at)
+        SELECT gen_random_uuid(), ja.id, ja.job_id, ja.candidate_id, NULL, ja.current_stage, 'backfill', ja.added_by_user_id, coalesce(ja.applied_at, now())
+        FROM job_applications ja
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_application_stage_events_application_id', table_name='application_stage_events')
+    op.drop_index('ix_application_stage_events_job_id_occurred_at', table_name='application_stage_events')
+    op.drop_table('application_stage_events')
@@ -4,13 +4,27 @@ from dotenv import load_dotenv
 load_dotenv()
 
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from app.routers import departments, job, candidate, activity, auth, feedback, dashboard, pipeline
 from app.routers import scorecard as scorecard_router
 from app.routers import preferences as preferences_router
 from app.routers import requisitions as requisitions_router
 from app.routers import calendar as calendar_router
+from app.routers import tasks as tasks_router
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.utils.serialization import DefaultJSONResponse
 from app.models import user_preferences  # ensure table is registered in metadata
 from app.models import password_reset  # ensure password_reset_tokens table is created
+from app.models import resume_document  # ensure resume_documents table is created
+from app.models import llm_cache  # ensure llm_cache_entries table is created
+from app.models import queued_task  # ensure queued_tasks table is created
+from app.models import candidate_skill  # ensure candidate_skills table is created
+from app.models import access_scope  # ensure user_visible_candidates / user_visible_jobs tables are created
+from app.services.access_scope import access_scope_service  # noqa: F401  (its flush hook keeps them current)
+from app.models import application_stage_event  # ensure application_stage_events table is created
+from app.models import funnel_rollup  # ensure stage / hire duration rollup tables are created
+from app.models import dashboard_snapshot  # ensure dashboard_snapshots table is created
+from app.models import similarity_index_removal  # ensure similarity_index_removals table is created
 from app.database import Base, engine
 
 
@@ -19,7 +33,7 @@ from fastapi.staticfiles import StaticFiles
 # Create tables if not using Alembic (for dev/testing simplicity before migration setup)
 Base.metadata.create_all(bind=engine) 
 
-app = FastAPI(title="Clustox ATS API")
+app = FastAPI(title="Clustox ATS API", default_response_class=DefaultJSONResponse)
 
 # Mount uploads directory for static access
 app.mount("/static", StaticFiles(directory="uploads"), name="static")
@@ -35,8 +49,12 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
+# Compress JSON bodies worth compressing (kanban boards, candidate lists); tiny ones are not worth the CPU
+app.add_middleware(GZipMiddleware, minimum_size=int(os.getenv("GZIP_MIN_SIZE", "1024")), compresslevel=5)
+
 app.include_router(departments.router)
 app.include_router(job.router)
 app.include_router(candidate.router)
@@ -48,6 +66,7 @@ app.include_router(scorecard_router.router)
 app.include_router(pipeline.router)
 app.include_router(preferences_router.router)
 app.include_router(requisitions_router.router)
+app.include_router(tasks_router.router)
 app.include_router(calendar_router.router, prefix="/api/calendar", tags=["Calendar Integration"])
 
 @app.get("/")
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+
+class UserVisibleCandidate(Base):
+    """
+    Which candidates a hiring manager or interviewer may see: one row per
+    (user, candidate). Maintained by app.services.access_scope; owners and HR
+    see everything and have no rows.
+    """
+    __tablename__ = "user_visible_candidates"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_user_visible_candidates_candidate_id", "candidate_id"),
+    )
+
+
+class UserVisibleJob(Base):
+    """Which jobs a hiring manager or interviewer may see; see UserVisibleCandidate."""
+    __tablename__ = "user_visible_jobs"
+
+    user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_user_visible_jobs_job_id", "job_id"),
+    )
@@ -0,0 +1,40 @@
+import uuid
+from sqlalchemy import Column, String, DateTime, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class StageEventSource:
+    APPLIED = "applied"  # application created in its first stage
+    MANUAL = "manual"  # single move on the board
+    BULK = "bulk"  # POST /jobs/{id}/candidates/bulk
+    TEMPLATE_MIGRATION = "template_migration"  # pipeline template synced or changed
+    BACKFILL = "backfill"  # stage an application was already in when history started
+
+
+class ApplicationStageEvent(Base):
+    """
+    Append-only history of JobApplication.current_stage: one row per move,
+    written by app.services.stage_history alongside every stage change.
+    from_stage is NULL for an application's first stage. Removing an
+    application or candidate only clears the reference, so the history (and
+    the funnel rollups counted from it) outlive them; deleting the job drops
+    both together.
+    """
+    __tablename__ = "application_stage_events"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    application_id = Column(UUID(as_uuid=True), ForeignKey("job_applications.id", ondelete="SET NULL"), nullable=True)
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
+    candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidates.id", ondelete="SET NULL"), nullable=True)
+    from_stage = Column(String, nullable=True)
+    to_stage = Column(String, nullable=True)
+    source = Column(String, nullable=False, default=StageEventSource.MANUAL)
+    changed_by_user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    occurred_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+
+    __table_args__ = (
+        Index("ix_application_stage_events_job_id_occurred_at", "job_id", "occurred_at"),
+        Index("ix_application_stage_events_application_id", "application_id"),
+    )
@@ -1,7 +1,7 @@
 import uuid
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, ForeignKey, Enum as SAEnum
-from sqlalchemy.dialects.postgresql import UUID, JSONB
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, ForeignKey, Index, Enum as SAEnum
+from sqlalchemy.dialects.postgresql import UUID, JSONB, TSVECTOR
+from sqlalchemy.orm import relationship, deferred
 from sqlalchemy.sql import func
 import enum
 from app.database import Base
@@ -44,14 +44,26 @@ class Candidate(Base):
     
     # Meta
     resume_file_path = Column(String, nullable=True)
+    resume_hash = Column(String(64), ForeignKey("resume_documents.sha256"), nullable=True, index=True)
     parsed_at = Column(DateTime(timezone=True), nullable=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
+    # Full-text search document (name, role, skills, resume text); maintained by candidate_search,
+    # deferred so regular candidate queries never load it
+    search_vector = deferred(Column(TSVECTOR, nullable=True))
+
     # Relationships
     applications = relationship("JobApplication", back_populates="candidate", cascade="all, delete-orphan")
     scheduled_activities = relationship("ScheduledActivity", back_populates="candidate", cascade="all, delete-orphan")
 
+    # The trigram indexes on name and email (ix_candidates_full_name_trgm, ix_candidates_email_trgm)
+    # need the pg_trgm extension and are created by migration only
+    __table_args__ = (
+        Index("ix_candidates_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_candidates_created_at_id", created_at.desc().nulls_last(), id.desc()),  # keyset pagination order
+    )
+
 class JobApplication(Base):
     __tablename__ = "job_applications"
 
@@ -81,3 +93,12 @@ class JobApplication(Base):
     # AI Screening
     ai_score = Column(Float, nullable=True) # AI match score (0-100)
     ai_analysis = Column(JSONB, default=dict) # { "key_strengths": [], "missing_skills": [], "reasoning": "" }
+    ai_input_hash = Column(String(64), nullable=True) # Fingerprint of the inputs behind ai_score; unchanged inputs are not re-screened
+    ai_screened_at = Column(DateTime(timezone=True), nullable=True)
+    prescreen_score = Column(Float, nullable=True) # Local 0-100 pre-screen (skills, experience, TF-IDF); gates bulk AI screening
+
+    __table_args__ = (
+        Index("ix_job_applications_job_id_prescreen_score", "job_id", "prescreen_score"),
+        Index("ix_job_applications_candidate_id", "candidate_id"),
+        Index("ix_job_applications_job_id_stage_applied_at", job_id, current_stage, applied_at.desc().nulls_last(), id.desc()),  # pipeline board
+    )
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, String, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+
+class CandidateSkill(Base):
+    """
+    Inverted index of Candidate.skills: one row per (normalised skill, candidate).
+    The primary key leads with the skill, so "who knows X" is a single index
+    range scan instead of a JSONB scan over every candidate.
+    """
+    __tablename__ = "candidate_skills"
+
+    skill = Column(String(100), primary_key=True)
+    candidate_id = Column(UUID(as_uuid=True), ForeignKey("candidates.id", ondelete="CASCADE"), primary_key=True)
+
+    __table_args__ = (
+        Index("ix_candidate_skills_candidate_id", "candidate_id"),
+    )
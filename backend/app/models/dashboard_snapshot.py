@@ -0,0 +1,12 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from app.database import Base
+
+
+class DashboardSnapshot(Base):
+    """Last computed dashboard aggregate, shared by every web worker; see app.services.dashboard_service."""
+    __tablename__ = "dashboard_snapshots"
+
+    key = Column(String, primary_key=True)  # e.g. "overview"
+    data = Column(JSONB, nullable=False)
+    computed_at = Column(DateTime(timezone=True), nullable=False)
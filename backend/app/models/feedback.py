@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Integer, Text, ForeignKey, DateTime
+from sqlalchemy import Column, String, Integer, Text, ForeignKey, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -29,3 +29,8 @@ class Feedback(Base):
     activity = relationship("ScheduledActivity", backref="feedback")
     interviewer = relationship("User", backref="feedbacks_given")
     candidate = relationship("Candidate", backref="feedbacks")
+
+    # Keyset pagination order (see app.utils.pagination)
+    __table_args__ = (
+        Index("ix_feedbacks_created_at_id", created_at.desc().nulls_last(), id.desc()),
+    )
@@ -0,0 +1,37 @@
+from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from sqlalchemy.dialects.postgresql import UUID
+from app.database import Base
+
+
+class StageRollupHourly(Base):
+    """
+    Applications entering each pipeline stage, per job and hour. Stages are
+    keyed by name so jobs on different templates (and a job whose template
+    changed) add up. Maintained by app.services.funnel_service.
+    """
+    __tablename__ = "stage_rollups_hourly"
+
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    bucket = Column(DateTime(timezone=True), primary_key=True)
+    stage = Column(String, primary_key=True)
+    entered = Column(Integer, nullable=False, default=0)
+
+
+class StageRollupDaily(Base):
+    """StageRollupHourly per day, for longer reporting windows."""
+    __tablename__ = "stage_rollups_daily"
+
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    bucket = Column(DateTime(timezone=True), primary_key=True)
+    stage = Column(String, primary_key=True)
+    entered = Column(Integer, nullable=False, default=0)
+
+
+class HireDurationRollup(Base):
+    """Hires per job and day, by whole days from applying to being hired: a histogram medians are read from."""
+    __tablename__ = "hire_duration_rollups"
+
+    job_id = Column(UUID(as_uuid=True), ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True)
+    bucket = Column(DateTime(timezone=True), primary_key=True)
+    days = Column(Integer, primary_key=True)
+    hires = Column(Integer, nullable=False, default=0)
@@ -1,5 +1,5 @@
 import uuid
-from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, ForeignKey, Enum as SAEnum
+from sqlalchemy import Column, String, Integer, Float, Boolean, DateTime, Text, ForeignKey, Index, Enum as SAEnum
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
@@ -72,6 +72,11 @@ class Job(Base):
     hiring_manager = relationship("User", foreign_keys=[hiring_manager_id])
     recruiter = relationship("User", foreign_keys=[recruiter_id])
 
+    # Keyset pagination order (see app.utils.pagination)
+    __table_args__ = (
+        Index("ix_jobs_created_at_id", created_at.desc().nulls_last(), id.desc()),
+    )
+
 class JobActivity(Base):
     __tablename__ = "job_activities"
 
@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, DateTime
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class LLMCacheEntry(Base):
+    """Persisted LLM response, keyed by a fingerprint of model, prompt version and inputs."""
+    __tablename__ = "llm_cache_entries"
+
+    key = Column(String(64), primary_key=True)
+    kind = Column(String, nullable=False)  # e.g. "resume_parse", "screening"
+    model = Column(String, nullable=False)
+    prompt_version = Column(String, nullable=False)
+    response = Column(JSONB, nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
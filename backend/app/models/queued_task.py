@@ -0,0 +1,45 @@
+import uuid
+from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey, Index
+from sqlalchemy.dialects.postgresql import UUID, JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class TaskStatus:
+    QUEUED = "queued"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+
+class QueuedTask(Base):
+    """
+    A unit of background work (resume parsing, AI screening, ...) picked up by
+    scripts/task_worker.py. A running task whose lease (locked_until) expires is
+    considered abandoned and becomes claimable again.
+    """
+    __tablename__ = "queued_tasks"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    kind = Column(String, nullable=False, index=True)  # e.g. "resume_upload", "screening"
+    payload = Column(JSONB, nullable=False, default=dict)
+    status = Column(String, nullable=False, default=TaskStatus.QUEUED)
+
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    run_after = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    locked_until = Column(DateTime(timezone=True), nullable=True)
+    locked_by = Column(String, nullable=True)
+
+    progress = Column(JSONB, nullable=True)
+    result = Column(JSONB, nullable=True)
+    last_error = Column(Text, nullable=True)
+
+    created_by = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index("ix_queued_tasks_status_run_after", "status", "run_after"),
+    )
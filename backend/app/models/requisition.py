@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, Boolean, Text, ForeignKey, Enum as SAEnum, DateTime
+from sqlalchemy import Column, String, Float, Boolean, Text, ForeignKey, Enum as SAEnum, DateTime, Index
 from sqlalchemy.dialects.postgresql import UUID
 from app.database import Base
 import enum
@@ -50,6 +50,11 @@ class JobRequisition(Base):
     hiring_manager = relationship("User", foreign_keys=[hiring_manager_id])
     audit_logs = relationship("RequisitionLog", back_populates="requisition", cascade="all, delete-orphan")
 
+    # Keyset pagination order (see app.utils.pagination)
+    __table_args__ = (
+        Index("ix_job_requisitions_created_at_id", created_at.desc().nulls_last(), id.desc()),
+    )
+
 
 class RequisitionLog(Base):
     __tablename__ = "requisition_logs"
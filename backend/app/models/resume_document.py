@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, Integer, DateTime, Text
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ResumeDocument(Base):
+    """A stored resume file, addressed by the SHA-256 of its content."""
+    __tablename__ = "resume_documents"
+
+    sha256 = Column(String(64), primary_key=True)
+    file_path = Column(String, nullable=False)
+    original_filename = Column(String, nullable=True)
+    size_bytes = Column(Integer, nullable=True)
+
+    # Plain text extracted once at upload time, so screening never re-reads the file
+    extracted_text = Column(Text, nullable=True)
+    text_bytes = Column(Integer, nullable=True)
+    page_count = Column(Integer, nullable=True)
+    extracted_at = Column(DateTime(timezone=True), nullable=True)
+
+    # Cached LLM parse result (CandidateCreate fields, without job/file linkage)
+    parsed_data = Column(JSONB, nullable=True)
+    parsed_at = Column(DateTime(timezone=True), nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
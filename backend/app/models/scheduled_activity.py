@@ -1,6 +1,6 @@
 import uuid
 import enum
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Enum as SAEnum
+from sqlalchemy import Column, String, DateTime, Text, ForeignKey, Index, Enum as SAEnum
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -59,6 +59,11 @@ class ScheduledActivity(Base):
     assignees = relationship("User", secondary="activity_assignees", backref="assigned_activities")
     scorecard_template = relationship("ScorecardTemplate")
 
+    __table_args__ = (
+        Index("ix_scheduled_activities_created_at_id", created_at.desc().nulls_last(), id.desc()),  # keyset pagination order
+        Index("ix_scheduled_activities_candidate_id", "candidate_id"),
+    )
+
 # Association Table for Many-to-Many
 from sqlalchemy import Table, ForeignKey
 activity_assignees = Table(
@@ -66,4 +71,5 @@ activity_assignees = Table(
     Base.metadata,
     Column("activity_id", UUID(as_uuid=True), ForeignKey("scheduled_activities.id"), primary_key=True),
     Column("user_id", UUID(as_uuid=True), ForeignKey("users.id"), primary_key=True),
+    Index("ix_activity_assignees_user_id", "user_id"),
 )
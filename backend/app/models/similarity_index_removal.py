@@ -0,0 +1,17 @@
+from sqlalchemy import Column, DateTime
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class SimilarityIndexRemoval(Base):
+    """
+    A deleted (or merged-away) candidate whose vector the similarity index has
+    not dropped yet. Written when the candidate is deleted; drained by
+    app.services.similarity_index on its next sync. No foreign key: the
+    candidate is gone.
+    """
+    __tablename__ = "similarity_index_removals"
+
+    candidate_id = Column(UUID(as_uuid=True), primary_key=True)
+    removed_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
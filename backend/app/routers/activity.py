@@ -1,12 +1,14 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session, joinedload
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from app.database import get_db
 from app.models.scheduled_activity import ScheduledActivity
 from app.schemas.activity import ActivityCreate, ActivityUpdate, ActivityResponse
 from app.services.calendar_sync import sync_event_to_google, delete_event_from_google
+from app.utils.pagination import cursor_param, keyset, set_next_cursor
+from app.utils.serialization import model_list_response
 
 router = APIRouter(
     prefix="/activities",
@@ -22,8 +24,17 @@ from sqlalchemy import or_, func
 from app.models.scheduled_activity import ActivityStatus
 
 @router.get("/all", response_model=List[ActivityResponse])
-def get_all_activities(db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    """Get all activities. Interviewers see only their assigned activities; others see all."""
+def get_all_activities(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = Depends(cursor_param),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Get all activities. Interviewers see only their assigned activities; others see all.
+    With `limit` the list is paged newest first and X-Next-Cursor points at the next page.
+    """
     cutoff_date = datetime.now() - timedelta(days=30)
     
     query = db.query(ScheduledActivity).options(
@@ -70,13 +81,18 @@ def get_all_activities(db: Session = Depends(get_db), current_user: User = Depen
         )
     )
     
-    return query.all()
+    if not limit:
+        return model_list_response(ActivityResponse, query.all())
+    activities = keyset(query, ScheduledActivity, cursor).limit(limit).all()
+    response = model_list_response(ActivityResponse, activities)
+    set_next_cursor(response, activities, limit)
+    return response
 
 @router.get("/my-interviews", response_model=List[ActivityResponse])
 def get_my_interviews(db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
     cutoff_date = datetime.now() - timedelta(days=30)
     
-    return db.query(ScheduledActivity).options(
+    activities = db.query(ScheduledActivity).options(
         joinedload(ScheduledActivity.candidate),
         joinedload(ScheduledActivity.job),
         joinedload(ScheduledActivity.assignees),
@@ -88,6 +104,7 @@ def get_my_interviews(db: Session = Depends(get_db), current_user: User = Depend
             func.coalesce(ScheduledActivity.updated_at, ScheduledActivity.created_at) >= cutoff_date
         )
     ).all()
+    return model_list_response(ActivityResponse, activities)
 
 @router.post("/", response_model=ActivityResponse, status_code=status.HTTP_201_CREATED)
 def create_activity(activity: ActivityCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
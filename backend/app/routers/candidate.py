@@ -1,127 +1,113 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from uuid import UUID
 from app.database import get_db
-from app.schemas.candidate import CandidateCreate, CandidateResponse, CandidateUpdate, CandidateBasicResponse
-from app.services.candidate_service import candidate_service
+from app.schemas.candidate import (
+    CandidateCreate, CandidateResponse, CandidateUpdate, CandidateBasicResponse, BatchUploadResponse,
+    CandidateSearchResult, SimilarCandidate, DuplicatePair, CandidateMergeRequest, CandidateMergeResponse,
+)
+from app.services.candidate_service import EXPANDABLE_LIST_FIELDS, candidate_service
+from app.services.candidate_search import candidate_search_service
+from app.services.similarity_index import similarity_index_service
+from app.services.dedupe_service import dedupe_service
+from app.services.access_scope import access_scope_service
 from app.models.user import UserRole, User
 from app.dependencies import RoleChecker
 from app.routers.auth import get_current_active_user
+from app.utils.pagination import cursor_param, set_next_cursor
+from app.utils.serialization import DefaultJSONResponse
 
 router = APIRouter(
     prefix="/candidates",
     tags=["candidates"],
 )
+def _list_item(row, redact_salary: bool) -> dict:
+    """Serialises one get_candidate_list_rows() row for GET /candidates/."""
+    item = row._asdict()
+    item["id"] = str(item["id"])
+    for key in ("created_at", "updated_at", "parsed_at"):
+        item[key] = item[key].isoformat() if item[key] else None
+    item["skills"] = item["skills"] or []
+    for key, empty in (("education", []), ("experience_history", []), ("social_links", {})):
+        if key in item:
+            item[key] = item[key] or empty
+    if redact_salary:
+        item["current_salary"] = None
+        item["expected_salary"] = None
+    return item
+
+
 @router.get("/")
-def read_candidates(skip: int = 0, limit: int = 100, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    # Query without defer options, trusting manual serialization to pick fields
-    from app.models.candidate import Candidate
-    
-    filter_by_owner_id = None
-    filter_by_department_id = None
-    
-    if current_user.role == UserRole.HIRING_MANAGER:
-        filter_by_owner_id = current_user.id
-        
-    elif current_user.role == UserRole.INTERVIEWER:
-        # Interviewers only see candidates they are assigned to interview
-        from app.models.scheduled_activity import ScheduledActivity
-        assigned_candidate_ids = db.query(ScheduledActivity.candidate_id).join(ScheduledActivity.assignees).filter(
-            User.id == current_user.id,
-            ScheduledActivity.candidate_id.isnot(None)
-        ).distinct().all()
-        
-        if not assigned_candidate_ids:
-            return []
-        
-        # Extract candidate IDs from the result tuples
-        candidate_ids = [candidate_id[0] for candidate_id in assigned_candidate_ids]
-        
-        # Get candidates that are in the assigned candidate IDs list
-        candidates = candidate_service.get_candidates_by_ids(db, candidate_ids, skip=skip, limit=limit)
-        
-        # Manually construction response to bypass Pydantic serialization hang
-        results = []
-        for c in candidates:
-            try:
-                # Basic fields
-                c_dict = {
-                    "id": str(c.id),
-                    "first_name": c.first_name,
-                    "last_name": c.last_name,
-                    "email": c.email,
-                    "phone": c.phone,
-                    "location": c.location,
-                    "current_company": c.current_company,
-                    "current_position": c.current_position,
-                    "experience_years": c.experience_years,
-                    "nationality": c.nationality,
-                    "notice_period": c.notice_period,
-                    "skills": c.skills or [],
-                    "education": c.education or [],
-                    "experience_history": c.experience_history or [],
-                    "social_links": c.social_links or {},
-                    "created_at": c.created_at.isoformat() if c.created_at else None,
-                    "updated_at": c.updated_at.isoformat() if c.updated_at else None,
-                    "resume_file_path": c.resume_file_path,
-                    "parsed_at": c.parsed_at.isoformat() if c.parsed_at else None,
-                    "current_salary": None,  # Always redact for interviewers
-                    "expected_salary": None,  # Always redact for interviewers
-                }
-                results.append(c_dict)
-            except Exception as e:
-                # Skip invalid records but don't crash the whole list
-                continue
-                
-        return results
-
-    # Pass filter to service (which we need to update to support it)
-    # candidates = db.query(Candidate).offset(skip).limit(limit).all()
-    candidates = candidate_service.get_candidates(db, skip=skip, limit=limit, filter_by_owner_id=filter_by_owner_id, filter_by_department_id=filter_by_department_id)
-    
-    # Manually construction response to bypass Pydantic serialization hang
+def read_candidates(
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = Depends(cursor_param),
+    expand: Optional[str] = Query(None, description="Comma-separated extra fields: education, experience_history, social_links"),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    # Rows are selected column by column and serialised directly; no ORM objects or Pydantic models
+    expand_fields = [field.strip() for field in (expand or "").split(",") if field.strip()]
+    unknown = [field for field in expand_fields if field not in EXPANDABLE_LIST_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Cannot expand: {', '.join(unknown)}")
+
+    # Hiring managers see applicants to their departments' jobs, interviewers the candidates they are assigned to
+    rows = candidate_service.get_candidate_list_rows(db, skip=skip, limit=limit, cursor=cursor, expand=expand_fields, visible_to=current_user)
+    # Redact salary for Interviewers
+    redact_salary = current_user.role == UserRole.INTERVIEWER
+    # The items are already JSON-ready, so skip FastAPI's jsonable_encoder pass
+    response = DefaultJSONResponse([_list_item(row, redact_salary) for row in rows])
+    set_next_cursor(response, rows, limit)
+    return response
+
+@router.get("/search", response_model=List[CandidateSearchResult])
+def search_candidates(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    """
+    Ranked search over names, emails, positions, companies, skills and resume
+    text. Supports web-style queries ("react -angular", "\"data engineer\"") and
+    tolerates typos in names and emails. Scoped like GET /candidates/.
+    """
     results = []
-    for c in candidates:
-        try:
-            # Basic fields
-            c_dict = {
-                "id": str(c.id),
-                "first_name": c.first_name,
-                "last_name": c.last_name,
-                "email": c.email,
-                "phone": c.phone,
-                "location": c.location,
-                "current_company": c.current_company,
-                "current_position": c.current_position,
-                "experience_years": c.experience_years,
-                "nationality": c.nationality,
-                "notice_period": c.notice_period,
-                "skills": c.skills or [],
-                "education": c.education or [],
-                "experience_history": c.experience_history or [],
-                "social_links": c.social_links or {},
-                "created_at": c.created_at.isoformat() if c.created_at else None,
-                "updated_at": c.updated_at.isoformat() if c.updated_at else None,
-                "resume_file_path": c.resume_file_path,
-                "parsed_at": c.parsed_at.isoformat() if c.parsed_at else None,
-            }
-            
-            # Redact salary for Interviewers
-            if current_user.role == UserRole.INTERVIEWER:
-                c_dict["current_salary"] = None
-                c_dict["expected_salary"] = None
-            else:
-                c_dict["current_salary"] = c.current_salary
-                c_dict["expected_salary"] = c.expected_salary
-
-            results.append(c_dict)
-        except Exception as e:
-            # Skip invalid records but don't crash the whole list
-            continue
-            
+    for candidate, rank, highlight in candidate_search_service.search(db, q, current_user, skip=skip, limit=limit):
+        basic = CandidateBasicResponse.model_validate(candidate)
+        # Redact salary for Interviewers
+        if current_user.role == UserRole.INTERVIEWER:
+            basic = basic.model_copy(update={"current_salary": None, "expected_salary": None})
+        results.append(CandidateSearchResult(candidate=basic, rank=rank, highlight=highlight))
     return results
 
+@router.get("/duplicates", response_model=List[DuplicatePair], dependencies=[Depends(RoleChecker([UserRole.HR, UserRole.OWNER]))])
+def read_duplicate_candidates(
+    min_score: float = Query(0.6, ge=0, le=1),
+    limit: int = Query(100, ge=1, le=500),
+    db: Session = Depends(get_db)
+):
+    """
+    Likely duplicate candidates (same resume, email, phone or name), best
+    first. Merge them with POST /candidates/{id}/merge.
+    """
+    from app.models.candidate import Candidate
+    pairs = dedupe_service.find_duplicates(db, min_score=min_score, limit=limit)
+    ids = {pair["first_id"] for pair in pairs} | {pair["second_id"] for pair in pairs}
+    candidates = {c.id: c for c in db.query(Candidate).filter(Candidate.id.in_(ids)).all()} if ids else {}
+    return [
+        DuplicatePair(
+            first=CandidateBasicResponse.model_validate(candidates[pair["first_id"]]),
+            second=CandidateBasicResponse.model_validate(candidates[pair["second_id"]]),
+            score=pair["score"],
+            reasons=pair["reasons"],
+        )
+        for pair in pairs
+    ]
+
 @router.post("/", response_model=CandidateResponse, dependencies=[Depends(RoleChecker([UserRole.HR, UserRole.OWNER]))])
 def create_candidate(candidate: CandidateCreate, db: Session = Depends(get_db)):
     return candidate_service.create_candidate(db=db, candidate=candidate)
@@ -134,13 +120,7 @@ def read_candidate(candidate_id: UUID, db: Session = Depends(get_db), current_us
     
     # For interviewers, check if they are assigned to this candidate
     if current_user.role == UserRole.INTERVIEWER:
-        from app.models.scheduled_activity import ScheduledActivity
-        assigned_activity = db.query(ScheduledActivity).join(ScheduledActivity.assignees).filter(
-            ScheduledActivity.candidate_id == candidate_id,
-            User.id == current_user.id
-        ).first()
-        
-        if not assigned_activity:
+        if not access_scope_service.can_see_candidate(db, current_user, candidate_id):
             raise HTTPException(status_code=403, detail="Access denied: Not assigned to this candidate")
     
     # Redact salary for Interviewers
@@ -150,6 +130,52 @@ def read_candidate(candidate_id: UUID, db: Session = Depends(get_db), current_us
 
     return db_candidate
 
+@router.get("/{candidate_id}/similar", response_model=List[SimilarCandidate])
+def read_similar_candidates(
+    candidate_id: UUID,
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(RoleChecker([UserRole.HR, UserRole.OWNER, UserRole.HIRING_MANAGER]))
+):
+    """
+    Candidates whose resume and skills are most like this one ("more like
+    this"), from the local similarity index. Returns 503 until the index has
+    been built (scripts/build_similarity_index.py or the task worker).
+    """
+    from app.models.candidate import Candidate
+    db_candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+    if db_candidate is None:
+        raise HTTPException(status_code=404, detail="Candidate not found")
+
+    # Ask for extra neighbours: some may have been deleted or be outside the user's scope
+    matches = similarity_index_service.similar(db, db_candidate, limit=limit * 3)
+    if matches is None:
+        raise HTTPException(status_code=503, detail="Similarity index has not been built yet")
+    if not matches:
+        return []
+
+    query = db.query(Candidate).filter(Candidate.id.in_([match_id for match_id, _ in matches]))
+    visible = {c.id: c for c in candidate_search_service.apply_visibility(query, current_user).all()}
+    return [
+        SimilarCandidate(candidate=CandidateBasicResponse.model_validate(visible[match_id]), similarity=similarity)
+        for match_id, similarity in matches
+        if match_id in visible
+    ][:limit]
+
+@router.post("/{candidate_id}/merge", response_model=CandidateMergeResponse, dependencies=[Depends(RoleChecker([UserRole.HR, UserRole.OWNER]))])
+def merge_candidates(candidate_id: UUID, body: CandidateMergeRequest, db: Session = Depends(get_db)):
+    """
+    Merge duplicate candidates into this one. Their applications, activities and
+    feedback move over, missing profile details are filled in, and the
+    duplicates are deleted, all in one transaction.
+    """
+    try:
+        return dedupe_service.merge(db, candidate_id, body.duplicate_ids)
+    except LookupError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
 @router.put("/{candidate_id}", response_model=CandidateResponse, dependencies=[Depends(RoleChecker([UserRole.HR, UserRole.OWNER, UserRole.HIRING_MANAGER]))])
 def update_candidate(candidate_id: UUID, candidate: CandidateUpdate, db: Session = Depends(get_db)):
     db_candidate = candidate_service.update_candidate(db, candidate_id, candidate)
@@ -171,38 +197,49 @@ def remove_job_application(candidate_id: UUID, job_id: UUID, db: Session = Depen
         raise HTTPException(status_code=404, detail="Job application not found")
     return
 
-from app.services.parser_service import parser_service
+from fastapi.responses import JSONResponse
+from app.schemas.task import TaskResponse
+from app.services.resume_store import resume_store
+from app.services.task_queue import task_queue
 
 @router.post("/upload")
 async def upload_resume(
     file: UploadFile = File(...), 
     job_id: Optional[UUID] = Form(None),
+    background: bool = Form(False),
     db: Session = Depends(get_db),
-    _: User = Depends(RoleChecker([UserRole.HR, UserRole.OWNER]))
+    current_user: User = Depends(RoleChecker([UserRole.HR, UserRole.OWNER]))
 ):
-    # 1. Read file content
-    content = await file.read()
+    # 1. Stream the file into the resume store, hashing it as it is written
+    resume_hash, file_location, size = await resume_store.save_upload(file)
+    document = resume_store.register(db, resume_hash, file_location, file.filename, size)
     
-    # 2. Extract text based on file type
-    text = ""
-    if file.filename.lower().endswith(".pdf"):
-        text = parser_service.extract_text_from_pdf(content)
-    elif file.filename.lower().endswith(".docx"):
-        text = parser_service.extract_text_from_docx(content)
-        
-    # 3. Parse with LLM
-    parsed_data = None
-    if text:
-        print(f"\n[DEBUG] Extracted Text Preview:\n{text[:200]}...\n")
-        parsed_data = parser_service.parse_with_llm(text)
-        
-        if parsed_data:
-            print(f"\n[DEBUG] Parsed Data from LLM:\n{parsed_data.model_dump_json(indent=2)}\n")
-        else:
-            print("\n[DEBUG] LLM Parsing returned None\n")
-        
-    # 4. Reset file cursor for saving
-    await file.seek(0)
+    # 2. Hand extraction and LLM parsing to the task worker if asked to
+    if background:
+        task = task_queue.enqueue(
+            db, "resume_upload",
+            {"resume_hash": resume_hash, "job_id": str(job_id) if job_id else None},
+            created_by=current_user.id,
+        )
+        return JSONResponse(status_code=202, content=TaskResponse.model_validate(task).model_dump(mode="json"))
     
-    # 5. Save and Create Candidate
-    return candidate_service.upload_resume(db, file, job_id, parsed_data)
+    # 3. Extract, parse and create or update the candidate
+    return candidate_service.process_stored_resume(db, document, job_id)
+
+from app.services.batch_upload_service import batch_upload_service
+
+@router.post("/upload/batch", response_model=BatchUploadResponse)
+async def upload_resumes_batch(
+    files: List[UploadFile] = File(...),
+    job_id: Optional[UUID] = Form(None),
+    db: Session = Depends(get_db),
+    _: User = Depends(RoleChecker([UserRole.HR, UserRole.OWNER]))
+):
+    """
+    Bulk resume intake. Accepts many PDF/DOCX files and/or .zip archives of them.
+    Extraction runs on a process pool and LLM parsing with bounded concurrency.
+    """
+    try:
+        return await batch_upload_service.ingest(db, files, job_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,16 +1,20 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, desc, or_
-from typing import List, Dict, Any
+from sqlalchemy import func, desc, or_, select
+from typing import List, Dict, Any, Optional
 from datetime import datetime, timedelta
 from uuid import UUID
 
 from app.database import get_db
 from app.models.user import User, UserRole
-from app.models.job import Job, JobStatus
-from app.models.candidate import Candidate, JobApplication
+from app.models.job import Job
+from app.models.candidate import Candidate
+from app.models.access_scope import UserVisibleJob
 from app.models.scheduled_activity import ScheduledActivity
 from app.routers.auth import get_current_active_user
+from app.services.access_scope import access_scope_service
+from app.services.dashboard_service import dashboard_service
+from app.services.funnel_service import funnel_service
 
 router = APIRouter(
     prefix="/dashboard",
@@ -27,51 +31,8 @@ def get_dashboard_overview(db: Session = Depends(get_db), current_user: User = D
             detail="Not authorized to access dashboard"
         )
     
-    # Time periods for calculations
-    now = datetime.utcnow()
-    thirty_days_ago = now - timedelta(days=30)
-    seven_days_ago = now - timedelta(days=7)
-    
-    # Basic counts
-    total_jobs = db.query(Job).filter(Job.is_deleted == False).count()
-    total_candidates = db.query(Candidate).count()
-    total_users = db.query(User).filter(User.is_deleted == False).count()
-    
-    # Recent counts (last 30 days)
-    recent_jobs = db.query(Job).filter(
-        Job.created_at >= thirty_days_ago,
-        Job.is_deleted == False
-    ).count()
-    
-    recent_candidates = db.query(Candidate).filter(
-        Candidate.created_at >= thirty_days_ago
-    ).count()
-    
-    # Active jobs count
-    active_jobs = db.query(Job).filter(
-        Job.status == JobStatus.PUBLISHED.value,
-        Job.is_deleted == False
-    ).count()
-    
-    # Hires in last 30 days
-    hires_count = db.query(JobApplication).filter(
-        JobApplication.application_status == "Hired",
-        JobApplication.applied_at >= thirty_days_ago
-    ).count()
-    
-    return {
-        "total_jobs": total_jobs,
-        "total_candidates": total_candidates,
-        "total_users": total_users,
-        "active_jobs": active_jobs,
-        "recent_jobs": recent_jobs,
-        "recent_candidates": recent_candidates,
-        "hires_count": hires_count,
-        "recent_growth": {
-            "jobs_growth": ((recent_jobs / max(total_jobs - recent_jobs, 1)) * 100) if total_jobs > 0 else 0,
-            "candidates_growth": ((recent_candidates / max(total_candidates - recent_candidates, 1)) * 100) if total_candidates > 0 else 0
-        }
-    }
+    # One aggregate query, cached for a short while and shared by all workers
+    return dashboard_service.get_overview(db)
 
 @router.get("/recent-activities")
 def get_recent_activities(db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
@@ -354,3 +315,38 @@ def get_my_performance(db: Session = Depends(get_db), current_user: User = Depen
         })
         
     return metrics
+
+
+@router.get("/funnel")
+def get_hiring_funnel(
+    job_id: Optional[UUID] = None,
+    department_id: Optional[UUID] = None,
+    days: int = Query(90, ge=1, le=730),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+):
+    """
+    Conversion funnel for a job, a department or every job: applications
+    first entering each stage over the last `days`, stage-to-stage conversion,
+    drop-off and median days to hire. Served from the funnel rollups.
+    """
+    if current_user.role not in [UserRole.OWNER, UserRole.HR, UserRole.HIRING_MANAGER]:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to access dashboard")
+
+    if job_id:
+        if db.query(Job.id).filter(Job.id == job_id).first() is None:
+            raise HTTPException(status_code=404, detail="Job not found")
+        if not access_scope_service.can_see_job(db, current_user, job_id):
+            raise HTTPException(status_code=403, detail="Access denied")
+        job_ids = [job_id]
+    else:
+        job_ids = None
+        if department_id:
+            job_ids = select(Job.id).where(Job.department_id == department_id)
+        if current_user.role == UserRole.HIRING_MANAGER:
+            # Hiring managers only see the jobs in their scope
+            visible = select(UserVisibleJob.job_id).where(UserVisibleJob.user_id == current_user.id)
+            job_ids = visible if job_ids is None else job_ids.where(Job.id.in_(visible))
+
+    funnel = funnel_service.funnel(db, job_ids=job_ids, days=days)
+    return {"job_id": job_id, "department_id": department_id, **funnel}
@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session, joinedload
 from sqlalchemy import exc
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 import logging
 
@@ -11,6 +11,7 @@ from app.models.scheduled_activity import ScheduledActivity, ActivityStatus
 from app.models.user import User
 from app.schemas.feedback import FeedbackCreate, FeedbackResponse, FeedbackUpdate
 from app.routers.auth import get_current_active_user
+from app.utils.pagination import cursor_param, keyset, set_next_cursor
 
 logger = logging.getLogger(__name__)
 
@@ -78,12 +79,22 @@ def create_feedback(feedback: FeedbackCreate, db: Session = Depends(get_db), cur
         raise HTTPException(status_code=500, detail=f"Failed to submit feedback: {str(e)}")
 
 @router.get("/candidate/{candidate_id}", response_model=List[FeedbackResponse])
-def get_candidate_feedbacks(candidate_id: UUID, db: Session = Depends(get_db)):
+def get_candidate_feedbacks(
+    candidate_id: UUID,
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = Depends(cursor_param),
+    db: Session = Depends(get_db)
+):
     # Permission check or rely on generic role-based filters in candidates?
-    feedbacks = db.query(Feedback).options(
+    query = db.query(Feedback).options(
         joinedload(Feedback.interviewer),
         joinedload(Feedback.activity)
-    ).filter(Feedback.candidate_id == candidate_id).all()
+    ).filter(Feedback.candidate_id == candidate_id)
+    if not limit:
+        return query.all()
+    feedbacks = keyset(query, Feedback, cursor).limit(limit).all()
+    set_next_cursor(response, feedbacks, limit)
     return feedbacks
 
 @router.get("/{feedback_id}", response_model=FeedbackResponse)
@@ -1,6 +1,6 @@
 from typing import List, Optional
 from uuid import UUID
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from app.database import get_db
 from app.models.pipeline_stage import PipelineStage
@@ -8,6 +8,9 @@ from app.models.pipeline_template import PipelineTemplate
 from app.models.user import User, UserRole
 from app.routers.auth import get_current_active_user
 from app.schemas.pipeline import PipelineStageCreate, PipelineStageUpdate, PipelineStageResponse, PipelineTemplateCreate, PipelineTemplateResponse
+from app.services.version_service import version_service
+from app.utils.conditional import make_etag, not_modified, set_validators
+from app.utils.serialization import model_list_response
 
 router = APIRouter(
     prefix="/pipeline",
@@ -18,8 +21,14 @@ router = APIRouter(
 # --- Templates ---
 
 @router.get("/templates", response_model=List[PipelineTemplateResponse])
-def get_pipeline_templates(db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    return db.query(PipelineTemplate).all()
+def get_pipeline_templates(request: Request, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    etag = make_etag(version_service.pipeline_templates(db).digest)
+    cached = not_modified(request, etag)
+    if cached:
+        return cached
+    response = model_list_response(PipelineTemplateResponse, db.query(PipelineTemplate).all())
+    set_validators(response, etag)
+    return response
 
 @router.post("/templates", response_model=PipelineTemplateResponse, status_code=status.HTTP_201_CREATED)
 def create_pipeline_template(template: PipelineTemplateCreate, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
@@ -1,7 +1,7 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 from sqlalchemy import or_
-from typing import List
+from typing import List, Optional
 from uuid import UUID
 
 from app.database import get_db
@@ -18,6 +18,7 @@ from app.schemas.requisition import (
 )
 from app.routers.auth import get_current_active_user
 from app.dependencies import RoleChecker
+from app.utils.pagination import cursor_param, keyset, set_next_cursor
 
 router = APIRouter(
     prefix="/requisitions",
@@ -53,17 +54,26 @@ def create_requisition(req_in: JobRequisitionCreate, db: Session = Depends(get_d
     return new_req
 
 @router.get("/", response_model=List[JobRequisitionResponse])
-def get_requisitions(db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
-    if current_user.role in [UserRole.OWNER, UserRole.HR]:
-        reqs = db.query(JobRequisition).order_by(JobRequisition.created_at.desc()).all()
-    else:
+def get_requisitions(
+    response: Response,
+    limit: Optional[int] = Query(None, ge=1, le=500),
+    cursor: Optional[str] = Depends(cursor_param),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user)
+):
+    query = db.query(JobRequisition)
+    if current_user.role not in [UserRole.OWNER, UserRole.HR]:
         # Dept Head only sees reqs in their explicit managed department or created by themselves
-        reqs = db.query(JobRequisition).filter(
+        query = query.filter(
             or_(
                 JobRequisition.department_id == current_user.department_id,
                 JobRequisition.hiring_manager_id == current_user.id
             )
-        ).order_by(JobRequisition.created_at.desc()).all()
+        )
+    if not limit:
+        return query.order_by(JobRequisition.created_at.desc()).all()
+    reqs = keyset(query, JobRequisition, cursor).limit(limit).all()
+    set_next_cursor(response, reqs, limit)
     return reqs
 
 @router.get("/{req_id}", response_model=JobRequisitionDetailResponse)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from sqlalchemy.orm import Session
 from typing import List
 from uuid import UUID
@@ -8,16 +8,28 @@ from app.models.user import User, UserRole
 from app.models.scorecard_template import ScorecardTemplate
 from app.schemas.scorecard import ScorecardTemplateCreate, ScorecardTemplateUpdate, ScorecardTemplateResponse
 from app.routers.auth import get_current_active_user
+from app.services.version_service import version_service
+from app.utils.conditional import make_etag, not_modified, set_validators
+from app.utils.serialization import model_list_response
 
 router = APIRouter(prefix="/scorecards", tags=["Scorecard Templates"])
 
 
 @router.get("/", response_model=List[ScorecardTemplateResponse])
 def list_scorecard_templates(
+    request: Request,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user)
 ):
-    return db.query(ScorecardTemplate).order_by(ScorecardTemplate.is_default.desc(), ScorecardTemplate.name).all()
+    version = version_service.scorecard_templates(db)
+    etag = make_etag(version.digest)
+    cached = not_modified(request, etag, version.last_modified)
+    if cached:
+        return cached
+    templates = db.query(ScorecardTemplate).order_by(ScorecardTemplate.is_default.desc(), ScorecardTemplate.name).all()
+    response = model_list_response(ScorecardTemplateResponse, templates)
+    set_validators(response, etag, version.last_modified)
+    return response
 
 
 @router.post("/", response_model=ScorecardTemplateResponse, status_code=status.HTTP_201_CREATED)
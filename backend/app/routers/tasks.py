@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.orm import Session
+from uuid import UUID
+
+from app.database import get_db
+from app.models.user import User, UserRole
+from app.schemas.task import TaskResponse
+from app.services.task_queue import task_queue
+from app.routers.auth import get_current_active_user
+
+router = APIRouter(
+    prefix="/tasks",
+    tags=["tasks"],
+    responses={404: {"description": "Not found"}},
+)
+
+@router.get("/{task_id}", response_model=TaskResponse)
+def read_task(task_id: UUID, db: Session = Depends(get_db), current_user: User = Depends(get_current_active_user)):
+    """Status, progress and result of a background task. Users only see their own tasks; admins see all."""
+    task = task_queue.get(db, task_id)
+    if task is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+    if current_user.role not in [UserRole.OWNER, UserRole.HR] and task.created_by != current_user.id:
+        raise HTTPException(status_code=404, detail="Task not found")
+    return task
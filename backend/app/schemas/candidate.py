@@ -1,7 +1,8 @@
-from pydantic import BaseModel, EmailStr
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, EmailStr, Field
+from typing import List, Literal, Optional, Dict, Any
 from uuid import UUID
 from datetime import datetime
+from app.models.candidate import ApplicationStatus
 
 # --- Shared Base Models ---
 
@@ -66,6 +67,7 @@ class CandidateUpdate(BaseModel):
 
 class CandidateResponse(CandidateBase):
     id: UUID
+    email: str  # validated on the way in; EmailStr would re-check every row on the way out
     resume_file_path: Optional[str] = None
     parsed_at: Optional[datetime] = None
     created_at: datetime
@@ -80,6 +82,7 @@ class CandidateResponse(CandidateBase):
 # Simplified candidate response without applications (to prevent circular reference)
 class CandidateBasicResponse(CandidateBase):
     id: UUID
+    email: str  # validated on the way in; EmailStr would re-check every row on the way out
     resume_file_path: Optional[str] = None
     parsed_at: Optional[datetime] = None
     created_at: datetime
@@ -126,6 +129,7 @@ class JobApplicationResponse(JobApplicationBase):
     # AI Screening
     ai_score: Optional[float] = None
     ai_analysis: Optional[Dict[str, Any]] = None
+    prescreen_score: Optional[float] = None
     
     # Include nested candidate data for frontend (without applications to prevent circular ref)
     candidate: Optional[CandidateBasicResponse] = None
@@ -134,5 +138,112 @@ class JobApplicationResponse(JobApplicationBase):
     class Config:
         from_attributes = True
 
+class PrescreenResult(BaseModel):
+    application_id: UUID
+    candidate_id: UUID
+    prescreen_score: float
+
+class CandidateSearchResult(BaseModel):
+    candidate: CandidateBasicResponse
+    rank: float
+    highlight: Optional[str] = None  # Resume excerpt with matches wrapped in <mark></mark>
+
+class SimilarCandidate(BaseModel):
+    candidate: CandidateBasicResponse
+    similarity: float  # Cosine similarity of resume/skills vectors, 0-1
+
+class DuplicatePair(BaseModel):
+    first: CandidateBasicResponse
+    second: CandidateBasicResponse
+    score: float  # 0-1 likelihood that both records are the same person
+    reasons: List[str]
+
+class CandidateMergeRequest(BaseModel):
+    duplicate_ids: List[UUID]
+
+class CandidateMergeResponse(BaseModel):
+    candidate_id: UUID
+    merged_ids: List[UUID]
+    applications_moved: int
+    applications_combined: int  # Same job on both records; the survivor's application was kept
+    activities_moved: int
+    feedbacks_moved: int
+
+class SkillMatchResult(BaseModel):
+    candidate: CandidateBasicResponse
+    score: float  # 0-100, share of the job's (rarity-weighted) skills the candidate has
+    matched_skills: List[str]
+    missing_skills: List[str]
+    applied: bool
+
+# --- Bulk Application Schemas ---
+
+class BulkApplicationRequest(BaseModel):
+    candidate_ids: List[UUID] = Field(..., min_length=1, max_length=1000)
+    operation: Literal["move_stage", "set_status", "remove", "rescore"]
+    stage: Optional[str] = None  # move_stage
+    status: Optional[ApplicationStatus] = None  # set_status
+
+class BulkApplicationItem(BaseModel):
+    candidate_id: UUID
+    status: str  # updated, removed, not_found
+    current_stage: Optional[str] = None
+    application_status: Optional[str] = None
+    prescreen_score: Optional[float] = None
+    error: Optional[str] = None
+
+class BulkApplicationResponse(BaseModel):
+    operation: str
+    total: int
+    succeeded: int
+    failed: int
+    items: List[BulkApplicationItem] = []
+
+# --- Pipeline Board Schemas ---
+
+class BoardCard(BaseModel):
+    id: UUID  # application id
+    candidate_id: UUID
+    first_name: str
+    last_name: str
+    email: str
+    current_position: Optional[str] = None
+    current_company: Optional[str] = None
+    current_stage: Optional[str] = None
+    application_status: Optional[str] = None
+    applied_at: Optional[datetime] = None
+    overall_score: Optional[float] = None
+    ai_score: Optional[float] = None
+    prescreen_score: Optional[float] = None
+
+    class Config:
+        from_attributes = True
+
+class BoardStage(BaseModel):
+    id: Optional[str] = None
+    name: Optional[str] = None
+    count: int
+    cards: List[BoardCard]
+    next_cursor: Optional[str] = None  # pass back with ?stage=<id>&cursor=... for the next cards of this stage
+
+class PipelineBoardResponse(BaseModel):
+    job_id: UUID
+    total: int
+    stages: List[BoardStage]
+
+# --- Batch Upload Schemas ---
+
+class BatchUploadItem(BaseModel):
+    filename: str
+    status: str  # parsed, stub, failed
+    candidate_id: Optional[UUID] = None
+    error: Optional[str] = None
+
+class BatchUploadResponse(BaseModel):
+    total: int
+    succeeded: int
+    failed: int
+    items: List[BatchUploadItem] = []
+
 # Update forward reference
 CandidateResponse.model_rebuild()
@@ -28,6 +28,7 @@ class DepartmentSummary(BaseModel):
 
 class UserResponse(UserBase):
     id: UUID
+    email: str  # validated on the way in; EmailStr would re-check every row on the way out
     managed_departments: List[DepartmentSummary] = []
     google_access_token: Optional[str] = None
 
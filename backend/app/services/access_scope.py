@@ -0,0 +1,190 @@
+from itertools import chain
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, event, exists, inspect, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.access_scope import UserVisibleCandidate, UserVisibleJob
+from app.models.candidate import Candidate, JobApplication
+from app.models.department import Department
+from app.models.job import Job
+from app.models.scheduled_activity import ScheduledActivity, activity_assignees
+from app.models.user import User, UserRole
+
+# Roles whose visibility is restricted; everyone else sees every candidate and job
+SCOPED_ROLES = (UserRole.HIRING_MANAGER, UserRole.INTERVIEWER)
+
+_candidates = UserVisibleCandidate.__table__
+_jobs = UserVisibleJob.__table__
+
+
+def _restrict(query, user_column, user_ids, key_column, keys):
+    if user_ids is not None:
+        query = query.where(user_column.in_(user_ids))
+    if keys is not None:
+        query = query.where(key_column.in_(keys))
+    return query
+
+
+def _candidate_rules(user_ids, candidate_ids):
+    """(user_id, candidate_id) pairs: hiring managers see applicants to jobs in departments they own,
+    interviewers see candidates of activities they are assigned to."""
+    owned = (
+        select(Department.owner_id, JobApplication.candidate_id)
+        .join(Job, Job.department_id == Department.id)
+        .join(JobApplication, JobApplication.job_id == Job.id)
+        .join(User, User.id == Department.owner_id)
+        .where(User.role == UserRole.HIRING_MANAGER)
+    )
+    assigned = (
+        select(activity_assignees.c.user_id, ScheduledActivity.candidate_id)
+        .join(ScheduledActivity, ScheduledActivity.id == activity_assignees.c.activity_id)
+        .join(User, User.id == activity_assignees.c.user_id)
+        .where(User.role == UserRole.INTERVIEWER, ScheduledActivity.candidate_id.isnot(None))
+    )
+    return [
+        _restrict(owned, Department.owner_id, user_ids, JobApplication.candidate_id, candidate_ids),
+        _restrict(assigned, activity_assignees.c.user_id, user_ids, ScheduledActivity.candidate_id, candidate_ids),
+    ]
+
+
+def _job_rules(user_ids, job_ids):
+    """(user_id, job_id) pairs: jobs in departments a hiring manager owns, jobs of an interviewer's activities."""
+    owned = (
+        select(Department.owner_id, Job.id)
+        .join(Job, Job.department_id == Department.id)
+        .join(User, User.id == Department.owner_id)
+        .where(User.role == UserRole.HIRING_MANAGER)
+    )
+    assigned = (
+        select(activity_assignees.c.user_id, ScheduledActivity.job_id)
+        .join(ScheduledActivity, ScheduledActivity.id == activity_assignees.c.activity_id)
+        .join(User, User.id == activity_assignees.c.user_id)
+        .where(User.role == UserRole.INTERVIEWER, ScheduledActivity.job_id.isnot(None))
+    )
+    return [
+        _restrict(owned, Department.owner_id, user_ids, Job.id, job_ids),
+        _restrict(assigned, activity_assignees.c.user_id, user_ids, ScheduledActivity.job_id, job_ids),
+    ]
+
+
+class AccessScopeService:
+    """
+    Maintains user_visible_candidates / user_visible_jobs, the precomputed
+    visibility of hiring managers and interviewers, and applies it to queries
+    as a single indexed join.
+
+    Rows are refreshed in the writer's transaction. ORM writes that can change
+    visibility (activities and their assignees, applications, a job's
+    department, a department's owner, a user's role) are picked up by the
+    after_flush hook below; code that changes those with bulk UPDATEs or core
+    INSERTs calls refresh_candidates / refresh_jobs itself.
+    """
+
+    def _refresh(self, db_or_connection, table, key, rules, user_ids, keys):
+        if (user_ids is not None and not user_ids) or (isinstance(keys, (list, set, tuple)) and not keys):
+            return
+        user_ids = list(user_ids) if user_ids is not None else None
+        keys = list(keys) if isinstance(keys, (set, tuple)) else keys
+        db_or_connection.execute(_restrict(table.delete(), table.c.user_id, user_ids, table.c[key], keys))
+        for rule in rules(user_ids, keys):
+            db_or_connection.execute(insert(table).from_select(["user_id", key], rule).on_conflict_do_nothing())
+
+    def refresh_candidates(self, db, user_ids: Optional[Iterable[UUID]] = None, candidate_ids=None):
+        """Recomputes candidate visibility, limited to the given users and/or candidates (None: all)."""
+        self._refresh(db, _candidates, "candidate_id", _candidate_rules, user_ids, candidate_ids)
+
+    def refresh_jobs(self, db, user_ids: Optional[Iterable[UUID]] = None, job_ids=None):
+        """Recomputes job visibility, limited to the given users and/or jobs (None: all)."""
+        self._refresh(db, _jobs, "job_id", _job_rules, user_ids, job_ids)
+
+    def refresh_users(self, db, user_ids: Iterable[UUID]):
+        user_ids = list(user_ids)
+        self.refresh_candidates(db, user_ids=user_ids)
+        self.refresh_jobs(db, user_ids=user_ids)
+
+    def rebuild(self, db):
+        self.refresh_candidates(db)
+        self.refresh_jobs(db)
+
+    # --- Reading ---
+
+    def scope_candidates(self, query, user: User, candidate_column=Candidate.id):
+        """Restricts a query to the candidates `user` may see (no-op for unrestricted roles)."""
+        if user.role not in SCOPED_ROLES:
+            return query
+        return query.join(UserVisibleCandidate, and_(
+            UserVisibleCandidate.candidate_id == candidate_column,
+            UserVisibleCandidate.user_id == user.id,
+        ))
+
+    def scope_jobs(self, query, user: User):
+        if user.role not in SCOPED_ROLES:
+            return query
+        return query.join(UserVisibleJob, and_(UserVisibleJob.job_id == Job.id, UserVisibleJob.user_id == user.id))
+
+    def can_see_candidate(self, db: Session, user: User, candidate_id: UUID) -> bool:
+        if user.role not in SCOPED_ROLES:
+            return True
+        return db.query(exists().where(
+            UserVisibleCandidate.user_id == user.id, UserVisibleCandidate.candidate_id == candidate_id
+        )).scalar()
+
+    def can_see_job(self, db: Session, user: User, job_id: UUID) -> bool:
+        if user.role not in SCOPED_ROLES:
+            return True
+        return db.query(exists().where(UserVisibleJob.user_id == user.id, UserVisibleJob.job_id == job_id)).scalar()
+
+
+access_scope_service = AccessScopeService()
+
+
+def _changed(obj, *attributes) -> bool:
+    state = inspect(obj)
+    return any(state.attrs[attribute].history.has_changes() for attribute in attributes)
+
+
+def _values(obj, attribute) -> set:
+    """Old and new values of an attribute, without loading anything."""
+    history = inspect(obj).attrs[attribute].history
+    return {value for value in chain(history.added or (), history.unchanged or (), history.deleted or ()) if value is not None}
+
+
+@event.listens_for(Session, "after_flush")
+def _refresh_access_scope(session, flush_context):
+    candidate_ids, job_ids, moved_job_ids, user_ids = set(), set(), set(), set()
+    for obj in chain(session.new, session.dirty, session.deleted):
+        dirty = obj in session.dirty
+        if isinstance(obj, ScheduledActivity):
+            if not dirty or _changed(obj, "candidate_id", "job_id", "assignees"):
+                candidate_ids |= _values(obj, "candidate_id")
+                job_ids |= _values(obj, "job_id")
+        elif isinstance(obj, JobApplication):
+            if not dirty or _changed(obj, "candidate_id", "job_id"):
+                candidate_ids |= _values(obj, "candidate_id")
+        elif isinstance(obj, Job):
+            if dirty and _changed(obj, "department_id"):
+                job_ids |= _values(obj, "id")
+                moved_job_ids |= _values(obj, "id")
+            elif not dirty:
+                job_ids |= _values(obj, "id")
+        elif isinstance(obj, Department):
+            if not dirty or _changed(obj, "owner_id"):
+                user_ids |= _values(obj, "owner_id")
+        elif isinstance(obj, User):
+            if dirty and _changed(obj, "role"):
+                user_ids |= _values(obj, "id")
+
+    if not (candidate_ids or job_ids or user_ids):
+        return
+    connection = session.connection()
+    if moved_job_ids:
+        # Applicants follow their job into its new department
+        candidate_ids |= set(connection.execute(
+            select(JobApplication.candidate_id).where(JobApplication.job_id.in_(moved_job_ids))
+        ).scalars())
+    access_scope_service.refresh_candidates(connection, candidate_ids=candidate_ids)
+    access_scope_service.refresh_jobs(connection, job_ids=job_ids)
+    access_scope_service.refresh_users(connection, user_ids)
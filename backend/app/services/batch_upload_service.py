@@ -0,0 +1,212 @@
+import asyncio
+import logging
+import os
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, List, Optional, Tuple
+from uuid import UUID
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from sqlalchemy.orm import Session
+
+from app.models.resume_document import ResumeDocument
+from app.services.candidate_service import candidate_service
+from app.services.parser_service import ExtractedText, parser_service, extract_text_in_worker
+from app.services.resume_store import resume_store
+
+logger = logging.getLogger(__name__)
+
+SUPPORTED_EXTENSIONS = (".pdf", ".docx")
+
+# Tunables for bulk intake (job fairs, agency dumps, ...)
+EXTRACT_WORKERS = int(os.getenv("RESUME_EXTRACT_WORKERS", str(os.cpu_count() or 2)))
+LLM_CONCURRENCY = int(os.getenv("RESUME_LLM_CONCURRENCY", "4"))
+MAX_BATCH_FILES = int(os.getenv("RESUME_BATCH_MAX_FILES", "500"))
+MAX_FILE_BYTES = int(os.getenv("RESUME_MAX_FILE_BYTES", str(20 * 1024 * 1024)))
+
+
+class BatchUploadService:
+    def __init__(self):
+        # The pool is created lazily so importing the app never forks workers
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=max(EXTRACT_WORKERS, 1))
+        return self._pool
+
+    def is_supported(self, filename: str) -> bool:
+        return (filename or "").lower().endswith(SUPPORTED_EXTENSIONS)
+
+    def _entry(self, filename: str, error: Optional[str] = None) -> dict:
+        return {"filename": filename, "sha256": None, "path": None, "size": 0, "error": error}
+
+    def _store(self, entry: dict, stored: Tuple[str, str, int]):
+        entry["sha256"], entry["path"], entry["size"] = stored
+        if not entry["size"]:
+            entry["error"] = "File is empty or too large"
+
+    def _members(self, archive: zipfile.ZipFile) -> List[zipfile.ZipInfo]:
+        return [
+            info for info in archive.infolist()
+            if not info.is_dir() and os.path.basename(info.filename) and not info.filename.startswith("__MACOSX/")
+        ]
+
+    def _check_batch_size(self, count: int):
+        if count > MAX_BATCH_FILES:
+            raise ValueError(f"Batch exceeds the limit of {MAX_BATCH_FILES} files")
+
+    def _stage_archive(self, filename: str, fileobj: BinaryIO, staged: int = 0) -> List[dict]:
+        """
+        Streams each resume inside a .zip straight into the store, member by
+        member. The member count is checked against MAX_BATCH_FILES (with
+        `staged` files already in the batch) before anything is written.
+        """
+        entries = []
+        try:
+            with zipfile.ZipFile(fileobj) as archive:
+                members = self._members(archive)
+                self._check_batch_size(staged + len(members))
+                for info in members:
+                    member_name = os.path.basename(info.filename)
+                    entry = self._entry(member_name)
+                    entries.append(entry)
+                    if not self.is_supported(member_name):
+                        entry["error"] = "Unsupported file type"
+                    elif info.file_size > MAX_FILE_BYTES:
+                        entry["error"] = "File is empty or too large"
+                    else:
+                        try:
+                            with archive.open(info) as member:
+                                self._store(entry, resume_store.save_fileobj(member, member_name, MAX_FILE_BYTES))
+                        except ValueError:
+                            # The header understated the size; only this member is rejected
+                            entry["error"] = "File is empty or too large"
+        except zipfile.BadZipFile:
+            logger.warning(f"Skipping corrupt archive {filename}")
+            entries.append(self._entry(filename, "Corrupt archive"))
+        return entries
+
+    async def stage(self, files: List[UploadFile]) -> List[dict]:
+        """
+        Writes every uploaded resume (and every resume inside uploaded .zip
+        archives) into the resume store, so nothing is held in memory beyond a
+        single chunk. Returns one entry per resume with its hash and stored path.
+        Raises ValueError, before writing the file that would cross it, when the
+        batch holds more than MAX_BATCH_FILES resumes.
+        """
+        entries = []
+        for upload in files:
+            filename = upload.filename or ""
+            if filename.lower().endswith(".zip"):
+                entries.extend(await run_in_threadpool(self._stage_archive, filename, upload.file, len(entries)))
+                continue
+            self._check_batch_size(len(entries) + 1)
+            if not self.is_supported(filename):
+                entries.append(self._entry(filename, "Unsupported file type"))
+            else:
+                entry = self._entry(filename)
+                entries.append(entry)
+                try:
+                    self._store(entry, await resume_store.save_upload(upload, MAX_FILE_BYTES))
+                except ValueError:
+                    entry["error"] = "File is empty or too large"
+        return entries
+
+    async def _extract(self, filename: str, path: str) -> ExtractedText:
+        """Runs PDF/DOCX extraction on the process pool; workers open the stored file by path."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_pool(), extract_text_in_worker, filename, path)
+
+    async def _parse(self, text: str, semaphore: asyncio.Semaphore):
+        async with semaphore:
+            return await parser_service.aparse_with_llm(text)
+
+    async def _prepare(self, filename: str, document: ResumeDocument, semaphore: asyncio.Semaphore, progress: dict) -> dict:
+        item = {"parsed_data": None, "extracted": None, "error": None}
+        try:
+            if document.extracted_text is not None:
+                extracted = ExtractedText(document.extracted_text, document.page_count)
+            else:
+                extracted = await self._extract(filename, document.file_path)
+                item["extracted"] = extracted
+            if extracted.text:
+                item["parsed_data"] = await self._parse(extracted.text, semaphore)
+        except Exception as e:
+            logger.error(f"Failed to process {filename}: {e}")
+            item["error"] = "Text extraction failed"
+        progress["done"] += 1
+        logger.info(f"Batch upload: prepared {progress['done']}/{progress['total']} ({filename})")
+        return item
+
+    async def ingest(self, db: Session, files: List[UploadFile], job_id: Optional[UUID] = None) -> dict:
+        """
+        Stores, extracts and parses a batch of resumes, then saves the candidates
+        one by one. Files already in the resume store reuse their cached parse
+        result, and duplicates inside the batch are only processed once.
+        Returns a per-file report so the caller can show which resumes failed.
+        """
+        entries = await self.stage(files)
+
+        hashes = {entry["sha256"] for entry in entries if entry["error"] is None}
+        documents = resume_store.get_documents(db, hashes)
+        for entry in entries:
+            sha256 = entry["sha256"]
+            if entry["error"] is None and sha256 not in documents:
+                documents[sha256] = resume_store.register(db, sha256, entry["path"], entry["filename"], entry["size"])
+        # Keep the document rows even if saving an individual candidate fails later on
+        db.commit()
+
+        prepared = {}
+        pending = {}
+        for entry in entries:
+            sha256 = entry["sha256"]
+            if entry["error"] is not None or sha256 in prepared or sha256 in pending:
+                continue
+            cached = resume_store.cached_parse(documents[sha256])
+            if cached is not None:
+                prepared[sha256] = {"parsed_data": cached, "extracted": None, "error": None}
+            else:
+                pending[sha256] = entry["filename"]
+
+        semaphore = asyncio.Semaphore(max(LLM_CONCURRENCY, 1))
+        progress = {"done": 0, "total": len(pending)}
+        outcomes = await asyncio.gather(*[
+            self._prepare(filename, documents[sha256], semaphore, progress)
+            for sha256, filename in pending.items()
+        ])
+        prepared.update(zip(pending.keys(), outcomes))
+
+        # The session is not thread-safe, so persistence stays sequential
+        results = []
+        for entry in entries:
+            filename = entry["filename"]
+            item = prepared.get(entry["sha256"]) if entry["error"] is None else None
+            error = item["error"] if item else entry["error"]
+            result = {"filename": filename, "status": "failed", "candidate_id": None, "error": error}
+            if error is None:
+                try:
+                    # Copy so per-file job linkage never leaks into a shared parse result
+                    parsed_data = item["parsed_data"].model_copy() if item["parsed_data"] else None
+                    document = documents[entry["sha256"]]
+                    candidate = candidate_service.create_from_resume(db, document, job_id, parsed_data, item["extracted"])
+                    result["candidate_id"] = candidate.id
+                    result["status"] = "parsed" if parsed_data else "stub"
+                except Exception as e:
+                    db.rollback()
+                    logger.error(f"Failed to save {filename}: {e}")
+                    result["error"] = "Failed to save candidate"
+            results.append(result)
+
+        total = len(entries)
+        succeeded = sum(1 for r in results if r["status"] != "failed")
+        return {
+            "total": total,
+            "succeeded": succeeded,
+            "failed": total - succeeded,
+            "items": results,
+        }
+
+
+batch_upload_service = BatchUploadService()
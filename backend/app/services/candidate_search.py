@@ -0,0 +1,87 @@
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import bindparam, func, literal_column, or_, text
+from sqlalchemy.dialects.postgresql import ARRAY, UUID as PG_UUID
+from sqlalchemy.orm import Session
+
+from app.models.candidate import Candidate
+from app.models.resume_document import ResumeDocument
+from app.models.user import User
+from app.services.access_scope import access_scope_service
+
+SEARCH_CONFIG = "english"
+
+# Longest slice of resume text that goes into the index (to_tsvector caps out at 1MB)
+RESUME_INDEX_CHARS = 60000
+
+# Weights: A name/email, B role/company/skills, D resume body. Kept in step with the
+# backfill in the c9e4f2a6b8d1 migration.
+_REFRESH_SQL = text(f"""
+    UPDATE candidates c SET search_vector =
+        setweight(to_tsvector('{SEARCH_CONFIG}', concat_ws(' ', c.first_name, c.last_name, c.email)), 'A') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', concat_ws(' ', c.current_position, c.current_company)), 'B') ||
+        setweight(jsonb_to_tsvector('{SEARCH_CONFIG}', coalesce(c.skills, '[]'::jsonb), '["string"]'), 'B') ||
+        setweight(to_tsvector('{SEARCH_CONFIG}', coalesce(
+            (SELECT left(d.extracted_text, {RESUME_INDEX_CHARS}) FROM resume_documents d WHERE d.sha256 = c.resume_hash), ''
+        )), 'D')
+    WHERE c.id = ANY(:ids)
+""").bindparams(bindparam("ids", type_=ARRAY(PG_UUID(as_uuid=True))))
+
+_HEADLINE_OPTIONS = "MaxFragments=2, MaxWords=18, MinWords=6, StartSel=<mark>, StopSel=</mark>"
+
+# Must match the expression of the ix_candidates_full_name_trgm index
+_full_name = Candidate.first_name + literal_column("' '") + Candidate.last_name
+
+
+class CandidateSearchService:
+    """
+    Ranked full-text search over candidates (name, email, position, company,
+    skills and extracted resume text) with trigram matching for misspelt names
+    and emails. Candidates.search_vector is refreshed by the candidate service
+    whenever a candidate is written.
+    """
+
+    def refresh(self, db: Session, candidate_ids: List[UUID]):
+        """Recomputes search_vector for the given candidates in the caller's transaction."""
+        if candidate_ids:
+            db.flush()
+            db.execute(_REFRESH_SQL, {"ids": list(candidate_ids)})
+
+    def apply_visibility(self, query, user: User):
+        """Applies the same visibility rules as GET /candidates/."""
+        return access_scope_service.scope_candidates(query, user)
+
+    def search(self, db: Session, q: str, user: User, skip: int = 0, limit: int = 20) -> List[Tuple[Candidate, float, Optional[str]]]:
+        """Returns (candidate, rank, highlighted resume snippet) for one page of matches, best first."""
+        q = (q or "").strip()
+        if not q:
+            return []
+        tsquery = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+        similarity = func.greatest(func.similarity(_full_name, q), func.similarity(Candidate.email, q))
+        rank = (func.coalesce(func.ts_rank_cd(Candidate.search_vector, tsquery), 0) + similarity).label("rank")
+
+        query = db.query(Candidate, rank).filter(or_(
+            Candidate.search_vector.op("@@")(tsquery),
+            _full_name.op("%")(q),
+            Candidate.email.op("%")(q),
+        ))
+        rows = self.apply_visibility(query, user).order_by(rank.desc(), Candidate.id).offset(skip).limit(limit).all()
+        if not rows:
+            return []
+
+        # Snippets are only built for the page being returned
+        headline_source = func.coalesce(
+            func.left(ResumeDocument.extracted_text, RESUME_INDEX_CHARS),
+            func.concat_ws(" ", Candidate.current_position, Candidate.current_company),
+        )
+        headlines = dict(
+            db.query(Candidate.id, func.ts_headline(SEARCH_CONFIG, headline_source, tsquery, _HEADLINE_OPTIONS))
+            .outerjoin(ResumeDocument, ResumeDocument.sha256 == Candidate.resume_hash)
+            .filter(Candidate.id.in_([candidate.id for candidate, _ in rows]))
+            .all()
+        )
+        return [(candidate, float(score), headlines.get(candidate.id) or None) for candidate, score in rows]
+
+
+candidate_search_service = CandidateSearchService()
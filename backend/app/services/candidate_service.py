@@ -1,10 +1,20 @@
+from sqlalchemy import and_, case, delete, exists, func, select, update
 from sqlalchemy.orm import Session, joinedload, selectinload
-from app.models.candidate import Candidate, JobApplication
+from app.models.candidate import ApplicationStatus, Candidate, JobApplication
+from app.models.resume_document import ResumeDocument
 from app.schemas.candidate import CandidateCreate, CandidateUpdate
+from app.services.resume_store import resume_store
+from app.services.parser_service import ExtractedText, parser_service
+from app.services.skill_index import skill_index_service
+from app.services.candidate_search import candidate_search_service
+from app.services.access_scope import access_scope_service
+from app.services.stage_history import stage_history_service
+from app.models.application_stage_event import StageEventSource
+from app.utils.pagination import keyset
 from uuid import UUID
 import uuid
 import os
-import shutil
+import logging
 from fastapi import UploadFile
 
 def _get_first_stage_id(db: Session, job_id) -> str:
@@ -20,51 +30,97 @@ def _get_first_stage_id(db: Session, job_id) -> str:
         pass
     return "new"
 
+logger = logging.getLogger(__name__)
+
 UPLOAD_DIR = "uploads"
 
+# Columns served by the candidate list; the large JSONB fields are only selected when asked for
+LIST_COLUMNS = (
+    "id", "first_name", "last_name", "email", "phone", "location", "current_company", "current_position",
+    "experience_years", "nationality", "notice_period", "skills", "current_salary", "expected_salary",
+    "resume_file_path", "parsed_at", "created_at", "updated_at",
+)
+EXPANDABLE_LIST_FIELDS = ("education", "experience_history", "social_links")
+
+# Stages that set the application status of the same name
+STATUS_STAGES = ("Rejected", "Hired", "Offer", "Shortlisted")
+BULK_OPERATIONS = ("move_stage", "set_status", "remove", "rescore")
+
+# What a pipeline board card shows; everything else is fetched when the card is opened
+BOARD_CARD_COLUMNS = (
+    JobApplication.id, JobApplication.candidate_id, JobApplication.current_stage, JobApplication.application_status,
+    JobApplication.applied_at, JobApplication.overall_score, JobApplication.ai_score, JobApplication.prescreen_score,
+    Candidate.first_name, Candidate.last_name, Candidate.email, Candidate.current_position, Candidate.current_company,
+)
+
 if not os.path.exists(UPLOAD_DIR):
     os.makedirs(UPLOAD_DIR)
 
 class CandidateService:
+    def _reindex(self, db: Session, candidate: Candidate, skills: bool = True):
+        """Keeps the skill index and search vector in step with the candidate's fields (no commit)."""
+        if skills:
+            skill_index_service.sync_candidate(db, candidate)
+        candidate_search_service.refresh(db, [candidate.id])
+
     def get_candidate(self, db: Session, candidate_id: UUID):
         return db.query(Candidate).options(
             selectinload(Candidate.applications).selectinload(JobApplication.job)
         ).filter(Candidate.id == candidate_id).first()
 
-    def get_candidates(self, db: Session, skip: int = 0, limit: int = 100, filter_by_owner_id: UUID = None, filter_by_department_id: UUID = None):
-        query = db.query(Candidate)
-        
-        joined_job_app = False
-        joined_job = False
-        joined_dept = False
-
-        if filter_by_owner_id or filter_by_department_id:
-             from app.models.department import Department
-             from app.models.job import Job
-             
-             # Link to Jobs via Applications
-             query = query.join(JobApplication)
-             joined_job_app = True
-             
-             query = query.join(Job)
-             joined_job = True
-             
-             if filter_by_owner_id:
-                 query = query.join(Department).filter(
-                     Department.owner_id == filter_by_owner_id
-                 )
-                 joined_dept = True
-                 
-             if filter_by_department_id:
-                 # If we filtered by owner, we have the department table, but filtering on Job.department_id is simpler/direct
-                 query = query.filter(Job.department_id == filter_by_department_id)
-             
-             query = query.distinct()
+    def _filter_by_department(self, query, filter_by_owner_id: UUID = None, filter_by_department_id: UUID = None):
+        """Keeps candidates who applied to a job in a department owned by / equal to the given one."""
+        if not (filter_by_owner_id or filter_by_department_id):
+            return query
+        from app.models.department import Department
+        from app.models.job import Job
+
+        # Semi-join through applications, so a candidate with several matching applications is listed once
+        conditions = [JobApplication.candidate_id == Candidate.id, JobApplication.job_id == Job.id]
+        if filter_by_owner_id:
+            conditions += [Job.department_id == Department.id, Department.owner_id == filter_by_owner_id]
+        if filter_by_department_id:
+            conditions.append(Job.department_id == filter_by_department_id)
+        return query.filter(exists().where(and_(*conditions)))
+
+    def _page(self, query, skip: int, limit: int, cursor: str = None):
+        query = keyset(query, Candidate, cursor)
+        if not cursor:
+            query = query.offset(skip)
+        return query.limit(limit).all()
 
+    def get_candidates(self, db: Session, skip: int = 0, limit: int = 100, filter_by_owner_id: UUID = None, filter_by_department_id: UUID = None, cursor: str = None):
         # Simplified query without loading applications to avoid performance issues
-        return query.offset(skip).limit(limit).all()
+        query = self._filter_by_department(db.query(Candidate), filter_by_owner_id, filter_by_department_id)
+        return self._page(query, skip, limit, cursor)
 
-    def create_candidate(self, db: Session, candidate: CandidateCreate, added_by_user_id=None):
+    def get_candidate_list_rows(
+        self,
+        db: Session,
+        skip: int = 0,
+        limit: int = 100,
+        filter_by_owner_id: UUID = None,
+        filter_by_department_id: UUID = None,
+        candidate_ids: list[UUID] = None,
+        cursor: str = None,
+        expand=(),
+        visible_to=None,
+    ):
+        """
+        The candidate list as plain result rows: only LIST_COLUMNS plus any of
+        EXPANDABLE_LIST_FIELDS named in `expand` are selected, and no ORM
+        objects are built. `visible_to` limits the rows to what that user may see.
+        """
+        columns = LIST_COLUMNS + tuple(field for field in EXPANDABLE_LIST_FIELDS if field in expand)
+        query = db.query(*(getattr(Candidate, name) for name in columns))
+        if visible_to is not None:
+            query = access_scope_service.scope_candidates(query, visible_to)
+        if candidate_ids is not None:
+            query = query.filter(Candidate.id.in_(candidate_ids))
+        query = self._filter_by_department(query, filter_by_owner_id, filter_by_department_id)
+        return self._page(query, skip, limit, cursor)
+
+    def create_candidate(self, db: Session, candidate: CandidateCreate, added_by_user_id=None, resume_hash: str = None):
         # Extract job_id if present
         job_id = candidate.job_id
         # Convert Pydantic model to dict, excluding job_id from Candidate model fields
@@ -73,8 +129,10 @@ class CandidateService:
         print(f"\n[DEBUG] Creating Candidate with Data:\n{candidate_data}\n")
         
         # Create Candidate
-        db_candidate = Candidate(**candidate_data)
+        db_candidate = Candidate(**candidate_data, resume_hash=resume_hash)
         db.add(db_candidate)
+        db.flush()
+        self._reindex(db, db_candidate)
         db.commit()
         db.refresh(db_candidate)
         
@@ -106,6 +164,7 @@ class CandidateService:
         
         for key, value in update_data.items():
             setattr(db_candidate, key, value)
+        self._reindex(db, db_candidate, skills="skills" in update_data)
             
         db.add(db_candidate)
         db.commit()
@@ -144,11 +203,41 @@ class CandidateService:
     def get_candidate_by_email(self, db: Session, email: str):
         return db.query(Candidate).filter(Candidate.email == email).first()
 
-    def upload_resume(self, db: Session, file: UploadFile, job_id: UUID = None, parsed_data: CandidateCreate = None):
-        # Save file
-        file_location = f"{UPLOAD_DIR}/{file.filename}"
-        with open(file_location, "wb+") as file_object:
-            shutil.copyfileobj(file.file, file_object)
+    def upload_resume(self, db: Session, file: UploadFile, job_id: UUID = None, parsed_data: CandidateCreate = None, extracted: ExtractedText = None):
+        # Save file into the content-addressed store (identical files are stored once)
+        resume_hash, file_location, size = resume_store.save_fileobj(file.file, file.filename)
+        document = resume_store.register(db, resume_hash, file_location, file.filename, size)
+        return self.create_from_resume(db, document, job_id, parsed_data, extracted)
+
+    def process_stored_resume(self, db: Session, document: ResumeDocument, job_id: UUID = None):
+        """Extracts and parses a stored resume (reusing earlier results), then saves the candidate."""
+        # Reuse the stored parse result if this exact file was seen before
+        parsed_data = resume_store.cached_parse(document)
+        
+        # Extract text from the stored file (or reuse an earlier extraction)
+        extracted = None
+        if parsed_data is None:
+            if document.extracted_text is not None:
+                extracted = ExtractedText(document.extracted_text, document.page_count)
+            else:
+                extracted = parser_service.extract_document(document.file_path, document.file_path)
+        text = extracted.text if extracted else ""
+        
+        # Parse with LLM
+        if text:
+            parsed_data = parser_service.parse_with_llm(text, db)
+            if parsed_data is None:
+                logger.debug(f"LLM parsing returned nothing for resume {document.sha256}")
+        
+        return self.create_from_resume(db, document, job_id, parsed_data, extracted)
+
+    def create_from_resume(self, db: Session, document: ResumeDocument, job_id: UUID = None, parsed_data: CandidateCreate = None, extracted: ExtractedText = None):
+        """Creates or updates the candidate for a resume that is already in the store."""
+        resume_hash, file_location = document.sha256, document.file_path
+        if extracted is not None and document.extracted_text is None:
+            resume_store.save_extraction(document, extracted)
+        if parsed_data and not document.parsed_data:
+            resume_store.save_parse_result(document, parsed_data)
             
         if parsed_data:
             # Update resume_file_path in parsed data
@@ -160,11 +249,13 @@ class CandidateService:
             # Check if candidate exists by email
             existing_candidate = self.get_candidate_by_email(db, parsed_data.email)
             if existing_candidate:
-                print(f"[DEBUG] Candidate with email {parsed_data.email} exists. Updating...")
+                logger.debug(f"Resume {resume_hash} matches existing candidate {existing_candidate.id}, updating")
                 # Update fields
                 candidate_data = parsed_data.dict(exclude={"job_id"}, exclude_unset=True)
                 for key, value in candidate_data.items():
                     setattr(existing_candidate, key, value)
+                existing_candidate.resume_hash = resume_hash
+                self._reindex(db, existing_candidate, skills="skills" in candidate_data)
                 
                 # Check if we need to link to job
                 if job_id:
@@ -188,8 +279,17 @@ class CandidateService:
                 return existing_candidate
 
             # Use the existing create_candidate method which handles job linking
-            return self.create_candidate(db, parsed_data)
+            return self.create_candidate(db, parsed_data, resume_hash=resume_hash)
         else:
+            # Same file uploaded again: reuse the candidate created from it
+            existing_candidate = db.query(Candidate).filter(Candidate.resume_hash == resume_hash).first()
+            if existing_candidate:
+                if job_id:
+                    self._ensure_application(db, existing_candidate.id, job_id)
+                db.commit()
+                db.refresh(existing_candidate)
+                return existing_candidate
+
             # Create Stub Candidate (to be parsed later)
             # Using a UUID for unique email to avoid constraint errors
             unique_email = f"parsed_{uuid.uuid4()}@example.com"
@@ -199,9 +299,13 @@ class CandidateService:
                 last_name="Candidate",
                 email=unique_email,
                 resume_file_path=file_location,
+                resume_hash=resume_hash,
                 experience_years=0.0
             )
             db.add(db_candidate)
+            db.flush()
+            # No parsed fields yet, but the resume text is already searchable
+            candidate_search_service.refresh(db, [db_candidate.id])
             db.commit()
             db.refresh(db_candidate)
             
@@ -218,16 +322,117 @@ class CandidateService:
                  
             return db_candidate
         
-    def get_candidates_by_ids(self, db: Session, candidate_ids: list[UUID], skip: int = 0, limit: int = 100):
-        return db.query(Candidate).filter(Candidate.id.in_(candidate_ids)).offset(skip).limit(limit).all()
+    def _ensure_application(self, db: Session, candidate_id: UUID, job_id: UUID):
+        existing_app = db.query(JobApplication).filter(
+            JobApplication.candidate_id == candidate_id,
+            JobApplication.job_id == job_id
+        ).first()
+        if not existing_app:
+            db.add(JobApplication(
+                candidate_id=candidate_id,
+                job_id=job_id,
+                current_stage=_get_first_stage_id(db, job_id),
+                application_status="New"
+            ))
+
+    def get_candidates_by_ids(self, db: Session, candidate_ids: list[UUID], skip: int = 0, limit: int = 100, cursor: str = None):
+        return self._page(db.query(Candidate).filter(Candidate.id.in_(candidate_ids)), skip, limit, cursor)
 
-    def get_candidates_by_job(self, db: Session, job_id: UUID):
+    def get_candidates_by_job(self, db: Session, job_id: UUID, sort: str = None, visible_to=None):
         # Return all applications for this job, joining the candidate details
-        return db.query(JobApplication).filter(JobApplication.job_id == job_id).options(
+        query = db.query(JobApplication).filter(JobApplication.job_id == job_id).options(
             joinedload(JobApplication.candidate)
-        ).all()
+        )
+        if visible_to is not None:
+            query = access_scope_service.scope_candidates(query, visible_to, candidate_column=JobApplication.candidate_id)
+        # Best matches first; unscored applications go last
+        if sort == "prescreen":
+            query = query.order_by(JobApplication.prescreen_score.desc().nulls_last())
+        elif sort == "ai_score":
+            query = query.order_by(JobApplication.ai_score.desc().nulls_last())
+        return query.all()
+
+    def _board_query(self, db: Session, job_id: UUID, visible_to=None):
+        query = db.query(*BOARD_CARD_COLUMNS).join(Candidate, Candidate.id == JobApplication.candidate_id).filter(
+            JobApplication.job_id == job_id
+        )
+        if visible_to is not None:
+            query = access_scope_service.scope_candidates(query, visible_to, candidate_column=JobApplication.candidate_id)
+        return query
+
+    def get_stage_counts(self, db: Session, job_id: UUID, visible_to=None) -> dict:
+        """{current_stage: number of applications} for a job, from one GROUP BY."""
+        query = db.query(JobApplication.current_stage, func.count(JobApplication.id)).filter(JobApplication.job_id == job_id)
+        if visible_to is not None:
+            query = access_scope_service.scope_candidates(query, visible_to, candidate_column=JobApplication.candidate_id)
+        return dict(query.group_by(JobApplication.current_stage).all())
+
+    def get_board_cards(self, db: Session, job_id: UUID, per_stage: int, visible_to=None) -> dict:
+        """
+        {current_stage: [card rows]} with the newest `per_stage` applications of
+        every stage, ranked per stage by a window function in a single query.
+        """
+        rank = func.row_number().over(
+            partition_by=JobApplication.current_stage,
+            order_by=(JobApplication.applied_at.desc().nulls_last(), JobApplication.id.desc()),
+        ).label("stage_rank")
+        ranked = self._board_query(db, job_id, visible_to).add_columns(rank).subquery()
+        columns = [column for column in ranked.c if column.name != "stage_rank"]
+        rows = db.query(*columns).filter(ranked.c.stage_rank <= per_stage).order_by(ranked.c.current_stage, ranked.c.stage_rank)
+        cards = {}
+        for row in rows:
+            cards.setdefault(row.current_stage, []).append(row)
+        return cards
+
+    def get_stage_cards(self, db: Session, job_id: UUID, stage: str, limit: int, cursor: str = None, visible_to=None):
+        """One page of a single stage's cards, continuing after `cursor`."""
+        query = self._board_query(db, job_id, visible_to).filter(JobApplication.current_stage == stage)
+        return keyset(query, JobApplication, cursor, timestamp_column=JobApplication.applied_at).limit(limit).all()
+
+    def _is_hired_stage(self, db: Session, stage: str) -> bool:
+        """A stage counts as hired by id ('hired') or as the id of a template stage named Hired."""
+        if str(stage).lower() == "hired":
+            return True
+        from app.models.pipeline_stage import PipelineStage
+        hired_stage = db.query(PipelineStage.id).filter(func.lower(PipelineStage.name) == "hired").first()
+        return hired_stage is not None and stage == str(hired_stage.id)
+
+    def _stage_values(self, db: Session, stage: str, acting_user_id: UUID = None) -> dict:
+        """
+        Column values for moving applications to `stage`, as expressions so the
+        same dict serves one application or a set-based UPDATE of many.
+        """
+        values = {JobApplication.current_stage: stage}
+        # Map stage to status if possible (simplistic mapping for now)
+        if stage in STATUS_STAGES:
+            values[JobApplication.application_status] = stage
+        elif stage != "New":
+            values[JobApplication.application_status] = case(
+                (JobApplication.application_status == "New", "In Progress"), else_=JobApplication.application_status
+            )
+        values.update(self._attribution_values(self._is_hired_stage(db, stage), acting_user_id))
+        return values
+
+    def _status_values(self, status: str, acting_user_id: UUID = None) -> dict:
+        """
+        Column values for setting applications' status without moving them. The
+        hire attribution follows the status as it does for stage moves; no stage
+        event is written because current_stage, which the funnel counts, is unchanged.
+        """
+        values = {JobApplication.application_status: status}
+        values.update(self._attribution_values(status == ApplicationStatus.HIRED.value, acting_user_id))
+        return values
+
+    def _attribution_values(self, hired: bool, acting_user_id: UUID = None) -> dict:
+        if acting_user_id is None:
+            return {}
+        # Track who added the candidate (first time a stage is set) and who hired them
+        return {
+            JobApplication.added_by_user_id: func.coalesce(JobApplication.added_by_user_id, acting_user_id),
+            JobApplication.hired_by_user_id: acting_user_id if hired else None,
+        }
 
-    def update_application_stage(self, db: Session, job_id: UUID, candidate_id: UUID, stage: str):
+    def update_application_stage(self, db: Session, job_id: UUID, candidate_id: UUID, stage: str, acting_user_id: UUID = None):
         # Find the application
         application = db.query(JobApplication).filter(
             JobApplication.job_id == job_id,
@@ -237,22 +442,82 @@ class CandidateService:
         if not application:
             return None
 
-        application.current_stage = stage
-        
-        # Map stage to status if possible (simplistic mapping for now)
-        if stage in ["Rejected", "Hired", "Offer", "Shortlisted"]:
-             application.application_status = stage
-        else:
-             # Default to "Interview" or "In Progress" if it's an interview stage?
-             # For now, let's leave it or set to "In Progress" if it was New?
-             if application.application_status == "New" and stage != "New":
-                 application.application_status = "In Progress"
-        
-        db.commit()
+        from_stage = application.current_stage
+        # SQL expressions assigned to attributes are evaluated by the UPDATE
+        for column, value in self._stage_values(db, stage, acting_user_id).items():
+            setattr(application, column.key, value)
+        stage_history_service.record(db, application, from_stage, changed_by=acting_user_id)
+
         db.commit()
         db.refresh(application)
         return application
 
+    def bulk_update_applications(
+        self,
+        db: Session,
+        job_id: UUID,
+        candidate_ids: list[UUID],
+        operation: str,
+        stage: str = None,
+        status: str = None,
+        acting_user_id: UUID = None,
+    ) -> list[dict]:
+        """
+        Applies one operation (BULK_OPERATIONS) to the job's applications of
+        `candidate_ids` as a single set-based statement and commits once.
+        Returns one result per requested candidate, in request order; candidates
+        without an application to this job come back as not_found.
+        """
+        candidate_ids = list(dict.fromkeys(candidate_ids))
+        selected = and_(JobApplication.job_id == job_id, JobApplication.candidate_id.in_(candidate_ids))
+        returning = (
+            JobApplication.candidate_id, JobApplication.current_stage,
+            JobApplication.application_status, JobApplication.prescreen_score,
+        )
+
+        if operation == "move_stage":
+            values = self._stage_values(db, stage, acting_user_id)
+            # The locked pre-update rows give each application's previous stage for its history event
+            previous = select(JobApplication.id, JobApplication.current_stage.label("from_stage")).where(selected).with_for_update().subquery()
+            statement = (
+                update(JobApplication).where(JobApplication.id == previous.c.id).values(values)
+                .returning(*returning, JobApplication.id, JobApplication.job_id, JobApplication.applied_at, previous.c.from_stage)
+            )
+            moved = db.execute(statement, execution_options={"synchronize_session": False}).all()
+            stage_history_service.record_rows(db, [
+                {"application_id": row.id, "job_id": row.job_id, "candidate_id": row.candidate_id,
+                 "from_stage": row.from_stage, "to_stage": row.current_stage, "applied_at": row.applied_at}
+                for row in moved
+            ], StageEventSource.BULK, changed_by=acting_user_id)
+            rows = {row.candidate_id: {column.key: getattr(row, column.key) for column in returning} for row in moved}
+        elif operation == "set_status":
+            statement = update(JobApplication).where(selected).values(self._status_values(status, acting_user_id)).returning(*returning)
+            rows = {row.candidate_id: row._asdict() for row in db.execute(statement, execution_options={"synchronize_session": False})}
+        elif operation == "remove":
+            statement = delete(JobApplication).where(selected).returning(JobApplication.candidate_id)
+            rows = {row.candidate_id: {} for row in db.execute(statement, execution_options={"synchronize_session": False})}
+            # A core DELETE skips the flush hook that keeps visibility current
+            access_scope_service.refresh_candidates(db, candidate_ids=list(rows))
+        elif operation == "rescore":
+            from app.services.prescreen_service import prescreen_service
+            prescreen_service.score_job(db, job_id, candidate_ids=candidate_ids, commit=False)
+            rows = {
+                row.candidate_id: row._asdict()
+                for row in db.query(*returning).filter(selected)
+            }
+        else:
+            raise ValueError(f"Unknown bulk operation: {operation}")
+        db.commit()
+
+        results = []
+        for candidate_id in candidate_ids:
+            row = rows.get(candidate_id)
+            if row is None:
+                results.append({"candidate_id": candidate_id, "status": "not_found", "error": "Application not found"})
+            else:
+                results.append({**row, "candidate_id": candidate_id, "status": "removed" if operation == "remove" else "updated"})
+        return results
+
     def update_application_score(self, db: Session, job_id: UUID, candidate_id: UUID, score_data: dict):
         application = db.query(JobApplication).filter(
             JobApplication.job_id == job_id,
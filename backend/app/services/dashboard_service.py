@@ -0,0 +1,97 @@
+import os
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import false, func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.candidate import Candidate, JobApplication
+from app.models.dashboard_snapshot import DashboardSnapshot
+from app.models.job import Job, JobStatus
+from app.models.user import User
+
+# Maximum age of a served snapshot; past it a request recomputes it. The task
+# worker refreshes every DASHBOARD_REFRESH_SECONDS on a timer of its own, however
+# busy its queue is, so requests normally never do
+DASHBOARD_CACHE_TTL_SECONDS = int(os.getenv("DASHBOARD_CACHE_TTL_SECONDS", "60"))
+
+OVERVIEW = "overview"
+
+
+class DashboardService:
+    """
+    Dashboard aggregates computed in one query and kept in dashboard_snapshots,
+    so every worker serves the same short-lived result and a page load is a
+    primary-key read however large the tables grow.
+    """
+
+    def compute_overview(self, db: Session) -> dict:
+        """Every overview count in a single round trip: one FILTERed aggregate per table."""
+        now = datetime.now(timezone.utc)
+        thirty_days_ago = now - timedelta(days=30)
+
+        jobs = select(
+            func.count().filter(Job.is_deleted == false()).label("total_jobs"),
+            func.count().filter(Job.is_deleted == false(), Job.created_at >= thirty_days_ago).label("recent_jobs"),
+            func.count().filter(Job.is_deleted == false(), Job.status == JobStatus.PUBLISHED.value).label("active_jobs"),
+        ).select_from(Job).subquery()
+        candidates = select(
+            func.count().label("total_candidates"),
+            func.count().filter(Candidate.created_at >= thirty_days_ago).label("recent_candidates"),
+        ).select_from(Candidate).subquery()
+        users = select(
+            func.count().filter(User.is_deleted == false()).label("total_users"),
+        ).select_from(User).subquery()
+        hires = select(
+            func.count().filter(
+                JobApplication.application_status == "Hired", JobApplication.applied_at >= thirty_days_ago
+            ).label("hires_count"),
+        ).select_from(JobApplication).subquery()
+
+        row = db.execute(select(jobs, candidates, users, hires)).one()
+        total_jobs, recent_jobs = row.total_jobs, row.recent_jobs
+        total_candidates, recent_candidates = row.total_candidates, row.recent_candidates
+        return {
+            "total_jobs": total_jobs,
+            "total_candidates": total_candidates,
+            "total_users": row.total_users,
+            "active_jobs": row.active_jobs,
+            "recent_jobs": recent_jobs,
+            "recent_candidates": recent_candidates,
+            "hires_count": row.hires_count,
+            "recent_growth": {
+                "jobs_growth": ((recent_jobs / max(total_jobs - recent_jobs, 1)) * 100) if total_jobs > 0 else 0,
+                "candidates_growth": ((recent_candidates / max(total_candidates - recent_candidates, 1)) * 100) if total_candidates > 0 else 0
+            }
+        }
+
+    def refresh_overview(self, db: Session) -> dict:
+        """Recomputes the overview and stores it for every worker."""
+        data = self.compute_overview(db)
+        statement = insert(DashboardSnapshot).values(key=OVERVIEW, data=data, computed_at=datetime.now(timezone.utc))
+        db.execute(statement.on_conflict_do_update(
+            index_elements=[DashboardSnapshot.key],
+            set_={"data": statement.excluded.data, "computed_at": statement.excluded.computed_at},
+        ))
+        db.commit()
+        return data
+
+    def get_overview(self, db: Session) -> dict:
+        """
+        The stored overview while it is fresh. Once it is stale one request
+        recomputes it; concurrent requests keep serving the stale copy rather
+        than all running the aggregate at once.
+        """
+        snapshot = db.query(DashboardSnapshot.data, DashboardSnapshot.computed_at).filter(DashboardSnapshot.key == OVERVIEW).first()
+        if snapshot is not None:
+            fresh_after = datetime.now(timezone.utc) - timedelta(seconds=DASHBOARD_CACHE_TTL_SECONDS)
+            if snapshot.computed_at > fresh_after:
+                return snapshot.data
+            # Held until refresh_overview commits
+            refreshing = db.execute(select(func.pg_try_advisory_xact_lock(func.hashtext("dashboard_snapshots:" + OVERVIEW)))).scalar()
+            if not refreshing:
+                return snapshot.data
+        return self.refresh_overview(db)
+
+
+dashboard_service = DashboardService()
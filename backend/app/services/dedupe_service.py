@@ -0,0 +1,246 @@
+import os
+import re
+from collections import defaultdict
+from difflib import SequenceMatcher
+from itertools import combinations
+from typing import Dict, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy.orm import Session
+
+from app.models.application_stage_event import ApplicationStageEvent
+from app.models.candidate import Candidate, JobApplication
+from app.models.feedback import Feedback
+from app.models.scheduled_activity import ScheduledActivity
+from app.services.access_scope import access_scope_service
+from app.services.candidate_service import candidate_service
+
+# Pairs scoring below this are not reported
+DUPLICATE_MIN_SCORE = float(os.getenv("DUPLICATE_MIN_SCORE", "0.6"))
+# Blocks bigger than this key on something too common ("info@", a switchboard number) to be useful
+MAX_BLOCK_SIZE = int(os.getenv("DUPLICATE_MAX_BLOCK_SIZE", "50"))
+SCAN_BATCH_SIZE = 5000
+
+_STUB_EMAIL = re.compile(r"^parsed_[0-9a-f-]{36}@example\.com$")
+_STUB_NAME = ("candidate", "parsed")  # sorted, as name_tokens() returns them
+_NAME_TOKEN = re.compile(r"[^\W\d_]+")
+
+# Fields copied from a duplicate when the survivor has no value for them
+_FILLABLE_FIELDS = (
+    "phone", "location", "current_company", "current_position", "nationality", "notice_period",
+    "current_salary", "expected_salary", "education", "experience_history", "social_links",
+    "resume_file_path", "resume_hash", "parsed_at",
+)
+_SCORE_FIELDS = ("score_details", "overall_score", "recommendation", "ai_score", "ai_analysis", "prescreen_score")
+
+
+def normalize_phone(phone: Optional[str]) -> Optional[str]:
+    """Last nine digits, so "+92 300 1234567" and "0300-1234567" compare equal."""
+    digits = re.sub(r"\D", "", phone or "")
+    return digits[-9:] if len(digits) >= 7 else None
+
+
+def normalize_email(email: Optional[str]) -> Optional[Tuple[str, str]]:
+    """(local part without dots or +tags, domain), or None for blanks and upload stubs."""
+    email = (email or "").strip().lower()
+    if "@" not in email or _STUB_EMAIL.match(email):
+        return None
+    local, _, domain = email.rpartition("@")
+    local = local.split("+", 1)[0].replace(".", "")
+    return (local, domain) if local else None
+
+
+def name_tokens(first_name: Optional[str], last_name: Optional[str]) -> Tuple[str, ...]:
+    """Sorted lowercase name tokens; empty for the "Parsed Candidate" upload stubs."""
+    tokens = tuple(sorted(_NAME_TOKEN.findall(f"{first_name or ''} {last_name or ''}".lower())))
+    return () if tokens == _STUB_NAME else tokens
+
+
+class _Record:
+    __slots__ = ("id", "email", "phone", "name", "resume_hash")
+
+    def __init__(self, row):
+        self.id = row.id
+        self.email = normalize_email(row.email)
+        self.phone = normalize_phone(row.phone)
+        self.name = " ".join(name_tokens(row.first_name, row.last_name))
+        self.resume_hash = row.resume_hash
+
+    def block_keys(self) -> List[str]:
+        keys = []
+        if self.email:
+            keys.append(f"e:{self.email[0]}")
+        if self.phone:
+            keys.append(f"p:{self.phone}")
+        if self.name:
+            keys.append(f"n:{self.name}")
+        if self.resume_hash:
+            keys.append(f"r:{self.resume_hash}")
+        return keys
+
+
+class DedupeService:
+    """
+    Finds likely duplicate candidates and merges them.
+
+    Candidates are first grouped into blocks that share a normalised email
+    local part, phone number, name or resume file; only pairs inside a block
+    are scored, so the scan grows with the number of candidates rather than
+    the number of pairs.
+    """
+
+    def score_pair(self, a: _Record, b: _Record) -> Tuple[float, List[str]]:
+        reasons = []
+        if a.resume_hash and a.resume_hash == b.resume_hash:
+            return 1.0, ["same resume file"]
+        if a.email and a.email == b.email:
+            return 0.95, ["same email"]
+
+        score = 0.0
+        if a.phone and a.phone == b.phone:
+            score += 0.45
+            reasons.append("same phone")
+        if a.email and b.email and a.email[0] == b.email[0]:
+            score += 0.35
+            reasons.append("same email name")
+        if a.name and b.name:
+            similarity = SequenceMatcher(None, a.name, b.name).ratio()
+            if similarity >= 0.85:
+                score += 0.5 * similarity
+                reasons.append("same name" if similarity == 1.0 else "similar name")
+        return min(round(score, 2), 0.95), reasons
+
+    def _records(self, db: Session) -> Dict[UUID, _Record]:
+        rows = db.query(
+            Candidate.id, Candidate.first_name, Candidate.last_name,
+            Candidate.email, Candidate.phone, Candidate.resume_hash,
+        ).yield_per(SCAN_BATCH_SIZE)
+        return {row.id: _Record(row) for row in rows}
+
+    def find_duplicates(self, db: Session, min_score: float = DUPLICATE_MIN_SCORE, limit: int = 100) -> List[dict]:
+        """Likely duplicate pairs across all candidates, best first: {first_id, second_id, score, reasons}."""
+        records = self._records(db)
+        blocks = defaultdict(list)
+        for record in records.values():
+            for key in record.block_keys():
+                blocks[key].append(record.id)
+
+        scored = {}
+        for members in blocks.values():
+            if len(members) < 2 or len(members) > MAX_BLOCK_SIZE:
+                continue
+            for first_id, second_id in combinations(sorted(members), 2):
+                if (first_id, second_id) in scored:
+                    continue
+                scored[(first_id, second_id)] = self.score_pair(records[first_id], records[second_id])
+
+        pairs = [
+            {"first_id": first_id, "second_id": second_id, "score": score, "reasons": reasons}
+            for (first_id, second_id), (score, reasons) in scored.items()
+            if score >= min_score
+        ]
+        pairs.sort(key=lambda pair: pair["score"], reverse=True)
+        return pairs[:limit]
+
+    def _merge_fields(self, survivor: Candidate, duplicate: Candidate):
+        for field in _FILLABLE_FIELDS:
+            if not getattr(survivor, field) and getattr(duplicate, field):
+                setattr(survivor, field, getattr(duplicate, field))
+        if name_tokens(survivor.first_name, survivor.last_name) == () and name_tokens(duplicate.first_name, duplicate.last_name):
+            survivor.first_name, survivor.last_name = duplicate.first_name, duplicate.last_name
+        if not survivor.experience_years and duplicate.experience_years:
+            survivor.experience_years = duplicate.experience_years
+        skills = list(survivor.skills or [])
+        known = {skill.lower() for skill in skills if isinstance(skill, str)}
+        skills += [skill for skill in duplicate.skills or [] if isinstance(skill, str) and skill.lower() not in known]
+        survivor.skills = skills
+
+    def merge(self, db: Session, survivor_id: UUID, duplicate_ids: List[UUID]) -> dict:
+        """
+        Folds the duplicates into the survivor in one transaction: applications,
+        scheduled activities and feedback move over, empty profile fields are
+        filled in, then the duplicates are deleted. Where both have applied to
+        the same job the survivor's application is kept and any scores it lacks
+        are copied from the duplicate's. Raises ValueError / LookupError.
+        """
+        duplicate_ids = list(dict.fromkeys(duplicate_ids))
+        if not duplicate_ids:
+            raise ValueError("No duplicates given")
+        if survivor_id in duplicate_ids:
+            raise ValueError("A candidate cannot be merged into itself")
+
+        try:
+            candidates = {
+                c.id: c for c in db.query(Candidate)
+                .filter(Candidate.id.in_([survivor_id, *duplicate_ids]))
+                .order_by(Candidate.id)  # consistent lock order between concurrent merges
+                .with_for_update()
+                .all()
+            }
+            missing = [str(i) for i in [survivor_id, *duplicate_ids] if i not in candidates]
+            if missing:
+                raise LookupError(f"Candidates not found: {', '.join(missing)}")
+            survivor = candidates[survivor_id]
+
+            survivor_apps = {
+                app.job_id: app for app in db.query(JobApplication).filter(JobApplication.candidate_id == survivor_id)
+            }
+            moved = combined = 0
+            for app in db.query(JobApplication).filter(JobApplication.candidate_id.in_(duplicate_ids)).order_by(JobApplication.applied_at):
+                kept = survivor_apps.get(app.job_id)
+                if kept is None:
+                    app.candidate_id = survivor_id
+                    survivor_apps[app.job_id] = app
+                    moved += 1
+                else:
+                    for field in _SCORE_FIELDS:
+                        if not getattr(kept, field) and getattr(app, field):
+                            setattr(kept, field, getattr(app, field))
+                    db.delete(app)
+                    combined += 1
+
+            activities = db.query(ScheduledActivity).filter(ScheduledActivity.candidate_id.in_(duplicate_ids)).update(
+                {ScheduledActivity.candidate_id: survivor_id}, synchronize_session=False
+            )
+            feedbacks = db.query(Feedback).filter(Feedback.candidate_id.in_(duplicate_ids)).update(
+                {Feedback.candidate_id: survivor_id}, synchronize_session=False
+            )
+            # Stage history follows its application; rows left on a duplicate would be cascade-deleted with it
+            db.query(ApplicationStageEvent).filter(ApplicationStageEvent.candidate_id.in_(duplicate_ids)).update(
+                {ApplicationStageEvent.candidate_id: survivor_id}, synchronize_session=False
+            )
+            db.flush()
+
+            real_email = None
+            for duplicate_id in duplicate_ids:
+                duplicate = candidates[duplicate_id]
+                self._merge_fields(survivor, duplicate)
+                if real_email is None and normalize_email(duplicate.email):
+                    real_email = duplicate.email
+                # Reload the (now empty) collections so the delete cascade cannot touch moved rows
+                db.expire(duplicate)
+                db.delete(duplicate)
+            db.flush()
+            # Emails are unique, so a stub survivor takes over a real address only once its owner is gone
+            if normalize_email(survivor.email) is None and real_email:
+                survivor.email = real_email
+
+            candidate_service._reindex(db, survivor)
+            # The activities moved by the bulk UPDATE above are invisible to the flush hook
+            access_scope_service.refresh_candidates(db, candidate_ids=[survivor_id])
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+        return {
+            "candidate_id": survivor_id,
+            "merged_ids": duplicate_ids,
+            "applications_moved": moved,
+            "applications_combined": combined,
+            "activities_moved": activities,
+            "feedbacks_moved": feedbacks,
+        }
+
+
+dedupe_service = DedupeService()
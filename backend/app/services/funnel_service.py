@@ -0,0 +1,169 @@
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+
+from app.models.funnel_rollup import HireDurationRollup, StageRollupDaily, StageRollupHourly
+from app.models.job import Job
+
+HIRED_STAGE = "hired"
+# Stages that end an application without it progressing; reported beside the funnel, not in it
+EXIT_STAGES = ("rejected", "withdrawn")
+# Windows up to this many days are answered from the hourly rollups
+HOURLY_WINDOW_DAYS = 2
+
+_hourly = StageRollupHourly.__table__
+_daily = StageRollupDaily.__table__
+_durations = HireDurationRollup.__table__
+
+
+def _floor(moment: datetime, unit: str) -> datetime:
+    moment = moment.replace(minute=0, second=0, microsecond=0)
+    return moment.replace(hour=0) if unit == "day" else moment
+
+
+class FunnelService:
+    """
+    Conversion funnel per job, department or organisation, read from rollup
+    tables that app.services.stage_history bumps in the same transaction as
+    an application's first entry into each stage, so re-entering a stage does
+    not count it again. Applications can still skip stages, and a window can
+    start after an earlier stage was entered, so a stage may count more entries
+    than the one before it; conversion is capped at 1 and drop-off at 0 then.
+    Reads cost the same however many applications exist: they sum
+    (job, bucket, stage) counters.
+    """
+
+    def stage_names(self, db, job_ids: Iterable[UUID]) -> Dict[UUID, Dict[str, str]]:
+        """{job_id: {stage_id: stage name}} from the jobs' pipeline_config."""
+        rows = db.execute(select(Job.id, Job.pipeline_config).where(Job.id.in_(list(job_ids))))
+        return {
+            job_id: {stage.get("id"): stage.get("name") for stage in config or [] if stage.get("id")}
+            for job_id, config in rows
+        }
+
+    def record_transitions(self, db, transitions: Iterable[Tuple[UUID, Optional[str], Optional[datetime]]]):
+        """
+        Bumps the rollups for (job_id, to_stage, applied_at) transitions; a move
+        into the hired stage also adds its days-to-hire when applied_at is known.
+        """
+        transitions = list(transitions)
+        if not transitions:
+            return
+        names = self.stage_names(db, {job_id for job_id, _, _ in transitions})
+        now = datetime.now(timezone.utc)
+        entered, durations = Counter(), Counter()
+        for job_id, stage, applied_at in transitions:
+            name = names.get(job_id, {}).get(stage) or stage
+            if not name:
+                continue
+            entered[(job_id, name)] += 1
+            if name.lower() == HIRED_STAGE and applied_at is not None:
+                durations[(job_id, max((now - applied_at).days, 0))] += 1
+
+        # Sorted so concurrent writers lock the counter rows in the same order
+        for table, unit in ((_hourly, "hour"), (_daily, "day")):
+            rows = [
+                {"job_id": job_id, "bucket": _floor(now, unit), "stage": stage, "entered": count}
+                for (job_id, stage), count in sorted(entered.items(), key=lambda item: (str(item[0][0]), item[0][1]))
+            ]
+            statement = insert(table).values(rows)
+            db.execute(statement.on_conflict_do_update(
+                index_elements=["job_id", "bucket", "stage"],
+                set_={"entered": table.c.entered + statement.excluded.entered},
+            ))
+        if durations:
+            rows = [
+                {"job_id": job_id, "bucket": _floor(now, "day"), "days": days, "hires": count}
+                for (job_id, days), count in sorted(durations.items(), key=lambda item: (str(item[0][0]), item[0][1]))
+            ]
+            statement = insert(_durations).values(rows)
+            db.execute(statement.on_conflict_do_update(
+                index_elements=["job_id", "bucket", "days"],
+                set_={"hires": _durations.c.hires + statement.excluded.hires},
+            ))
+
+    def _stage_order(self, db, job_ids) -> Dict[str, int]:
+        """Each stage name's earliest position in the pipelines of the jobs in scope."""
+        query = select(Job.pipeline_config)
+        if job_ids is not None:
+            query = query.where(Job.id.in_(job_ids))
+        order = {}
+        for (config,) in db.execute(query):
+            for position, stage in enumerate(config or []):
+                name = stage.get("name")
+                if name and order.get(name, position) >= position:
+                    order[name] = position
+        return order
+
+    def funnel(self, db, job_ids=None, days: int = 90) -> dict:
+        """
+        Applications first entering each stage over the last `days`, for the jobs in
+        `job_ids` (a list or a select of job ids; None for every job), with
+        stage-to-stage conversion, drop-off and the days-to-hire distribution.
+        """
+        now = datetime.now(timezone.utc)
+        table, unit = (_hourly, "hour") if days <= HOURLY_WINDOW_DAYS else (_daily, "day")
+        since = _floor(now - timedelta(days=days), unit)
+
+        entered_query = select(table.c.stage, func.sum(table.c.entered)).where(table.c.bucket >= since).group_by(table.c.stage)
+        durations_query = (
+            select(_durations.c.days, func.sum(_durations.c.hires))
+            .where(_durations.c.bucket >= _floor(now - timedelta(days=days), "day"))
+            .group_by(_durations.c.days).order_by(_durations.c.days)
+        )
+        if job_ids is not None:
+            entered_query = entered_query.where(table.c.job_id.in_(job_ids))
+            durations_query = durations_query.where(_durations.c.job_id.in_(job_ids))
+        entered = {stage: int(count) for stage, count in db.execute(entered_query)}
+        histogram = [{"days": days_to_hire, "hires": int(hires)} for days_to_hire, hires in db.execute(durations_query)]
+
+        order = self._stage_order(db, job_ids)
+        names = sorted(set(order) | set(entered), key=lambda name: (order.get(name, len(order)), name))
+        stages, exits, previous = [], [], None
+        for name in names:
+            count = entered.get(name, 0)
+            if name.lower() in EXIT_STAGES:
+                exits.append({"stage": name, "entered": count})
+                continue
+            stages.append({
+                "stage": name,
+                "entered": count,
+                "conversion": round(min(count / previous, 1.0), 4) if previous else None,
+                "drop_off": max(previous - count, 0) if previous is not None else None,
+            })
+            previous = count
+
+        hires = sum(bucket["hires"] for bucket in histogram)
+        return {
+            "days": days,
+            "granularity": unit,
+            "stages": stages,
+            "exits": exits,
+            "hires": hires,
+            "median_days_to_hire": self._median(histogram, hires),
+            "days_to_hire": histogram,
+        }
+
+    def _median(self, histogram, total: int) -> Optional[float]:
+        """Median of the distribution the (days, hires) histogram describes."""
+        if not total:
+            return None
+
+        def value_at(index):
+            seen = 0
+            for bucket in histogram:
+                seen += bucket["hires"]
+                if index < seen:
+                    return bucket["days"]
+
+        middle = total // 2
+        if total % 2:
+            return float(value_at(middle))
+        return (value_at(middle - 1) + value_at(middle)) / 2
+
+
+funnel_service = FunnelService()
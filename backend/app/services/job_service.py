@@ -1,6 +1,8 @@
 from sqlalchemy.orm import Session, joinedload
 from app.models.job import Job, JobActivity, JobStatus
 from app.schemas.job import JobCreate, JobUpdate
+from app.utils.pagination import keyset
+from app.services.access_scope import access_scope_service
 from uuid import UUID
 from datetime import datetime
 import random
@@ -34,7 +36,14 @@ class JobService:
             query = query.filter(Job.is_deleted == False)
         return query.first()
 
-    def get_jobs(self, db: Session, skip: int = 0, limit: int = 100, status: str = None, filter_by_owner_id: UUID = None, filter_by_department_id: UUID = None):
+    def _page(self, query, skip: int, limit: int, cursor: str = None):
+        """Newest first; a cursor continues after the previous page, otherwise skip/limit applies."""
+        query = keyset(query, Job, cursor)
+        if not cursor:
+            query = query.offset(skip)
+        return query.limit(limit).all()
+
+    def get_jobs(self, db: Session, skip: int = 0, limit: int = 100, status: str = None, filter_by_owner_id: UUID = None, filter_by_department_id: UUID = None, cursor: str = None, visible_to=None):
         if status == JobStatus.ARCHIVED.value:
             query = db.query(Job).options(joinedload(Job.department)).filter(Job.is_deleted == True)
         else:
@@ -52,6 +61,10 @@ class JobService:
              # Filter by department directly on Job table
              query = query.filter(Job.department_id == filter_by_department_id)
 
+        if visible_to is not None:
+            # Hiring managers: jobs in departments they own; interviewers: jobs they have activities for
+            query = access_scope_service.scope_jobs(query, visible_to)
+
         # Handle auto-repair for archived jobs if needed (simplified from original for brevity, but keeping logic)
         # Original logic had separate blocks for ARCHIVED vs normal. 
         # I combined them but query building is slightly different.
@@ -67,7 +80,7 @@ class JobService:
              # Let's restructure to apply filters to 'query' then execute.
              # The original code's 'auto-repair' logic needs 'jobs' list.
              
-             jobs = query.offset(skip).limit(limit).all()
+             jobs = self._page(query, skip, limit, cursor)
              
              # Auto-repair logic
              dirty = False
@@ -80,20 +93,20 @@ class JobService:
                  db.commit()
              return jobs
         else:
-            return query.offset(skip).limit(limit).all()
+            return self._page(query, skip, limit, cursor)
         
-    def get_jobs_by_ids(self, db: Session, job_ids: list[UUID], skip: int = 0, limit: int = 100, status: str = None):
+    def get_jobs_by_ids(self, db: Session, job_ids: list[UUID], skip: int = 0, limit: int = 100, status: str = None, cursor: str = None):
         query = db.query(Job).options(joinedload(Job.department)).filter(Job.id.in_(job_ids), Job.is_deleted == False)
         
         if status:
             query = query.filter(Job.status == status)
             
-        return query.offset(skip).limit(limit).all()
+        return self._page(query, skip, limit, cursor)
 
-    def get_jobs_by_department(self, db: Session, department_id: UUID, skip: int = 0, limit: int = 100, status: str = None):
+    def get_jobs_by_department(self, db: Session, department_id: UUID, skip: int = 0, limit: int = 100, status: str = None, cursor: str = None):
         if status == JobStatus.ARCHIVED.value:
              query = db.query(Job).options(joinedload(Job.department)).filter(Job.department_id == department_id, Job.is_deleted == True)
-             jobs = query.offset(skip).limit(limit).all()
+             jobs = self._page(query, skip, limit, cursor)
              
              # Auto-repair for department-specific fetch too
              dirty = False
@@ -111,7 +124,7 @@ class JobService:
             query = db.query(Job).options(joinedload(Job.department)).filter(Job.department_id == department_id, Job.is_deleted == False)
             if status:
                 query = query.filter(Job.status == status)
-            return query.offset(skip).limit(limit).all()
+            return self._page(query, skip, limit, cursor)
 
     def create_job(self, db: Session, job: JobCreate, user_id: UUID = None):
         job_code = self._generate_job_code(db, job.title)
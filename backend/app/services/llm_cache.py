@@ -0,0 +1,124 @@
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from sqlalchemy.orm import Session
+
+from app.models.llm_cache import LLMCacheEntry
+
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "1024"))
+LLM_CACHE_TTL_SECONDS = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def _utcnow() -> datetime:
+    """Wall clock for the persistent layer's expiry times."""
+    return datetime.now(timezone.utc)
+
+
+def _normalize(value: Any) -> Any:
+    """Canonical form of an input so cosmetic differences don't change the fingerprint."""
+    if isinstance(value, str):
+        return _WHITESPACE.sub(" ", value).strip()
+    if isinstance(value, (list, tuple, set)):
+        items = [_normalize(v) for v in value]
+        # Skill lists are unordered and case-insensitive
+        if all(isinstance(v, str) for v in items):
+            return sorted({v.lower() for v in items if v})
+        return items
+    if isinstance(value, dict):
+        return {str(k): _normalize(v) for k, v in value.items()}
+    return value
+
+
+class LLMCache:
+    """
+    Two-level cache for LLM responses: an in-process LRU with TTL in front of the
+    llm_cache_entries table, so identical requests cost no tokens across restarts
+    and workers.
+    """
+
+    def __init__(self, max_entries: int = LLM_CACHE_MAX_ENTRIES, ttl_seconds: int = LLM_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def make_key(self, kind: str, model: str, prompt_version: str, **inputs) -> str:
+        payload = {
+            "kind": kind,
+            "model": model,
+            "prompt_version": prompt_version,
+            "inputs": _normalize(inputs),
+        }
+        encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False, default=str)
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _get_local(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def _set_local(self, key: str, value: Any, ttl_seconds: float):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def get(self, key: str, db: Session = None) -> Optional[Any]:
+        value = self._get_local(key)
+        if value is not None or db is None:
+            return value
+
+        now = _utcnow()
+        row = db.query(LLMCacheEntry).filter(
+            LLMCacheEntry.key == key,
+            LLMCacheEntry.expires_at > now
+        ).first()
+        if row is None:
+            return None
+        self._set_local(key, row.response, (row.expires_at - now).total_seconds())
+        return row.response
+
+    def set(self, key: str, value: Any, db: Session = None, kind: str = "", model: str = "", prompt_version: str = ""):
+        """Stores a response. The DB row is added to the caller's session and commits with it."""
+        self._set_local(key, value, self.ttl_seconds)
+        if db is not None:
+            db.merge(LLMCacheEntry(
+                key=key,
+                kind=kind,
+                model=model,
+                prompt_version=prompt_version,
+                response=value,
+                expires_at=_utcnow() + timedelta(seconds=self.ttl_seconds),
+            ))
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def purge_expired(self, db: Session) -> int:
+        """Deletes expired rows from the persistent cache."""
+        deleted = db.query(LLMCacheEntry).filter(
+            LLMCacheEntry.expires_at <= _utcnow()
+        ).delete(synchronize_session=False)
+        db.commit()
+        return deleted
+
+
+llm_cache = LLMCache()
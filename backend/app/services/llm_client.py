@@ -0,0 +1,225 @@
+import asyncio
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from typing import Optional
+
+import httpx
+from openai import (
+    OpenAI,
+    AsyncOpenAI,
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+)
+
+logger = logging.getLogger(__name__)
+
+# Keep these a little under the account limits so bursts do not end in 429s
+REQUESTS_PER_MINUTE = int(os.getenv("OPENAI_REQUESTS_PER_MINUTE", "450"))
+TOKENS_PER_MINUTE = int(os.getenv("OPENAI_TOKENS_PER_MINUTE", "180000"))
+MAX_CONCURRENCY = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))
+MAX_RETRIES = int(os.getenv("OPENAI_MAX_RETRIES", "5"))
+MAX_CONNECTIONS = int(os.getenv("OPENAI_MAX_CONNECTIONS", "20"))
+TIMEOUT_SECONDS = float(os.getenv("OPENAI_TIMEOUT_SECONDS", "60"))
+RETRY_BASE_SECONDS = 1.0
+RETRY_MAX_SECONDS = 60.0
+
+
+def estimate_tokens(*texts: str, completion_tokens: int = 0) -> int:
+    """Cheap token estimate (~4 characters per token) used to reserve rate-limit budget."""
+    return sum(len(text or "") for text in texts) // 4 + completion_tokens
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at `per_minute` units per minute.
+    Used for both the request and the token budget of the account.
+    """
+
+    def __init__(self, per_minute: int):
+        self.capacity = float(max(per_minute, 1))
+        self.rate = self.capacity / 60.0
+        self.available = self.capacity
+        self.updated = time.monotonic()
+        self.blocked_until = 0.0
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float):
+        self.available = min(self.capacity, self.available + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount: float) -> float:
+        """
+        Takes `amount` from the bucket and returns how long the caller must wait
+        before using it. Requests larger than the bucket are clamped to its size.
+        """
+        amount = min(amount, self.capacity)
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            self.available -= amount
+            wait = 0.0 if self.available >= 0 else -self.available / self.rate
+            return max(wait, self.blocked_until - now)
+
+    def adjust(self, delta: float):
+        """Returns (negative delta) or charges (positive delta) budget after the real usage is known."""
+        with self._lock:
+            self._refill(time.monotonic())
+            self.available = min(self.capacity, self.available - delta)
+
+    def pause(self, seconds: float):
+        """Holds every caller back, e.g. when the API answered 429 with Retry-After."""
+        with self._lock:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+
+class LLMClient:
+    """
+    Shared OpenAI access for every service: one pooled keep-alive HTTP client,
+    request/token rate limiting, bounded concurrency, and retries that honour
+    Retry-After. Services keep an OpenAI client attribute and route calls through
+    complete()/acomplete(), so tests can still swap the client for a mock.
+    """
+
+    def __init__(self):
+        self.api_key = os.getenv("OPENAI_API_KEY")
+        self.requests = TokenBucket(REQUESTS_PER_MINUTE)
+        self.tokens = TokenBucket(TOKENS_PER_MINUTE)
+        self._slots = threading.BoundedSemaphore(max(MAX_CONCURRENCY, 1))
+        self._limits = httpx.Limits(max_connections=MAX_CONNECTIONS, max_keepalive_connections=MAX_CONNECTIONS)
+        self._client: Optional[OpenAI] = None
+        # httpx.AsyncClient is tied to the event loop that first used it
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._async_slots = weakref.WeakKeyDictionary()
+        self._lock = threading.Lock()
+
+    @property
+    def client(self) -> Optional[OpenAI]:
+        """Shared synchronous client, or None when no API key is configured."""
+        if not self.api_key:
+            return None
+        with self._lock:
+            if self._client is None:
+                self._client = OpenAI(
+                    api_key=self.api_key,
+                    max_retries=0,  # retries are handled here, with the rate limiter
+                    http_client=httpx.Client(limits=self._limits, timeout=TIMEOUT_SECONDS),
+                )
+            return self._client
+
+    @property
+    def async_client(self) -> Optional[AsyncOpenAI]:
+        """Async client for the running event loop, or None when no API key is configured."""
+        if not self.api_key:
+            return None
+        loop = asyncio.get_running_loop()
+        client = self._async_clients.get(loop)
+        if client is None:
+            client = AsyncOpenAI(
+                api_key=self.api_key,
+                max_retries=0,
+                http_client=httpx.AsyncClient(limits=self._limits, timeout=TIMEOUT_SECONDS),
+            )
+            self._async_clients[loop] = client
+        return client
+
+    async def aclose(self):
+        """Closes the running loop's async client; call before the loop ends so its connections are released."""
+        loop = asyncio.get_running_loop()
+        self._async_slots.pop(loop, None)
+        client = self._async_clients.pop(loop, None)
+        if client is not None:
+            await client.close()
+
+    def _async_semaphore(self) -> asyncio.Semaphore:
+        loop = asyncio.get_running_loop()
+        semaphore = self._async_slots.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(MAX_CONCURRENCY, 1))
+            self._async_slots[loop] = semaphore
+        return semaphore
+
+    def _reserve(self, estimated_tokens: int) -> float:
+        return max(self.requests.reserve(1), self.tokens.reserve(estimated_tokens))
+
+    def _record_usage(self, response, estimated_tokens: int):
+        usage = getattr(response, "usage", None)
+        total = getattr(usage, "total_tokens", None)
+        if isinstance(total, int):
+            self.tokens.adjust(total - estimated_tokens)
+
+    def _retry_delay(self, error: Exception, attempt: int) -> Optional[float]:
+        """Seconds to wait before retrying `error`, or None if it is not retryable."""
+        if isinstance(error, APIStatusError):
+            if error.status_code != 429 and error.status_code < 500:
+                return None
+            headers = error.response.headers if error.response is not None else {}
+            retry_after = _parse_retry_after(headers)
+            if retry_after is not None:
+                if error.status_code == 429:
+                    # Everyone waits, not just this caller
+                    self.requests.pause(retry_after)
+                return retry_after
+        elif not isinstance(error, (APIConnectionError, APITimeoutError)):
+            return None
+        delay = min(RETRY_BASE_SECONDS * (2 ** attempt), RETRY_MAX_SECONDS)
+        return delay * random.uniform(0.5, 1.0)
+
+    def complete(self, client, estimated_tokens: int = 1000, **kwargs):
+        """Runs client.chat.completions.create(**kwargs) under the shared limits."""
+        attempt = 0
+        while True:
+            wait = self._reserve(estimated_tokens)
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                with self._slots:
+                    response = client.chat.completions.create(**kwargs)
+                self._record_usage(response, estimated_tokens)
+                return response
+            except Exception as e:
+                delay = self._retry_delay(e, attempt) if attempt < MAX_RETRIES else None
+                if delay is None:
+                    raise
+                attempt += 1
+                logger.warning(f"OpenAI call failed ({e.__class__.__name__}), retry {attempt} in {delay:.1f}s")
+                time.sleep(delay)
+
+    async def acomplete(self, client, estimated_tokens: int = 1000, **kwargs):
+        """Async twin of complete() for AsyncOpenAI clients."""
+        attempt = 0
+        while True:
+            wait = self._reserve(estimated_tokens)
+            if wait > 0:
+                await asyncio.sleep(wait)
+            try:
+                async with self._async_semaphore():
+                    response = await client.chat.completions.create(**kwargs)
+                self._record_usage(response, estimated_tokens)
+                return response
+            except Exception as e:
+                delay = self._retry_delay(e, attempt) if attempt < MAX_RETRIES else None
+                if delay is None:
+                    raise
+                attempt += 1
+                logger.warning(f"OpenAI call failed ({e.__class__.__name__}), retry {attempt} in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
+
+def _parse_retry_after(headers) -> Optional[float]:
+    """Reads the retry-after-ms / retry-after headers OpenAI sends with 429 and 5xx responses."""
+    try:
+        if headers.get("retry-after-ms"):
+            return float(headers["retry-after-ms"]) / 1000.0
+        if headers.get("retry-after"):
+            return float(headers["retry-after"])
+    except (TypeError, ValueError):
+        pass
+    return None
+
+
+llm_client = LLMClient()
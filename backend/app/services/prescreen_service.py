@@ -0,0 +1,169 @@
+import os
+import re
+from collections import Counter
+from typing import List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy.orm import Session, joinedload
+
+from app.models.candidate import JobApplication
+from app.models.job import Job
+from app.services.resume_store import resume_store
+
+# Applications scoring below this are not sent to the LLM by bulk screening (0 disables)
+PRESCREEN_THRESHOLD = float(os.getenv("PRESCREEN_THRESHOLD", "25"))
+
+# Relative weight of each signal; missing signals (no job skills, no experience range,
+# no description) are dropped and the remaining weights renormalised
+SKILL_WEIGHT = 0.5
+EXPERIENCE_WEIGHT = 0.2
+TEXT_WEIGHT = 0.3
+
+_TOKEN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+_STOPWORDS = frozenset(
+    "a an and are as at be but by for from has have in is it its of on or our that the their this "
+    "to we will with you your who what which years year experience work working team role job "
+    "looking required requirements skills ability strong good".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    tokens = (token.rstrip(".") for token in _TOKEN.findall((text or "").lower()))
+    return [token for token in tokens if token and token not in _STOPWORDS]
+
+
+def parse_experience_range(value: Optional[str]) -> Tuple[Optional[float], Optional[float]]:
+    """Reads "1-3 years", "3 to 5", "5+ years" or "2" into (min, max) years."""
+    numbers = [float(n) for n in re.findall(r"\d+(?:\.\d+)?", value or "")]
+    if not numbers:
+        return None, None
+    if len(numbers) == 1:
+        return numbers[0], (None if "+" in value else numbers[0])
+    return min(numbers[:2]), max(numbers[:2])
+
+
+class PrescreenService:
+    """
+    Deterministic, local pre-screen of every applicant of a job. All applicants
+    are scored together with NumPy: skill overlap against Job.skills, fit with the
+    job's experience range, and TF-IDF cosine similarity between the job text and
+    each resume. The 0-100 result is stored on JobApplication.prescreen_score.
+    """
+
+    def skill_overlap(self, job_skills: List[str], candidate_skills: List[List[str]], texts: List[str]) -> Optional[np.ndarray]:
+        """Share of job skills each candidate lists or mentions in their resume."""
+        wanted = list(dict.fromkeys(s.strip().lower() for s in job_skills or [] if s and s.strip()))
+        if not wanted:
+            return None
+        patterns = [re.compile(r"(?<![a-z0-9])" + re.escape(skill) + r"(?![a-z0-9])") for skill in wanted]
+        matrix = np.zeros((len(texts), len(wanted)), dtype=bool)
+        for row, (skills, text) in enumerate(zip(candidate_skills, texts)):
+            listed = {s.strip().lower() for s in skills or [] if s}
+            matrix[row] = [skill in listed or bool(pattern.search(text)) for skill, pattern in zip(wanted, patterns)]
+        return matrix.mean(axis=1)
+
+    def experience_fit(self, experience_range: Optional[str], years: np.ndarray) -> Optional[np.ndarray]:
+        """1.0 inside (or above) the range, falling off linearly below the minimum."""
+        minimum, _ = parse_experience_range(experience_range)
+        if minimum is None:
+            return None
+        if minimum <= 0:
+            return np.ones_like(years)
+        return np.clip(years / minimum, 0.0, 1.0)
+
+    def text_similarity(self, job_text: str, texts: List[str]) -> Optional[np.ndarray]:
+        """TF-IDF cosine similarity of each resume to the job, over the job's own vocabulary."""
+        job_counts = Counter(tokenize(job_text))
+        if not job_counts:
+            return None
+        vocabulary = {term: column for column, term in enumerate(job_counts)}
+
+        counts = np.zeros((len(texts), len(vocabulary)), dtype=np.float32)
+        for row, text in enumerate(texts):
+            for term, count in Counter(tokenize(text)).items():
+                column = vocabulary.get(term)
+                if column is not None:
+                    counts[row, column] = count
+
+        document_frequency = (counts > 0).sum(axis=0)
+        idf = np.log((1 + len(texts)) / (1 + document_frequency)) + 1.0
+        documents = np.log1p(counts) * idf
+        query = np.log1p(np.array([job_counts[term] for term in vocabulary], dtype=np.float32)) * idf
+
+        norms = np.linalg.norm(documents, axis=1) * np.linalg.norm(query)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(norms > 0, documents @ query / norms, 0.0)
+
+    def combine(self, job: Job, candidate_skills: List[List[str]], years: np.ndarray, texts: List[str]) -> np.ndarray:
+        components = []
+        overlap = self.skill_overlap(job.skills, candidate_skills, texts)
+        if overlap is not None:
+            components.append((SKILL_WEIGHT, overlap))
+        experience = self.experience_fit(job.experience_range, years)
+        if experience is not None:
+            components.append((EXPERIENCE_WEIGHT, experience))
+        job_text = " ".join([job.title or "", job.description or "", " ".join(job.skills or [])])
+        similarity = self.text_similarity(job_text, texts)
+        if similarity is not None:
+            components.append((TEXT_WEIGHT, similarity))
+        if not components:
+            return np.zeros(len(texts))
+
+        weights = np.array([weight for weight, _ in components])
+        signals = np.vstack([signal for _, signal in components])
+        return np.round(100.0 * (weights @ signals) / weights.sum(), 1)
+
+    def score_job(
+        self, db: Session, job_id: UUID, candidate_ids: Optional[List[UUID]] = None, commit: bool = True
+    ) -> List[Tuple[UUID, UUID, float]]:
+        """
+        Scores every application of a job and stores the scores, of all of them or
+        only of `candidate_ids`. Returns (application_id, candidate_id, score), best first. With commit=False
+        the scores are only flushed, leaving the transaction to the caller.
+        """
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if job is None:
+            return []
+        applications = (
+            db.query(JobApplication)
+            .options(joinedload(JobApplication.candidate))
+            .filter(JobApplication.job_id == job_id)
+            .all()
+        )
+        if not applications:
+            return []
+
+        candidates = [application.candidate for application in applications]
+        documents = resume_store.get_documents(db, {c.resume_hash for c in candidates if c.resume_hash})
+        texts = []
+        for candidate in candidates:
+            document = documents.get(candidate.resume_hash)
+            resume_text = document.extracted_text if document is not None and document.extracted_text else ""
+            texts.append(" ".join([candidate.current_position or "", " ".join(candidate.skills or []), resume_text]).lower())
+        years = np.array([candidate.experience_years or 0.0 for candidate in candidates], dtype=float)
+
+        scores = self.combine(job, [candidate.skills for candidate in candidates], years, texts)
+        if candidate_ids is not None:
+            # The whole pool is still scored: TF-IDF weights depend on every applicant
+            wanted = set(candidate_ids)
+            selected = [(application, score) for application, score in zip(applications, scores) if application.candidate_id in wanted]
+            applications, scores = [application for application, _ in selected], [score for _, score in selected]
+
+        # The rows are already loaded, so the unit of work flushes these as one executemany
+        for application, score in zip(applications, scores):
+            application.prescreen_score = float(score)
+        if commit:
+            db.commit()
+        else:
+            db.flush()
+
+        ranked = sorted(
+            ((application.id, application.candidate_id, float(score)) for application, score in zip(applications, scores)),
+            key=lambda row: row[2],
+            reverse=True,
+        )
+        return ranked
+
+
+prescreen_service = PrescreenService()
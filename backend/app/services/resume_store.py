@@ -0,0 +1,135 @@
+import hashlib
+import os
+import tempfile
+from datetime import datetime, timezone
+from typing import BinaryIO, Optional, Tuple
+
+from fastapi import UploadFile
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.models.resume_document import ResumeDocument
+from app.schemas.candidate import CandidateCreate
+from app.services.parser_service import ExtractedText
+
+RESUME_STORE_DIR = os.path.join("uploads", "resumes")
+CHUNK_SIZE = 1024 * 1024
+
+# Fields that describe where a parse result was attached, not what the resume says
+_NON_CONTENT_FIELDS = {"job_id", "resume_file_path"}
+
+
+class ResumeStore:
+    """
+    Content-addressed storage for resume files.
+
+    Files live under uploads/resumes/<aa>/<bb>/<sha256><ext>, so two different
+    files that share a filename never collide and an identical upload is stored
+    (and parsed) only once.
+    """
+
+    def hash_bytes(self, content: bytes) -> str:
+        return hashlib.sha256(content).hexdigest()
+
+    def path_for(self, sha256: str, filename: str) -> str:
+        ext = os.path.splitext(filename or "")[1].lower()
+        return os.path.join(RESUME_STORE_DIR, sha256[:2], sha256[2:4], f"{sha256}{ext}")
+
+    def _open_part(self):
+        os.makedirs(RESUME_STORE_DIR, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=RESUME_STORE_DIR, suffix=".part")
+        return os.fdopen(fd, "wb"), tmp_path
+
+    def _discard(self, tmp_path: str):
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+
+    def _commit_part(self, tmp_path: str, sha256: str, filename: str) -> str:
+        """Moves a finished .part file to its content address (or drops it if already stored)."""
+        path = self.path_for(sha256, filename)
+        if os.path.exists(path):
+            os.remove(tmp_path)
+        else:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            os.replace(tmp_path, path)
+        return path
+
+    def _check_size(self, size: int, max_bytes: Optional[int]):
+        if max_bytes is not None and size > max_bytes:
+            raise ValueError(f"File exceeds the limit of {max_bytes} bytes")
+
+    def save_fileobj(self, fileobj: BinaryIO, filename: str, max_bytes: Optional[int] = None) -> Tuple[str, str, int]:
+        """Copies a file into the store while hashing it. Returns (sha256, path, size)."""
+        digest = hashlib.sha256()
+        size = 0
+        tmp, tmp_path = self._open_part()
+        try:
+            with tmp:
+                while True:
+                    chunk = fileobj.read(CHUNK_SIZE)
+                    if not chunk:
+                        break
+                    size += len(chunk)
+                    self._check_size(size, max_bytes)
+                    digest.update(chunk)
+                    tmp.write(chunk)
+            sha256 = digest.hexdigest()
+            return sha256, self._commit_part(tmp_path, sha256, filename), size
+        except Exception:
+            self._discard(tmp_path)
+            raise
+
+    async def save_upload(self, upload: UploadFile, max_bytes: Optional[int] = None) -> Tuple[str, str, int]:
+        """
+        Streams an upload into the store chunk by chunk, hashing as it goes, so
+        at most CHUNK_SIZE bytes of the file are held in memory at a time. The
+        copy runs in a worker thread to keep disk IO off the event loop.
+        Returns (sha256, path, size).
+        """
+        return await run_in_threadpool(self.save_fileobj, upload.file, upload.filename, max_bytes)
+
+    def get_document(self, db: Session, sha256: str) -> Optional[ResumeDocument]:
+        return db.query(ResumeDocument).filter(ResumeDocument.sha256 == sha256).first()
+
+    def get_documents(self, db: Session, hashes) -> dict:
+        """Bulk lookup of stored documents, keyed by hash."""
+        if not hashes:
+            return {}
+        documents = db.query(ResumeDocument).filter(ResumeDocument.sha256.in_(list(hashes))).all()
+        return {document.sha256: document for document in documents}
+
+    def register(self, db: Session, sha256: str, path: str, filename: str, size: int) -> ResumeDocument:
+        """Returns the document row for a stored file, creating it on first sight."""
+        document = self.get_document(db, sha256)
+        if document is None:
+            document = ResumeDocument(
+                sha256=sha256,
+                file_path=path,
+                original_filename=filename,
+                size_bytes=size,
+            )
+            db.add(document)
+            db.flush()
+        return document
+
+    def save_extraction(self, document: ResumeDocument, extracted: ExtractedText):
+        document.extracted_text = extracted.text
+        document.text_bytes = extracted.byte_length
+        document.page_count = extracted.page_count
+        document.extracted_at = datetime.now(timezone.utc)
+
+    def cached_parse(self, document: Optional[ResumeDocument]) -> Optional[CandidateCreate]:
+        """Rebuilds the parse result previously stored for this content, if any."""
+        if document is None or not document.parsed_data:
+            return None
+        try:
+            return CandidateCreate(**document.parsed_data)
+        except Exception:
+            return None
+
+    def save_parse_result(self, document: ResumeDocument, parsed_data: CandidateCreate):
+        document.parsed_data = parsed_data.model_dump(mode="json", exclude=_NON_CONTENT_FIELDS)
+        document.parsed_at = datetime.now(timezone.utc)
+
+
+resume_store = ResumeStore()
@@ -1,34 +1,55 @@
+import asyncio
 import json
+import logging
 import os
-from sqlalchemy.orm import Session
+import time
+from datetime import datetime, timezone
+from typing import Callable, Dict, List, Optional, Tuple
+from uuid import UUID
+from sqlalchemy import func
+from sqlalchemy.orm import Session, joinedload
 from app.models.candidate import Candidate, JobApplication
 from app.models.job import Job
-from app.services.parser_service import parser_service
-from openai import OpenAI
+from app.services.parser_service import parser_service, ExtractedText
+from app.services.resume_store import resume_store
+from app.services.candidate_search import candidate_search_service
+from app.services.llm_cache import llm_cache
+from app.services.llm_client import llm_client, estimate_tokens
+from app.services.prescreen_service import prescreen_service
 from fastapi import HTTPException
 
+SCREENING_MODEL = "gpt-4o-mini"
+# Bump whenever the screening prompt changes so cached results are not reused
+SCREENING_PROMPT_VERSION = "screen-v1"
+# Completion budget reserved from the token limiter for one screening
+SCREENING_COMPLETION_TOKENS = 800
+# Bulk screening: applications loaded per batch and OpenAI calls in flight per batch
+SCREEN_BATCH_SIZE = int(os.getenv("SCREEN_BATCH_SIZE", "50"))
+SCREEN_CONCURRENCY = int(os.getenv("SCREEN_CONCURRENCY", "8"))
 
-class ScreeningService:
-    def __init__(self):
-        self.api_key = os.getenv("OPENAI_API_KEY")
-        self.client = OpenAI(api_key=self.api_key) if self.api_key else None
+logger = logging.getLogger(__name__)
 
-    def screen_candidate(self, db: Session, job_id: str, candidate_id: str):
-        if not self.client:
-            raise HTTPException(status_code=500, detail="OpenAI API Key not configured")
 
-        # Fetch Data
-        job = db.query(Job).filter(Job.id == job_id).first()
-        candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
-        application = db.query(JobApplication).filter(
-            JobApplication.job_id == job_id, 
-            JobApplication.candidate_id == candidate_id
-        ).first()
+class ScreeningService:
+    def __init__(self):
+        # Shared pooled client (None without an API key)
+        self.api_key = llm_client.api_key
+        self.client = llm_client.client
+        self.async_client = None
 
-        if not job or not candidate or not application:
-            raise HTTPException(status_code=404, detail="Job, Candidate, or Application not found")
+    def _get_resume_text(self, db: Session, candidate: Candidate, documents: Optional[dict] = None) -> str:
+        """
+        Returns the resume text stored at upload time. Only resumes uploaded before
+        text was persisted fall back to reading and parsing the file again.
+        `documents` is an optional preloaded {resume_hash: ResumeDocument} map.
+        """
+        if documents is not None:
+            document = documents.get(candidate.resume_hash)
+        else:
+            document = resume_store.get_document(db, candidate.resume_hash) if candidate.resume_hash else None
+        if document is not None and document.extracted_text is not None:
+            return document.extracted_text
 
-        # Extract Text
         resume_text = ""
         if candidate.resume_file_path and os.path.exists(candidate.resume_file_path):
             try:
@@ -45,6 +66,16 @@ class ScreeningService:
             except Exception as e:
                 print(f"Error reading resume file: {e}")
 
+        # Backfill so the next screen of this resume is served from the store
+        if document is not None and resume_text:
+            resume_store.save_extraction(document, ExtractedText(resume_text))
+            # The resume body is in the search_vector of every candidate with this resume
+            candidate_ids = {candidate.id} | {row.id for row in db.query(Candidate.id).filter(Candidate.resume_hash == document.sha256)}
+            candidate_search_service.refresh(db, candidate_ids)
+        return resume_text
+
+    def _build_request(self, job: Job, candidate: Candidate, resume_text: str) -> Tuple[dict, str]:
+        """Returns the completion kwargs for one screening and the fingerprint of its inputs."""
         # Construct Prompt
         # We use a structured prompt to get JSON output
         system_prompt = """
@@ -72,23 +103,64 @@ class ScreeningService:
         """
         # Truncate resume text to avoid token limits if necessary, though 4o-mini has large context.
 
+        cache_key = llm_cache.make_key(
+            "screening", SCREENING_MODEL, SCREENING_PROMPT_VERSION,
+            job_title=job.title,
+            job_description=job.description or "",
+            job_skills=job.skills or [],
+            candidate_name=f"{candidate.first_name} {candidate.last_name}",
+            candidate_skills=candidate.skills or [],
+            experience_years=candidate.experience_years,
+            resume_text=resume_text[:10000],
+        )
+        request = dict(
+            estimated_tokens=estimate_tokens(system_prompt, user_content, completion_tokens=SCREENING_COMPLETION_TOKENS),
+            model=SCREENING_MODEL,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": user_content}
+            ],
+            response_format={"type": "json_object"},
+            temperature=0.2
+        )
+        return request, cache_key
+
+    def _apply_result(self, application: JobApplication, result: dict, cache_key: str):
+        application.ai_score = result.get("match_score")
+        application.ai_analysis = result
+        application.ai_input_hash = cache_key
+        application.ai_screened_at = datetime.now(timezone.utc)
+
+    def screen_candidate(self, db: Session, job_id: str, candidate_id: str):
+        if not self.client:
+            raise HTTPException(status_code=500, detail="OpenAI API Key not configured")
+
+        # Fetch Data
+        job = db.query(Job).filter(Job.id == job_id).first()
+        candidate = db.query(Candidate).filter(Candidate.id == candidate_id).first()
+        application = db.query(JobApplication).filter(
+            JobApplication.job_id == job_id, 
+            JobApplication.candidate_id == candidate_id
+        ).first()
+
+        if not job or not candidate or not application:
+            raise HTTPException(status_code=404, detail="Job, Candidate, or Application not found")
+
+        # Extract Text
+        resume_text = self._get_resume_text(db, candidate)
+        request, cache_key = self._build_request(job, candidate, resume_text)
+
         try:
-            response = self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_content}
-                ],
-                response_format={"type": "json_object"},
-                temperature=0.2
-            )
-            
-            content = response.choices[0].message.content
-            result = json.loads(content)
+            result = llm_cache.get(cache_key, db)
+            if result is None:
+                response = llm_client.complete(self.client, **request)
+                
+                content = response.choices[0].message.content
+                result = json.loads(content)
+                llm_cache.set(cache_key, result, db, kind="screening", model=SCREENING_MODEL, prompt_version=SCREENING_PROMPT_VERSION)
             
             # Save to DB
-            application.ai_score = result.get("match_score")
-            application.ai_analysis = result
+            self._apply_result(application, result, cache_key)
             db.commit()
             db.refresh(application)
             
@@ -98,4 +170,130 @@ class ScreeningService:
             print(f"Screening failed: {e}")
             raise HTTPException(status_code=500, detail=f"AI Screening failed: {str(e)}")
 
+    async def _screen_requests(self, pending: List[Tuple[UUID, dict]]) -> Dict[UUID, Optional[dict]]:
+        """Runs the given screenings concurrently (bounded by SCREEN_CONCURRENCY). Failures map to None."""
+        client = self.async_client or llm_client.async_client
+        semaphore = asyncio.Semaphore(max(SCREEN_CONCURRENCY, 1))
+
+        async def run(application_id: UUID, request: dict):
+            async with semaphore:
+                try:
+                    response = await llm_client.acomplete(client, **request)
+                    return application_id, json.loads(response.choices[0].message.content)
+                except Exception as e:
+                    logger.error(f"Screening of application {application_id} failed: {e}")
+                    return application_id, None
+
+        return dict(await asyncio.gather(*[run(application_id, request) for application_id, request in pending]))
+
+    def screen_job(self, db: Session, job_id, force: bool = False, min_prescreen: Optional[float] = None,
+                   on_progress: Optional[Callable[[dict], None]] = None) -> dict:
+        """
+        Screens every application of a job. The job is loaded once, applications
+        are streamed in batches of SCREEN_BATCH_SIZE with their candidates and
+        stored resume text, and each batch is written back in one bulk update.
+        Applications whose screening inputs are unchanged since their last
+        ai_score are skipped unless `force` is set. With `min_prescreen`, the
+        local pre-screen runs first and only applications scoring at least that
+        much are sent to the LLM. The whole job runs in one event loop, so every
+        batch shares one pooled async client, closed when the job ends.
+        """
+        if not self.client:
+            raise HTTPException(status_code=500, detail="OpenAI API Key not configured")
+        job = db.query(Job).filter(Job.id == job_id).first()
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+
+        if min_prescreen:
+            prescreen_service.score_job(db, job_id)
+
+        return asyncio.run(self._screen_job(db, job, force, min_prescreen, on_progress))
+
+    async def _screen_job(self, db: Session, job: Job, force: bool, min_prescreen: Optional[float],
+                          on_progress: Optional[Callable[[dict], None]]) -> dict:
+        try:
+            job_id = job.id
+            total = db.query(func.count(JobApplication.id)).filter(JobApplication.job_id == job_id).scalar()
+            progress = {"total": total, "processed": 0, "screened": 0, "cached": 0, "skipped": 0, "failed": 0,
+                        "below_threshold": 0, "elapsed_seconds": 0.0, "eta_seconds": None}
+            started = time.monotonic()
+            last_id = None
+
+            while True:
+                query = (
+                    db.query(JobApplication)
+                    .options(joinedload(JobApplication.candidate))
+                    .filter(JobApplication.job_id == job_id)
+                )
+                if last_id is not None:
+                    query = query.filter(JobApplication.id > last_id)
+                batch = query.order_by(JobApplication.id).limit(SCREEN_BATCH_SIZE).all()
+                if not batch:
+                    break
+                last_id = batch[-1].id
+
+                hashes = {application.candidate.resume_hash for application in batch if application.candidate.resume_hash}
+                documents = resume_store.get_documents(db, hashes)
+
+                updates = {}
+                pending = []
+                keys = {}
+                for application in batch:
+                    if min_prescreen and (application.prescreen_score or 0) < min_prescreen:
+                        progress["below_threshold"] += 1
+                        continue
+                    resume_text = self._get_resume_text(db, application.candidate, documents)
+                    request, cache_key = self._build_request(job, application.candidate, resume_text)
+                    if not force and application.ai_input_hash == cache_key and application.ai_score is not None:
+                        progress["skipped"] += 1
+                        continue
+                    keys[application.id] = cache_key
+                    cached = llm_cache.get(cache_key, db)
+                    if cached is not None:
+                        updates[application.id] = cached
+                        progress["cached"] += 1
+                    else:
+                        pending.append((application.id, request))
+
+                if pending:
+                    for application_id, result in (await self._screen_requests(pending)).items():
+                        if result is None:
+                            progress["failed"] += 1
+                            continue
+                        llm_cache.set(keys[application_id], result, db, kind="screening",
+                                      model=SCREENING_MODEL, prompt_version=SCREENING_PROMPT_VERSION)
+                        updates[application_id] = result
+                        progress["screened"] += 1
+
+                if updates:
+                    screened_at = datetime.now(timezone.utc)
+                    db.bulk_update_mappings(JobApplication, [
+                        {
+                            "id": application_id,
+                            "ai_score": result.get("match_score"),
+                            "ai_analysis": result,
+                            "ai_input_hash": keys[application_id],
+                            "ai_screened_at": screened_at,
+                        }
+                        for application_id, result in updates.items()
+                    ])
+                db.commit()
+                # Bulk updates bypass the identity map; drop this batch so memory stays flat
+                for row in [*batch, *(application.candidate for application in batch), *documents.values()]:
+                    if row in db:
+                        db.expunge(row)
+
+                progress["processed"] += len(batch)
+                elapsed = time.monotonic() - started
+                remaining = max(total - progress["processed"], 0)
+                progress["elapsed_seconds"] = round(elapsed, 1)
+                progress["eta_seconds"] = round(elapsed / progress["processed"] * remaining, 1)
+                logger.info(f"Bulk screening job {job_id}: {progress['processed']}/{total}, ETA {progress['eta_seconds']}s")
+                if on_progress:
+                    on_progress(dict(progress))
+
+            return progress
+        finally:
+            await llm_client.aclose()
+
 screening_service = ScreeningService()
@@ -0,0 +1,449 @@
+import fcntl
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Iterable, List, Optional, Tuple
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import event, func
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.models.candidate import Candidate
+from app.models.resume_document import ResumeDocument
+from app.models.similarity_index_removal import SimilarityIndexRemoval
+from app.services.prescreen_service import tokenize
+
+logger = logging.getLogger(__name__)
+
+SIMILARITY_INDEX_DIR = os.getenv("SIMILARITY_INDEX_DIR", os.path.join("data", "similarity_index"))
+DIMENSIONS = int(os.getenv("SIMILARITY_DIMENSIONS", "128"))
+VOCABULARY_SIZE = int(os.getenv("SIMILARITY_VOCABULARY_SIZE", "20000"))
+# Candidates sampled to fit the vocabulary and the LSA projection; the rest are folded in
+FIT_DOCUMENTS = int(os.getenv("SIMILARITY_FIT_DOCUMENTS", "5000"))
+# Resume characters that go into a candidate's vector
+DOCUMENT_CHARS = 20000
+BATCH_SIZE = 500
+# Re-read candidates changed this long before the watermark, for transactions that committed late
+SYNC_OVERLAP = timedelta(minutes=2)
+
+_MANIFEST = "manifest.json"
+_LOCK = "index.lock"
+_ID_DTYPE = np.dtype("V16")
+_removals = SimilarityIndexRemoval.__table__
+
+
+def candidate_document(candidate: Candidate, resume_text: Optional[str]) -> str:
+    """The text a candidate is compared on: role, company, skills and resume."""
+    return " ".join([
+        candidate.current_position or "",
+        candidate.current_company or "",
+        " ".join(candidate.skills or []),
+        (resume_text or "")[:DOCUMENT_CHARS],
+    ])
+
+
+class LSAModel:
+    """TF-IDF over a fixed vocabulary, projected onto the top singular vectors of the fit sample."""
+
+    def __init__(self, vocabulary: List[str], idf: np.ndarray, components: np.ndarray):
+        self.vocabulary = {term: column for column, term in enumerate(vocabulary)}
+        self.terms = list(vocabulary)
+        self.idf = idf.astype(np.float32)
+        self.components = components.astype(np.float32)  # (dimensions, vocabulary)
+
+    @property
+    def dimensions(self) -> int:
+        return self.components.shape[0]
+
+    def _tfidf(self, counts: List[Counter]) -> np.ndarray:
+        matrix = np.zeros((len(counts), len(self.terms)), dtype=np.float32)
+        for row, document in enumerate(counts):
+            for term, count in document.items():
+                column = self.vocabulary.get(term)
+                if column is not None:
+                    matrix[row, column] = count
+        matrix = np.log1p(matrix) * self.idf
+        return _normalize_rows(matrix)
+
+    def transform(self, texts: List[str]) -> np.ndarray:
+        """Unit-length vectors for the given documents (all zeros when nothing is in the vocabulary)."""
+        vectors = np.zeros((len(texts), self.dimensions), dtype=np.float32)
+        for start in range(0, len(texts), BATCH_SIZE):
+            chunk = [Counter(tokenize(text)) for text in texts[start:start + BATCH_SIZE]]
+            vectors[start:start + len(chunk)] = self._tfidf(chunk) @ self.components.T
+        return _normalize_rows(vectors)
+
+    @classmethod
+    def fit(cls, texts: List[str], dimensions: int = DIMENSIONS, vocabulary_size: int = VOCABULARY_SIZE, seed: int = 0) -> "LSAModel":
+        counts = [Counter(tokenize(text)) for text in texts]
+        document_frequency = Counter()
+        for document in counts:
+            document_frequency.update(document.keys())
+        min_df = 2 if len(counts) >= 100 else 1
+        vocabulary = [term for term, df in document_frequency.most_common(vocabulary_size) if df >= min_df]
+        if not vocabulary:
+            raise ValueError("No terms to build a similarity model from")
+        df = np.array([document_frequency[term] for term in vocabulary], dtype=np.float32)
+        idf = np.log((1 + len(counts)) / (1 + df)) + 1.0
+
+        model = cls(vocabulary, idf, np.zeros((1, len(vocabulary)), dtype=np.float32))
+        rank = max(1, min(dimensions, len(counts), len(vocabulary)))
+        model.components = _randomized_svd(lambda start, stop: model._tfidf(counts[start:stop]), len(counts), len(vocabulary), rank, seed)
+        return model
+
+    def save(self, path: str):
+        np.savez(path, vocabulary=np.array(self.terms, dtype=object), idf=self.idf, components=self.components)
+
+    @classmethod
+    def load(cls, path: str) -> "LSAModel":
+        with np.load(path, allow_pickle=True) as data:
+            return cls(list(data["vocabulary"]), data["idf"], data["components"])
+
+
+def _normalize_rows(matrix: np.ndarray) -> np.ndarray:
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
+
+def _randomized_svd(rows, n_rows: int, n_columns: int, rank: int, seed: int, power_iterations: int = 2) -> np.ndarray:
+    """
+    Top `rank` right singular vectors of the matrix produced chunk by chunk by
+    rows(start, stop), without materialising it (Halko et al. range finder).
+    """
+    sketch = min(rank + 10, n_rows, n_columns)
+
+    def times(right: np.ndarray) -> np.ndarray:  # A @ right
+        out = np.empty((n_rows, right.shape[1]), dtype=np.float32)
+        for start in range(0, n_rows, BATCH_SIZE):
+            stop = min(start + BATCH_SIZE, n_rows)
+            out[start:stop] = rows(start, stop) @ right
+        return out
+
+    def transposed_times(left: np.ndarray) -> np.ndarray:  # A.T @ left
+        out = np.zeros((n_columns, left.shape[1]), dtype=np.float32)
+        for start in range(0, n_rows, BATCH_SIZE):
+            stop = min(start + BATCH_SIZE, n_rows)
+            out += rows(start, stop).T @ left[start:stop]
+        return out
+
+    rng = np.random.default_rng(seed)
+    basis, _ = np.linalg.qr(times(rng.standard_normal((n_columns, sketch)).astype(np.float32)))
+    for _ in range(power_iterations):
+        basis, _ = np.linalg.qr(transposed_times(basis))
+        basis, _ = np.linalg.qr(times(basis))
+    projected = transposed_times(basis).T  # (sketch, columns)
+    _, _, right_vectors = np.linalg.svd(projected, full_matrices=False)
+    return right_vectors[:rank]
+
+
+class _LoadedIndex:
+    def __init__(self, directory: str, manifest: dict):
+        self.manifest = manifest
+        self.count = manifest["count"]
+        self.model = LSAModel.load(os.path.join(directory, "model.npz"))
+        self.vectors = np.memmap(os.path.join(directory, "vectors.f32"), dtype=np.float32, mode="r", shape=(manifest["capacity"], manifest["dimensions"]))
+        self.ids = np.memmap(os.path.join(directory, "ids.bin"), dtype=_ID_DTYPE, mode="r", shape=(manifest["capacity"],))
+        # Built once per loaded version; the manifest is reloaded after every sync
+        self.rows = _row_map(self.ids, self.count)
+
+    def row_of(self, candidate_id: UUID) -> Optional[int]:
+        return self.rows.get(candidate_id.bytes)
+
+
+def _row_map(ids: np.ndarray, count: int) -> dict:
+    """{candidate id bytes: row} for the first `count` rows."""
+    raw = ids[:count].tobytes()
+    return {raw[row * 16:(row + 1) * 16]: row for row in range(count)}
+
+
+class SimilarityIndexService:
+    """
+    "More like this" over resume text and skills. A TF-IDF/LSA model is fitted
+    on a sample of candidates and every candidate is stored as a unit vector in
+    a memory-mapped float32 matrix under SIMILARITY_INDEX_DIR, so all web
+    workers share one copy through the page cache. build() writes a complete
+    new version; sync() folds in candidates changed since the last run and
+    zeroes the vectors of the deleted ones recorded in
+    similarity_index_removals, so they never score. Both take a file
+    lock, so only one process writes at a time. sync() writes rows in place in
+    the live files: a reader racing it may score one candidate against a
+    half-written vector, which only affects that query's ranking.
+    """
+
+    def __init__(self):
+        self._loaded: Optional[_LoadedIndex] = None
+        self._loaded_stamp = None
+        self._lock = threading.Lock()
+
+    # --- storage helpers ---
+
+    def _manifest_path(self) -> str:
+        return os.path.join(SIMILARITY_INDEX_DIR, _MANIFEST)
+
+    def _read_manifest(self) -> Optional[dict]:
+        try:
+            with open(self._manifest_path()) as f:
+                return json.load(f)
+        except (FileNotFoundError, ValueError):
+            return None
+
+    def _write_manifest(self, manifest: dict):
+        tmp_path = self._manifest_path() + ".tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f)
+        os.replace(tmp_path, self._manifest_path())
+
+    def _version_dir(self, version: int) -> str:
+        return os.path.join(SIMILARITY_INDEX_DIR, f"v{version}")
+
+    def _writer_lock(self, blocking: bool):
+        """Exclusive cross-process lock for writers; returns the open lock file or None if busy."""
+        os.makedirs(SIMILARITY_INDEX_DIR, exist_ok=True)
+        handle = open(os.path.join(SIMILARITY_INDEX_DIR, _LOCK), "w")
+        try:
+            fcntl.flock(handle, fcntl.LOCK_EX | (0 if blocking else fcntl.LOCK_NB))
+        except BlockingIOError:
+            handle.close()
+            return None
+        return handle
+
+    def _allocate(self, directory: str, capacity: int, dimensions: int):
+        os.makedirs(directory, exist_ok=True)
+        vectors = np.memmap(os.path.join(directory, "vectors.f32"), dtype=np.float32, mode="w+", shape=(capacity, dimensions))
+        ids = np.memmap(os.path.join(directory, "ids.bin"), dtype=_ID_DTYPE, mode="w+", shape=(capacity,))
+        return vectors, ids
+
+    def _load(self) -> Optional[_LoadedIndex]:
+        """The current index, reopened whenever another process has published a new manifest."""
+        try:
+            stat = os.stat(self._manifest_path())
+        except FileNotFoundError:
+            return None
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        with self._lock:
+            if self._loaded is None or self._loaded_stamp != stamp:
+                manifest = self._read_manifest()
+                if manifest is None:
+                    return self._loaded
+                try:
+                    self._loaded = _LoadedIndex(self._version_dir(manifest["version"]), manifest)
+                except FileNotFoundError:
+                    # A writer replaced this version while we were reading it; retry on the next call
+                    return self._loaded
+                self._loaded_stamp = stamp
+            return self._loaded
+
+    # --- reading candidates ---
+
+    def _documents(self, db: Session, candidates: List[Candidate]) -> List[str]:
+        hashes = {c.resume_hash for c in candidates if c.resume_hash}
+        texts = dict(
+            db.query(ResumeDocument.sha256, func.left(ResumeDocument.extracted_text, DOCUMENT_CHARS))
+            .filter(ResumeDocument.sha256.in_(hashes))
+            .all()
+        ) if hashes else {}
+        return [candidate_document(c, texts.get(c.resume_hash)) for c in candidates]
+
+    def _batches(self, db: Session, since: Optional[datetime] = None) -> Iterable[List[Candidate]]:
+        """Candidates in keyset batches of BATCH_SIZE, optionally only those changed since `since`."""
+        changed_at = func.coalesce(Candidate.updated_at, Candidate.created_at)
+        last_id = None
+        while True:
+            query = db.query(Candidate)
+            if since is not None:
+                query = query.filter(changed_at > since)
+            if last_id is not None:
+                query = query.filter(Candidate.id > last_id)
+            batch = query.order_by(Candidate.id).limit(BATCH_SIZE).all()
+            if not batch:
+                return
+            yield batch
+            last_id = batch[-1].id
+            for candidate in batch:
+                db.expunge(candidate)
+
+    # --- writing ---
+
+    def build(self, db: Session) -> Optional[dict]:
+        """Fits a new model and vectorises every candidate into a new index version. Returns its manifest."""
+        lock = self._writer_lock(blocking=True)
+        try:
+            started = time.monotonic()
+            watermark = datetime.now(timezone.utc)
+            sample = db.query(Candidate).order_by(func.random()).limit(FIT_DOCUMENTS).all()
+            if not sample:
+                return None
+            model = LSAModel.fit(self._documents(db, sample))
+
+            previous = self._read_manifest()
+            version = (previous["version"] + 1) if previous else 1
+            directory = self._version_dir(version)
+            total = db.query(func.count(Candidate.id)).scalar()
+            capacity = max(1024, int(total * 1.25))
+            vectors, ids = self._allocate(directory, capacity, model.dimensions)
+            model.save(os.path.join(directory, "model.npz"))
+
+            count = 0
+            for batch in self._batches(db):
+                if count + len(batch) > capacity:  # candidates added while building
+                    break
+                vectors[count:count + len(batch)] = model.transform(self._documents(db, batch))
+                for offset, candidate in enumerate(batch):
+                    ids[count + offset] = np.void(candidate.id.bytes)
+                count += len(batch)
+            vectors.flush()
+            ids.flush()
+
+            manifest = {
+                "version": version,
+                "count": count,
+                "capacity": capacity,
+                "dimensions": model.dimensions,
+                "watermark": watermark.isoformat(),
+                "built_at": datetime.now(timezone.utc).isoformat(),
+            }
+            self._write_manifest(manifest)
+            # Candidates deleted before this build started are not in it
+            db.query(SimilarityIndexRemoval).filter(SimilarityIndexRemoval.removed_at <= watermark).delete(synchronize_session=False)
+            db.commit()
+            if previous:
+                # Readers that still map the old files keep them until they reload
+                shutil.rmtree(self._version_dir(previous["version"]), ignore_errors=True)
+            logger.info(f"Similarity index v{version}: {count} candidates in {time.monotonic() - started:.1f}s")
+            return manifest
+        finally:
+            lock.close()
+
+    def sync(self, db: Session) -> int:
+        """
+        Folds candidates created or changed since the last build/sync into the
+        index (builds it if there is none). Returns how many were written; 0 when
+        another process is already writing.
+        """
+        lock = self._writer_lock(blocking=False)
+        if lock is None:
+            return 0
+        try:
+            manifest = self._read_manifest()
+            if manifest is None:
+                lock.close()
+                lock = None
+                built = self.build(db)
+                return built["count"] if built else 0
+
+            directory = self._version_dir(manifest["version"])
+            model = LSAModel.load(os.path.join(directory, "model.npz"))
+            capacity, count = manifest["capacity"], manifest["count"]
+            vectors = np.memmap(os.path.join(directory, "vectors.f32"), dtype=np.float32, mode="r+", shape=(capacity, model.dimensions))
+            ids = np.memmap(os.path.join(directory, "ids.bin"), dtype=_ID_DTYPE, mode="r+", shape=(capacity,))
+
+            watermark = datetime.now(timezone.utc)
+            since = datetime.fromisoformat(manifest["watermark"]) - SYNC_OVERLAP
+            first_version = manifest["version"]
+            rows = _row_map(ids, count)
+            written = 0
+            for batch in self._batches(db, since=since):
+                batch_vectors = model.transform(self._documents(db, batch))
+                for candidate, vector in zip(batch, batch_vectors):
+                    row = rows.get(candidate.id.bytes)
+                    if row is None:
+                        if count == capacity:
+                            vectors, ids, capacity = self._grow(manifest, vectors, ids, count)
+                        row = rows[candidate.id.bytes] = count
+                        ids[row] = np.void(candidate.id.bytes)
+                        count += 1
+                    vectors[row] = vector
+                    written += 1
+            removed = self._tombstone(db, vectors, rows)
+            vectors.flush()
+            ids.flush()
+
+            manifest.update({"count": count, "capacity": capacity, "watermark": watermark.isoformat()})
+            self._write_manifest(manifest)
+            for version in range(first_version, manifest["version"]):
+                shutil.rmtree(self._version_dir(version), ignore_errors=True)
+            if written or removed:
+                logger.info(f"Similarity index: synced {written} candidates, removed {removed}")
+            return written
+        finally:
+            if lock is not None:
+                lock.close()
+
+    def _tombstone(self, db: Session, vectors: np.memmap, rows: dict) -> int:
+        """Zeroes the vectors of candidates recorded as removed, then forgets those records."""
+        removed = 0
+        candidate_ids = [candidate_id for (candidate_id,) in db.query(SimilarityIndexRemoval.candidate_id)]
+        for candidate_id in candidate_ids:
+            row = rows.get(candidate_id.bytes)
+            if row is not None:
+                vectors[row] = 0
+                removed += 1
+        for start in range(0, len(candidate_ids), BATCH_SIZE):
+            db.query(SimilarityIndexRemoval).filter(
+                SimilarityIndexRemoval.candidate_id.in_(candidate_ids[start:start + BATCH_SIZE])
+            ).delete(synchronize_session=False)
+        db.commit()
+        return removed
+
+    def _grow(self, manifest: dict, vectors: np.memmap, ids: np.memmap, count: int):
+        """Copies the index into a new version with twice the capacity (the live one is never resized in place)."""
+        old_dir = self._version_dir(manifest["version"])
+        manifest["version"] += 1
+        new_dir = self._version_dir(manifest["version"])
+        capacity = vectors.shape[0] * 2
+        new_vectors, new_ids = self._allocate(new_dir, capacity, vectors.shape[1])
+        new_vectors[:count] = vectors[:count]
+        new_ids[:count] = ids[:count]
+        shutil.copyfile(os.path.join(old_dir, "model.npz"), os.path.join(new_dir, "model.npz"))
+        return new_vectors, new_ids, capacity
+
+    # --- querying ---
+
+    def similar(self, db: Session, candidate: Candidate, limit: int = 10) -> Optional[List[Tuple[UUID, float]]]:
+        """
+        (candidate_id, cosine similarity) of the candidates most like `candidate`,
+        best first. Candidates not yet in the index are folded in on the fly.
+        Returns None when no index has been built yet.
+        """
+        index = self._load()
+        if index is None:
+            return None
+        row = index.row_of(candidate.id)
+        if row is not None:
+            query = np.asarray(index.vectors[row])
+        else:
+            query = index.model.transform(self._documents(db, [candidate]))[0]
+        if not query.any() or index.count == 0:
+            return []
+
+        scores = np.asarray(index.vectors[:index.count] @ query)
+        if row is not None:
+            scores[row] = -np.inf
+        top = min(limit, index.count)
+        best = np.argpartition(-scores, top - 1)[:top]
+        best = best[np.argsort(-scores[best])]
+        return [
+            (uuid.UUID(bytes=index.ids[i].tobytes()), round(float(scores[i]), 4))
+            for i in best
+            if scores[i] > 0
+        ]
+
+
+similarity_index_service = SimilarityIndexService()
+
+
+@event.listens_for(Session, "after_flush")
+def _record_removed_candidates(session, flush_context):
+    candidate_ids = [obj.id for obj in session.deleted if isinstance(obj, Candidate)]
+    if candidate_ids:
+        session.connection().execute(
+            insert(_removals).values([{"candidate_id": candidate_id} for candidate_id in candidate_ids]).on_conflict_do_nothing()
+        )
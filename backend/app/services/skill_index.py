@@ -0,0 +1,123 @@
+import math
+import re
+from typing import Iterable, List, Optional
+
+from sqlalchemy import Float, String, and_, column, exists, func, insert, values
+from sqlalchemy.orm import Session
+
+from app.models.candidate import Candidate, JobApplication
+from app.models.candidate_skill import CandidateSkill
+from app.models.job import Job
+from app.models.user import User
+from app.services.access_scope import access_scope_service
+
+MAX_SKILL_LENGTH = 100
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize_skill(skill: Optional[str]) -> str:
+    """Case- and whitespace-insensitive form of a skill, e.g. " Machine  Learning," -> "machine learning"."""
+    if not isinstance(skill, str):
+        return ""
+    return _WHITESPACE.sub(" ", skill.lower()).strip(" ,;:/|")[:MAX_SKILL_LENGTH]
+
+
+def normalize_skills(skills: Optional[Iterable[str]]) -> List[str]:
+    """Normalised, de-duplicated skills in their original order."""
+    normalised = (normalize_skill(skill) for skill in skills or [])
+    return list(dict.fromkeys(skill for skill in normalised if skill))
+
+
+class SkillIndexService:
+    """
+    Maintains the candidate_skills inverted index and answers "best candidates
+    for this job" from it. Callers sync a candidate whenever its skills change;
+    the rows are written in the caller's transaction.
+    """
+
+    def sync_candidate(self, db: Session, candidate: Candidate):
+        """Replaces the index rows of one candidate with its current skills."""
+        if candidate.id is None:
+            db.flush()
+        db.query(CandidateSkill).filter(CandidateSkill.candidate_id == candidate.id).delete(synchronize_session=False)
+        skills = normalize_skills(candidate.skills)
+        if skills:
+            db.execute(insert(CandidateSkill), [{"skill": skill, "candidate_id": candidate.id} for skill in skills])
+
+    def skill_weights(self, db: Session, skills: List[str]) -> dict:
+        """
+        IDF-style weight per wanted skill: rare skills count more than ones most
+        of the pool lists. Skills nobody has get the rarest weight.
+        """
+        frequencies = dict(
+            db.query(CandidateSkill.skill, func.count())
+            .filter(CandidateSkill.skill.in_(skills))
+            .group_by(CandidateSkill.skill)
+            .all()
+        )
+        most_common = max(frequencies.values(), default=1)
+        return {skill: 1.0 + math.log(most_common / frequencies.get(skill, 1)) for skill in skills}
+
+    def match_job(self, db: Session, job: Job, limit: int = 50, exclude_applied: bool = False, visible_to: User = None) -> List[dict]:
+        """
+        Ranks the whole candidate pool against the job's skills in one grouped
+        query over the index. Returns dicts with the candidate, a 0-100 score
+        (share of the job's skill weight the candidate covers), the matched
+        skills and whether they already applied to the job.
+        """
+        wanted = normalize_skills(job.skills)
+        if not wanted:
+            return []
+        weights = self.skill_weights(db, wanted)
+        total_weight = sum(weights.values())
+
+        wanted_table = values(column("skill", String), column("weight", Float), name="wanted").data(list(weights.items()))
+        score = func.sum(wanted_table.c.weight)
+        query = (
+            db.query(
+                CandidateSkill.candidate_id,
+                score.label("score"),
+                func.array_agg(CandidateSkill.skill).label("matched"),
+            )
+            .join(wanted_table, wanted_table.c.skill == CandidateSkill.skill)
+            .group_by(CandidateSkill.candidate_id)
+            .order_by(score.desc(), CandidateSkill.candidate_id)
+            .limit(limit)
+        )
+        if exclude_applied:
+            query = query.filter(~exists().where(and_(
+                JobApplication.candidate_id == CandidateSkill.candidate_id,
+                JobApplication.job_id == job.id,
+            )))
+        if visible_to is not None:
+            # Hiring managers only see candidates who applied to jobs in departments they own
+            query = access_scope_service.scope_candidates(query, visible_to, candidate_column=CandidateSkill.candidate_id)
+        rows = query.all()
+        if not rows:
+            return []
+
+        candidate_ids = [row.candidate_id for row in rows]
+        candidates = {c.id: c for c in db.query(Candidate).filter(Candidate.id.in_(candidate_ids)).all()}
+        applied = {
+            candidate_id for (candidate_id,) in db.query(JobApplication.candidate_id).filter(
+                JobApplication.job_id == job.id,
+                JobApplication.candidate_id.in_(candidate_ids),
+            )
+        }
+
+        order = {skill: position for position, skill in enumerate(wanted)}
+        return [
+            {
+                "candidate": candidates[row.candidate_id],
+                "score": round(100.0 * row.score / total_weight, 1),
+                "matched_skills": sorted(row.matched, key=order.get),
+                "missing_skills": [skill for skill in wanted if skill not in row.matched],
+                "applied": row.candidate_id in applied,
+            }
+            for row in rows
+            if row.candidate_id in candidates
+        ]
+
+
+skill_index_service = SkillIndexService()
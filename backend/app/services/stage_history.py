@@ -0,0 +1,107 @@
+from typing import Iterable, Optional
+from uuid import UUID
+
+from sqlalchemy import event, func, insert, literal, select, tuple_
+from sqlalchemy.orm import Session
+
+from app.models.application_stage_event import ApplicationStageEvent, StageEventSource
+from app.models.candidate import JobApplication
+from app.services.funnel_service import funnel_service
+
+_events = ApplicationStageEvent.__table__
+
+
+class StageHistoryService:
+    """
+    Writes application_stage_events. New applications are picked up by the
+    after_flush hook below; code that moves applications calls record (ORM)
+    or record_rows / insert_from (set-based statements) in the same
+    transaction as the move, so history and current_stage never disagree.
+
+    record and record_rows also bump the funnel rollups, once per application
+    and stage: re-entering a stage is history, not another candidate reaching
+    it. Template migrations (insert_from) do not: they rename stages, nobody
+    progressed.
+    """
+
+    def _entered_before(self, db, pairs) -> set:
+        """The (application_id, stage) pairs that already have an event into that stage."""
+        pairs = list(pairs)
+        if not pairs:
+            return set()
+        return set(db.execute(
+            select(_events.c.application_id, _events.c.to_stage)
+            .where(tuple_(_events.c.application_id, _events.c.to_stage).in_(pairs))
+            .distinct()
+        ).all())
+
+    def record(self, db: Session, application: JobApplication, from_stage: Optional[str], changed_by: UUID = None,
+               source: str = StageEventSource.MANUAL):
+        if from_stage == application.current_stage:
+            return
+        first_entry = not self._entered_before(db, [(application.id, application.current_stage)])
+        db.add(ApplicationStageEvent(
+            application_id=application.id,
+            job_id=application.job_id,
+            candidate_id=application.candidate_id,
+            from_stage=from_stage,
+            to_stage=application.current_stage,
+            source=source,
+            changed_by_user_id=changed_by,
+        ))
+        if first_entry:
+            funnel_service.record_transitions(db, [(application.job_id, application.current_stage, application.applied_at)])
+
+    def record_rows(self, db: Session, rows: Iterable[dict], source: str, changed_by: UUID = None):
+        """
+        One event per row ({application_id, job_id, candidate_id, from_stage,
+        to_stage, applied_at}) that changed stage, as one executemany.
+        """
+        changed = [row for row in rows if row["from_stage"] != row["to_stage"]]
+        if not changed:
+            return
+        entered = self._entered_before(db, [(row["application_id"], row["to_stage"]) for row in changed])
+        db.execute(insert(_events), [
+            {**{key: value for key, value in row.items() if key != "applied_at"}, "source": source, "changed_by_user_id": changed_by}
+            for row in changed
+        ])
+        funnel_service.record_transitions(db, [
+            (row["job_id"], row["to_stage"], row.get("applied_at"))
+            for row in changed if (row["application_id"], row["to_stage"]) not in entered
+        ])
+
+    def insert_from(self, moved, source: str, changed_by: UUID = None):
+        """
+        INSERT ... SELECT of one event per row of `moved`, a CTE or subquery with
+        application_id, job_id, candidate_id, from_stage and to_stage columns -
+        typically an UPDATE ... RETURNING, so moving and logging is one statement.
+        """
+        columns = ["id", "application_id", "job_id", "candidate_id", "from_stage", "to_stage", "source", "changed_by_user_id"]
+        rows = select(
+            # one id per row; the column's Python default would be evaluated once for the whole statement
+            func.gen_random_uuid(), moved.c.application_id, moved.c.job_id, moved.c.candidate_id, moved.c.from_stage, moved.c.to_stage,
+            literal(source), literal(changed_by, _events.c.changed_by_user_id.type),
+        ).where(moved.c.from_stage.is_distinct_from(moved.c.to_stage))
+        return insert(_events).from_select(columns, rows)
+
+
+stage_history_service = StageHistoryService()
+
+
+@event.listens_for(Session, "after_flush")
+def _record_new_applications(session, flush_context):
+    rows = [
+        {
+            "application_id": obj.id,
+            "job_id": obj.job_id,
+            "candidate_id": obj.candidate_id,
+            "from_stage": None,
+            "to_stage": obj.current_stage,
+            "changed_by_user_id": obj.added_by_user_id,
+        }
+        for obj in session.new if isinstance(obj, JobApplication)
+    ]
+    if rows:
+        connection = session.connection()
+        connection.execute(insert(_events), [{**row, "source": StageEventSource.APPLIED} for row in rows])
+        funnel_service.record_transitions(connection, [(row["job_id"], row["to_stage"], None) for row in rows])
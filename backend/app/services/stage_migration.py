@@ -0,0 +1,113 @@
+import os
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from uuid import UUID
+
+from sqlalchemy import String, column, update, values
+from sqlalchemy.orm import Session
+
+from app.models.application_stage_event import StageEventSource
+from app.models.candidate import JobApplication
+from app.services.stage_history import stage_history_service
+
+# Jobs with more applications than this migrate their stages in a background task
+STAGE_MIGRATION_BACKGROUND_THRESHOLD = int(os.getenv("STAGE_MIGRATION_BACKGROUND_THRESHOLD", "5000"))
+# Applications per committed UPDATE in the background mode
+STAGE_MIGRATION_CHUNK_SIZE = int(os.getenv("STAGE_MIGRATION_CHUNK_SIZE", "1000"))
+
+
+class StageMigrationService:
+    """
+    Moves a job's applications onto a new set of pipeline stages. The mapping
+    is planned over the job's distinct current stages, so it is computed once
+    per stage rather than once per application, and applied as a single
+    UPDATE ... FROM (VALUES (old_stage, new_stage), ...) whose RETURNING rows
+    are written to the stage history by the same statement.
+    """
+
+    def plan(self, db: Session, job_id: UUID, old_config: list, new_config: list, keep_current: bool = False) -> Dict[Optional[str], str]:
+        """
+        {current_stage: new_stage} for the applications that have to move.
+        A stage maps to the new stage of the same name, otherwise to the first
+        new stage; with keep_current, stages already in new_config stay put.
+        """
+        old_names = {stage.get("id"): stage.get("name") for stage in old_config or []}
+        new_ids_by_name = {stage["name"]: stage["id"] for stage in new_config}
+        new_ids = {stage["id"] for stage in new_config}
+        default_stage_id = new_config[0]["id"] if new_config else "new"
+
+        current_stages = db.query(JobApplication.current_stage).filter(JobApplication.job_id == job_id).distinct()
+        mapping = {}
+        for (stage,) in current_stages:
+            name = old_names.get(stage)
+            if name and name in new_ids_by_name:
+                target = new_ids_by_name[name]
+            elif keep_current and stage in new_ids:
+                target = stage
+            else:
+                target = default_stage_id
+            if target != stage:
+                mapping[stage] = target
+        return mapping
+
+    def count(self, db: Session, job_id: UUID) -> int:
+        return db.query(JobApplication.id).filter(JobApplication.job_id == job_id).count()
+
+    def _statement(self, job_id: UUID, mapping: Iterable[Tuple[Optional[str], str]], changed_by: UUID = None, ids=None):
+        """The UPDATE, as a CTE feeding the stage history INSERT: moving and logging is one statement."""
+        stage_map = values(column("old_stage", String), column("new_stage", String), name="stage_map").data(list(mapping))
+        moved = (
+            update(JobApplication)
+            .where(
+                JobApplication.job_id == job_id,
+                JobApplication.current_stage.is_not_distinct_from(stage_map.c.old_stage),
+            )
+            .values(current_stage=stage_map.c.new_stage)
+        )
+        if ids is not None:
+            moved = moved.where(JobApplication.id.in_(ids))
+        moved = moved.returning(
+            JobApplication.id.label("application_id"), JobApplication.job_id, JobApplication.candidate_id,
+            stage_map.c.old_stage.label("from_stage"), stage_map.c.new_stage.label("to_stage"),
+        ).cte("moved")
+        return stage_history_service.insert_from(moved, StageEventSource.TEMPLATE_MIGRATION, changed_by)
+
+    def migrate(self, db: Session, job_id: UUID, mapping: Dict[Optional[str], str], changed_by: UUID = None) -> int:
+        """Applies the mapping in one statement inside the caller's transaction; returns rows moved."""
+        if not mapping:
+            return 0
+        return db.execute(self._statement(job_id, mapping.items(), changed_by)).rowcount
+
+    def migrate_in_chunks(
+        self,
+        db: Session,
+        job_id: UUID,
+        mapping: List[Tuple[Optional[str], str]],
+        chunk_size: int = STAGE_MIGRATION_CHUNK_SIZE,
+        after: Optional[UUID] = None,
+        changed_by: UUID = None,
+        on_progress: Optional[Callable[[dict], None]] = None,
+    ) -> dict:
+        """
+        Applies the mapping `chunk_size` applications at a time in id order,
+        committing after each chunk so row locks are only held briefly. Each
+        application is visited once, so a stage that is both moved from and
+        moved to is never remapped twice; `after` resumes an interrupted run.
+        """
+        progress = {"total": self.count(db, job_id), "migrated": 0, "last_id": str(after) if after else None}
+        while mapping:
+            ids = db.query(JobApplication.id).filter(JobApplication.job_id == job_id)
+            if after is not None:
+                ids = ids.filter(JobApplication.id > after)
+            ids = [row.id for row in ids.order_by(JobApplication.id).limit(chunk_size)]
+            if not ids:
+                break
+            progress["migrated"] += db.execute(self._statement(job_id, mapping, changed_by, ids)).rowcount
+            db.commit()
+            after = ids[-1]
+            progress["last_id"] = str(after)
+            if on_progress:
+                on_progress(dict(progress))
+        return progress
+
+
+stage_migration_service = StageMigrationService()
@@ -0,0 +1,71 @@
+"""
+Handlers for background tasks. Imported by the task worker so every kind of
+task it may claim is registered on the queue.
+"""
+from uuid import UUID
+
+from fastapi import HTTPException
+from sqlalchemy.orm import Session
+
+from app.models.queued_task import QueuedTask
+from app.services.candidate_service import candidate_service
+from app.services.resume_store import resume_store
+from app.services.screening_service import screening_service
+from app.services.stage_migration import stage_migration_service
+from app.services.task_queue import task_queue, PermanentTaskError
+
+
+@task_queue.handler("resume_upload")
+def process_resume_upload(db: Session, task: QueuedTask) -> dict:
+    """Extracts and parses a resume that the upload route already streamed into the store."""
+    document = resume_store.get_document(db, task.payload["resume_hash"])
+    if document is None:
+        raise PermanentTaskError("Resume document not found")
+    job_id = task.payload.get("job_id")
+    candidate = candidate_service.process_stored_resume(db, document, UUID(job_id) if job_id else None)
+    return {"candidate_id": str(candidate.id)}
+
+
+@task_queue.handler("screening")
+def process_screening(db: Session, task: QueuedTask) -> dict:
+    try:
+        application = screening_service.screen_candidate(db, task.payload["job_id"], task.payload["candidate_id"])
+    except HTTPException as e:
+        # 4xx means the application is gone or invalid; retrying cannot help
+        if e.status_code < 500:
+            raise PermanentTaskError(e.detail)
+        raise
+    return {"application_id": str(application.id), "ai_score": application.ai_score}
+
+
+@task_queue.handler("job_screening")
+def process_job_screening(db: Session, task: QueuedTask) -> dict:
+    """Bulk AI screening of every application on a job, reporting progress on the task."""
+    try:
+        return screening_service.screen_job(
+            db,
+            UUID(task.payload["job_id"]),
+            force=task.payload.get("force", False),
+            min_prescreen=task.payload.get("min_prescreen"),
+            on_progress=lambda progress: task_queue.heartbeat(db, task, progress),
+        )
+    except HTTPException as e:
+        if e.status_code < 500:
+            raise PermanentTaskError(e.detail)
+        raise
+
+
+@task_queue.handler("stage_migration")
+def process_stage_migration(db: Session, task: QueuedTask) -> dict:
+    """Moves a large job's applications onto its new pipeline stages in committed chunks."""
+    # A retried task picks up after the last chunk it committed
+    last_id = (task.progress or {}).get("last_id")
+    changed_by = task.payload.get("changed_by")
+    return stage_migration_service.migrate_in_chunks(
+        db,
+        UUID(task.payload["job_id"]),
+        [tuple(pair) for pair in task.payload["mapping"]],
+        after=UUID(last_id) if last_id else None,
+        changed_by=UUID(changed_by) if changed_by else None,
+        on_progress=lambda progress: task_queue.heartbeat(db, task, progress),
+    )
@@ -0,0 +1,152 @@
+import logging
+import os
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Callable, Dict, Optional
+from uuid import UUID
+
+from sqlalchemy import and_, or_
+from sqlalchemy.orm import Session
+
+from app.models.queued_task import QueuedTask, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# How long a worker owns a claimed task before another worker may take it over
+VISIBILITY_TIMEOUT_SECONDS = int(os.getenv("TASK_VISIBILITY_TIMEOUT_SECONDS", "300"))
+MAX_ATTEMPTS = int(os.getenv("TASK_MAX_ATTEMPTS", "5"))
+RETRY_BASE_SECONDS = float(os.getenv("TASK_RETRY_BASE_SECONDS", "10"))
+RETRY_MAX_SECONDS = float(os.getenv("TASK_RETRY_MAX_SECONDS", "900"))
+
+
+class PermanentTaskError(Exception):
+    """Raised by a handler when retrying cannot help (missing rows, bad input, ...)."""
+
+
+class TaskQueue:
+    """
+    Postgres-backed job queue. Workers claim tasks with SELECT ... FOR UPDATE
+    SKIP LOCKED, so any number of worker processes can poll the same table
+    without handing out a task twice.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, Callable] = {}
+
+    def handler(self, kind: str):
+        """Decorator registering the function that runs tasks of this kind: fn(db, task) -> dict."""
+        def decorator(fn: Callable) -> Callable:
+            self._handlers[kind] = fn
+            return fn
+        return decorator
+
+    def enqueue(self, db: Session, kind: str, payload: dict, created_by: Optional[UUID] = None,
+                max_attempts: Optional[int] = None) -> QueuedTask:
+        task = QueuedTask(
+            kind=kind,
+            payload=payload,
+            status=TaskStatus.QUEUED,
+            max_attempts=max_attempts or MAX_ATTEMPTS,
+            run_after=datetime.now(timezone.utc),
+            created_by=created_by,
+        )
+        db.add(task)
+        db.commit()
+        db.refresh(task)
+        return task
+
+    def get(self, db: Session, task_id: UUID) -> Optional[QueuedTask]:
+        return db.query(QueuedTask).filter(QueuedTask.id == task_id).first()
+
+    def backoff_seconds(self, attempts: int) -> float:
+        """Exponential backoff with jitter so failed tasks do not retry in lockstep."""
+        delay = RETRY_BASE_SECONDS * (2 ** max(attempts - 1, 0)) * random.uniform(0.8, 1.2)
+        return min(delay, RETRY_MAX_SECONDS)
+
+    def claim(self, db: Session, worker_id: str) -> Optional[QueuedTask]:
+        """Leases the next runnable task to this worker, or returns None if there is none."""
+        while True:
+            now = datetime.now(timezone.utc)
+            task = (
+                db.query(QueuedTask)
+                .filter(or_(
+                    and_(QueuedTask.status == TaskStatus.QUEUED, QueuedTask.run_after <= now),
+                    # A running task whose lease expired belongs to a worker that died
+                    and_(QueuedTask.status == TaskStatus.RUNNING, QueuedTask.locked_until < now),
+                ))
+                .order_by(QueuedTask.run_after)
+                .with_for_update(skip_locked=True)
+                .first()
+            )
+            if task is None:
+                db.rollback()
+                return None
+
+            if task.status == TaskStatus.RUNNING and task.attempts >= task.max_attempts:
+                self._finish(task, TaskStatus.FAILED, error="Worker lease expired on the final attempt")
+                db.commit()
+                continue
+
+            task.status = TaskStatus.RUNNING
+            task.attempts += 1
+            task.locked_by = worker_id
+            task.locked_until = now + timedelta(seconds=VISIBILITY_TIMEOUT_SECONDS)
+            db.commit()
+            return task
+
+    def heartbeat(self, db: Session, task: QueuedTask, progress: Optional[dict] = None):
+        """Extends the lease of a long-running task and optionally records its progress."""
+        task.locked_until = datetime.now(timezone.utc) + timedelta(seconds=VISIBILITY_TIMEOUT_SECONDS)
+        if progress is not None:
+            task.progress = progress
+        db.commit()
+
+    def _finish(self, task: QueuedTask, status: str, result: Optional[dict] = None, error: Optional[str] = None):
+        task.status = status
+        task.result = result
+        task.last_error = error
+        task.locked_until = None
+        task.locked_by = None
+        task.finished_at = datetime.now(timezone.utc)
+
+    def complete(self, db: Session, task: QueuedTask, result: Optional[dict] = None):
+        self._finish(task, TaskStatus.SUCCEEDED, result=result)
+        db.commit()
+
+    def fail(self, db: Session, task: QueuedTask, error: str, retry: bool = True):
+        """Schedules a retry with backoff, or marks the task failed once attempts run out."""
+        if retry and task.attempts < task.max_attempts:
+            task.status = TaskStatus.QUEUED
+            task.last_error = error
+            task.locked_until = None
+            task.locked_by = None
+            task.run_after = datetime.now(timezone.utc) + timedelta(seconds=self.backoff_seconds(task.attempts))
+        else:
+            self._finish(task, TaskStatus.FAILED, error=error)
+        db.commit()
+
+    def run_one(self, db: Session, worker_id: str) -> Optional[QueuedTask]:
+        """Claims and runs a single task. Returns the task, or None when the queue is idle."""
+        task = self.claim(db, worker_id)
+        if task is None:
+            return None
+
+        handler = self._handlers.get(task.kind)
+        try:
+            if handler is None:
+                raise PermanentTaskError(f"No handler registered for task kind '{task.kind}'")
+            result = handler(db, task)
+        except PermanentTaskError as e:
+            db.rollback()
+            logger.warning(f"Task {task.id} ({task.kind}) failed permanently: {e}")
+            self.fail(db, task, str(e), retry=False)
+        except Exception as e:
+            db.rollback()
+            logger.exception(f"Task {task.id} ({task.kind}) failed on attempt {task.attempts}")
+            self.fail(db, task, str(e))
+        else:
+            self.complete(db, task, result)
+        return task
+
+
+task_queue = TaskQueue()
@@ -0,0 +1,78 @@
+from collections import namedtuple
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# digest changes whenever any row behind a response is inserted, updated or deleted.
+# last_modified is always None for now: no timestamp covers every row behind a
+# response (joined tables, raw UPDATEs that skip onupdate, deletes), and a
+# Last-Modified that misses a change would turn If-Modified-Since into stale 304s
+Version = namedtuple("Version", ["digest", "last_modified"])
+
+# Every row is fingerprinted by its id and xmin, Postgres' row version, which
+# changes on each UPDATE - including bulk and raw-SQL ones that skip onupdate.
+_JOB_PART = """
+    concat_ws(':', j.xmin, d.xmin, (
+        SELECT md5(string_agg(a.id::text || '.' || a.xmin::text, ',' ORDER BY a.id))
+        FROM job_activities a WHERE a.job_id = j.id
+    ))
+"""
+
+_JOB_SQL = text(f"""
+    SELECT {_JOB_PART} AS digest, NULL AS last_modified
+    FROM jobs j LEFT JOIN departments d ON d.id = j.department_id
+    WHERE j.id = :job_id
+""")
+
+_JOB_APPLICATIONS_SQL = text(f"""
+    SELECT {_JOB_PART} || ':' || coalesce((
+        SELECT md5(string_agg(ja.id::text || '.' || ja.xmin::text || '.' || c.xmin::text, ',' ORDER BY ja.id))
+        FROM job_applications ja JOIN candidates c ON c.id = ja.candidate_id
+        WHERE ja.job_id = j.id
+    ), '') AS digest,
+    NULL AS last_modified
+    FROM jobs j LEFT JOIN departments d ON d.id = j.department_id
+    WHERE j.id = :job_id
+""")
+
+_PIPELINE_TEMPLATES_SQL = text("""
+    SELECT coalesce(md5(string_agg(id::text || '.' || xmin::text, ',' ORDER BY id)), '') AS digest, NULL AS last_modified
+    FROM pipeline_templates
+""")
+
+_SCORECARD_TEMPLATES_SQL = text("""
+    SELECT coalesce(md5(string_agg(id::text || '.' || xmin::text, ',' ORDER BY id)), '') AS digest, NULL AS last_modified
+    FROM scorecard_templates
+""")
+
+
+class VersionService:
+    """
+    Cheap fingerprints of what a read endpoint would return, used as HTTP
+    validators (ETag). Each is a single aggregate query over
+    ids and row versions, so a conditional request that turns out not to be
+    modified never loads or serialises the rows themselves.
+    """
+
+    def _version(self, db: Session, statement, **params) -> Optional[Version]:
+        row = db.execute(statement, params).first()
+        return Version(row.digest, row.last_modified) if row else None
+
+    def job(self, db: Session, job_id: UUID) -> Optional[Version]:
+        """The job, its department and activity log; None if the job does not exist."""
+        return self._version(db, _JOB_SQL, job_id=job_id)
+
+    def job_applications(self, db: Session, job_id: UUID) -> Optional[Version]:
+        """The job plus every application to it and the applying candidates."""
+        return self._version(db, _JOB_APPLICATIONS_SQL, job_id=job_id)
+
+    def pipeline_templates(self, db: Session) -> Version:
+        return self._version(db, _PIPELINE_TEMPLATES_SQL)
+
+    def scorecard_templates(self, db: Session) -> Version:
+        return self._version(db, _SCORECARD_TEMPLATES_SQL)
+
+
+version_service = VersionService()
@@ -0,0 +1,67 @@
+"""
+HTTP conditional GETs.
+
+Routes work out a validator for what they are about to return (see
+app.services.version_service) and, when the client's cached copy is still
+current, answer 304 Not Modified before the body is loaded or serialised.
+ETags are weak because the same content may be sent with or without gzip.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Optional
+
+from fastapi import Request, Response
+
+# Per-user responses: the browser may keep them but must revalidate before each use
+CACHE_CONTROL = "private, no-cache"
+
+
+def make_etag(*parts) -> str:
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()[:24]
+    return f'W/"{digest}"'
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    opaque = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == opaque for tag in header.split(","))
+
+
+def _as_utc(value: datetime) -> datetime:
+    return value.replace(tzinfo=timezone.utc) if value.tzinfo is None else value.astimezone(timezone.utc)
+
+
+def set_validators(response: Response, etag: str, last_modified: Optional[datetime] = None):
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if last_modified:
+        response.headers["Last-Modified"] = format_datetime(_as_utc(last_modified), usegmt=True)
+
+
+def not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> Optional[Response]:
+    """
+    A 304 response when the request's If-None-Match (or, without one,
+    If-Modified-Since) shows the client already has this version, else None.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_none_match is not None:
+        fresh = _etag_matches(if_none_match, etag)
+    elif if_modified_since and last_modified:
+        try:
+            since = _as_utc(parsedate_to_datetime(if_modified_since))
+        except (TypeError, ValueError):
+            fresh = False
+        else:
+            # HTTP dates have whole-second precision
+            fresh = _as_utc(last_modified).replace(microsecond=0) <= since
+    else:
+        fresh = False
+
+    if not fresh:
+        return None
+    response = Response(status_code=304)
+    set_validators(response, etag, last_modified)
+    return response
@@ -0,0 +1,85 @@
+"""
+Keyset (cursor) pagination.
+
+List endpoints order rows newest first by (created_at, id) and continue after
+the last row of the previous page, so every page costs the same index range
+scan and rows inserted meanwhile never shift items between pages. This is the
+order of those endpoints with or without a cursor, so the first page and the
+ones after it agree; before cursors the jobs and candidates lists had no
+defined order. Rows without a created_at (older data) come last, by id. The
+cursor handed to clients is opaque; it is returned in the X-Next-Cursor header
+so list responses keep their plain-array shape.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Sequence
+from uuid import UUID
+
+from fastapi import HTTPException, Query, Response
+from sqlalchemy import and_, or_, tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+class InvalidCursor(ValueError):
+    pass
+
+
+def encode_cursor(created_at: Optional[datetime], row_id: UUID) -> str:
+    payload = json.dumps([created_at.isoformat() if created_at else None, str(row_id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str):
+    """Returns (created_at or None, id) from a cursor made by encode_cursor; raises InvalidCursor."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, row_id = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        return (datetime.fromisoformat(created_at) if created_at is not None else None), UUID(row_id)
+    except (ValueError, TypeError, UnicodeDecodeError):
+        raise InvalidCursor("Invalid pagination cursor")
+
+
+def keyset(query, model, cursor: Optional[str] = None, timestamp_column=None):
+    """
+    Orders `query` newest first by (created_at, id), rows without a timestamp
+    last, and, given a cursor, starts after it. `timestamp_column` replaces
+    created_at, e.g. JobApplication.applied_at.
+    """
+    timestamp_column = timestamp_column if timestamp_column is not None else model.created_at
+    query = query.order_by(timestamp_column.desc().nulls_last(), model.id.desc())
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        if created_at is None:
+            query = query.filter(and_(timestamp_column.is_(None), model.id < row_id))
+        else:
+            query = query.filter(or_(
+                tuple_(timestamp_column, model.id) < tuple_(created_at, row_id),
+                timestamp_column.is_(None),
+            ))
+    return query
+
+
+def next_cursor(items: Sequence, limit: Optional[int]) -> Optional[str]:
+    """Cursor for the page after `items`, or None when this was the last page."""
+    if not limit or len(items) < limit:
+        return None
+    last = items[-1]
+    return encode_cursor(getattr(last, "created_at", None), last.id)
+
+
+def set_next_cursor(response: Response, items: Sequence, limit: Optional[int]):
+    cursor = next_cursor(items, limit)
+    if cursor:
+        response.headers[NEXT_CURSOR_HEADER] = cursor
+
+
+def cursor_param(cursor: Optional[str] = Query(None, description=f"Continue after a previous page (its {NEXT_CURSOR_HEADER} header)")) -> Optional[str]:
+    """Query-parameter dependency; a malformed cursor is a 400 rather than a 500."""
+    if cursor:
+        try:
+            decode_cursor(cursor)
+        except InvalidCursor as e:
+            raise HTTPException(status_code=400, detail=str(e))
+    return cursor
@@ -0,0 +1,66 @@
+"""
+Fast JSON responses.
+
+For a route with a `response_model`, FastAPI validates the returned ORM objects,
+converts the result to plain Python objects and only then encodes those to JSON.
+On the large list endpoints that double walk is most of the request time. Those
+routes build their response with `model_list_response` instead: a TypeAdapter,
+created once per schema, validates straight from the ORM attributes and
+pydantic-core writes the JSON bytes itself. The routes keep their
+`response_model` so the OpenAPI schema is unchanged.
+
+Everything else goes through `DefaultJSONResponse`, which uses orjson when it is
+installed.
+"""
+from functools import lru_cache
+from typing import Iterable, List, Type
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel, TypeAdapter
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in requirements.txt
+    orjson = None
+
+DefaultJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
+
+@lru_cache(maxsize=None)
+def list_adapter(schema: Type[BaseModel]) -> TypeAdapter:
+    return TypeAdapter(List[schema])
+
+
+def _blank(models: List[BaseModel], blank_fields: Iterable[str]):
+    for path in blank_fields:
+        *parents, field = path.split(".")
+        for model in models:
+            for parent in parents:
+                model = getattr(model, parent) if model is not None else None
+            if model is not None:
+                setattr(model, field, None)
+
+
+def dump_model_list(schema: Type[BaseModel], items: Iterable, blank_fields: Iterable[str] = ()) -> bytes:
+    """
+    JSON for `items` (ORM objects or dicts) as `List[schema]` would render it.
+    `blank_fields` ("min_salary", "candidate.current_salary") are rendered as
+    null, e.g. salaries hidden from interviewers, without touching the ORM
+    objects.
+    """
+    adapter = list_adapter(schema)
+    models = adapter.validate_python(list(items), from_attributes=True)
+    _blank(models, blank_fields)
+    return adapter.dump_json(models)
+
+
+def model_list_response(schema: Type[BaseModel], items: Iterable, blank_fields: Iterable[str] = ()) -> Response:
+    return Response(content=dump_model_list(schema, items, blank_fields), media_type="application/json")
+
+
+def model_response(schema: Type[BaseModel], item, blank_fields: Iterable[str] = ()) -> Response:
+    """Single-object counterpart of model_list_response."""
+    model = schema.model_validate(item, from_attributes=True)
+    _blank([model], blank_fields)
+    return Response(content=model.model_dump_json(), media_type="application/json")
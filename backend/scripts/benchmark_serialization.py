@@ -0,0 +1,126 @@
+"""
+Measures JSON serialization cost of the large list responses.
+
+Compares the default FastAPI path for a `response_model` route (validate,
+convert to jsonable Python, json.dumps) with app.utils.serialization (one
+validate + pydantic-core dump) on 1k-row payloads of ORM-like objects, and
+jsonable_encoder + json against orjson for the dict-built candidate list.
+No database is needed.
+
+    python scripts/benchmark_serialization.py [rows] [repeats]
+"""
+import json
+import os
+import sys
+import timeit
+import uuid
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from typing import List
+
+# Add the parent directory (backend) to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from pydantic import TypeAdapter
+
+from app.schemas.activity import ActivityResponse
+from app.schemas.candidate import JobApplicationResponse
+from app.schemas.job import JobResponse
+from app.utils.serialization import DefaultJSONResponse, dump_model_list
+
+NOW = datetime(2026, 3, 18, 9, 30, tzinfo=timezone.utc)
+
+
+def _user(i):
+    return SimpleNamespace(
+        id=uuid.uuid4(), email=f"user{i}@example.com", full_name=f"User {i}", display_name=None, phone=None,
+        location="Lahore", avatar_url=None, role="interviewer", is_active=True, department_id=None,
+        managed_departments=[], google_access_token=None,
+    )
+
+
+def _candidate(i):
+    return SimpleNamespace(
+        id=uuid.uuid4(), first_name=f"First{i}", last_name=f"Last{i}", email=f"candidate{i}@example.com",
+        phone="+92 300 1234567", location="Karachi", current_company="Acme", current_position="Backend Engineer",
+        experience_years=4.5, nationality="Pakistani", notice_period=30, current_salary="250000", expected_salary="300000",
+        skills=["python", "fastapi", "postgresql", "docker", "aws"],
+        education=[{"degree": "BS Computer Science", "school": "FAST", "year": "2019"}],
+        experience_history=[{"title": "Engineer", "company": "Acme", "dates": "2019 - now", "description": "APIs " * 40}],
+        social_links={"linkedin": "https://linkedin.com/in/example"},
+        resume_file_path=f"uploads/{i}.pdf", parsed_at=NOW, created_at=NOW - timedelta(minutes=i), updated_at=None,
+    )
+
+
+def _job(i):
+    department = SimpleNamespace(id=uuid.uuid4(), name="Engineering")
+    return SimpleNamespace(
+        id=uuid.uuid4(), job_code=f"ENG-{i:04d}", title="Backend Engineer", department_id=department.id, department=department,
+        location="Remote", employment_type="Full-time", headcount=2, min_salary=200000.0, max_salary=350000.0,
+        experience_range="3-5", skills=["python", "fastapi", "postgresql"], description="We are hiring. " * 60,
+        hiring_manager_id=None, recruiter_id=None, deadline=None, status="Published", is_deleted=False,
+        pipeline_config=[{"id": "new", "name": "New"}, {"id": "screening", "name": "Screening"}],
+        pipeline_template_id=None, scorecard_template_id=None, created_at=NOW, updated_at=None, activities=[],
+    )
+
+
+def _activity(i):
+    job, candidate = _job(i), _candidate(i)
+    return SimpleNamespace(
+        id=uuid.uuid4(), job_id=job.id, candidate_id=candidate.id, scorecard_template_id=None, activity_type="Interview",
+        title=f"Interview {i}", status="Pending", scheduled_at=NOW, end_time=NOW + timedelta(hours=1), location="Meet",
+        description="Technical round", participants=["a@example.com"], created_at=NOW, updated_at=None, created_by=None,
+        creator=_user(i), external_id=None, external_provider=None, event_html_link=None, details={"round": 1},
+        candidate=candidate, job=job, assignees=[_user(i), _user(i + 1)], scorecard_template=None,
+    )
+
+
+def _application(i):
+    job, candidate = _job(i), _candidate(i)
+    return SimpleNamespace(
+        id=uuid.uuid4(), job_id=job.id, candidate_id=candidate.id, current_stage="screening", application_status="Active",
+        applied_at=NOW, job_title=job.title, score_details={"technical": 4}, overall_score=4.0, recommendation="Hire",
+        ai_score=81.0, ai_analysis={"summary": "Strong backend profile"}, prescreen_score=72.5, candidate=candidate, job=job,
+    )
+
+
+def _fastapi_default(schema, items) -> bytes:
+    """What a `response_model=List[schema]` route does with the default JSONResponse."""
+    adapter = TypeAdapter(List[schema])
+    value = adapter.validate_python(items, from_attributes=True)
+    content = adapter.dump_python(value, mode="json")
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def _report(label, before, after):
+    print(f"{label:<32} {before * 1000:9.1f} ms {after * 1000:9.1f} ms {before / after:7.1f}x")
+
+
+def main(rows: int = 1000, repeats: int = 5):
+    print(f"{rows} rows, best of {repeats}")
+    print(f"{'payload':<32} {'before':>12} {'after':>12} {'speedup':>8}")
+    for label, schema, factory in (
+        ("ActivityResponse (/activities/all)", ActivityResponse, _activity),
+        ("JobResponse (/jobs/)", JobResponse, _job),
+        ("JobApplicationResponse", JobApplicationResponse, _application),
+    ):
+        items = [factory(i) for i in range(rows)]
+        assert json.loads(_fastapi_default(schema, items)) == json.loads(dump_model_list(schema, items))
+        before = min(timeit.repeat(lambda: _fastapi_default(schema, items), number=1, repeat=repeats))
+        after = min(timeit.repeat(lambda: dump_model_list(schema, items), number=1, repeat=repeats))
+        _report(label, before, after)
+
+    # GET /candidates/ builds plain dicts; before: jsonable_encoder + json, after: rendered as-is
+    dicts = [{k: v for k, v in vars(_candidate(i)).items()} for i in range(rows)]
+    for item in dicts:
+        item["id"] = str(item["id"])
+        for key in ("created_at", "updated_at", "parsed_at"):
+            item[key] = item[key].isoformat() if item[key] else None
+    before = min(timeit.repeat(lambda: json.dumps(jsonable_encoder(dicts)).encode(), number=1, repeat=repeats))
+    after = min(timeit.repeat(lambda: DefaultJSONResponse(dicts).body, number=1, repeat=repeats))
+    _report("candidate list dicts", before, after)
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
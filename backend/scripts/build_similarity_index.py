@@ -0,0 +1,39 @@
+"""
+Rebuilds the "similar candidates" index from the database.
+
+Fits a fresh TF-IDF/LSA model on a sample of candidates and vectorises every
+candidate into a new index version under SIMILARITY_INDEX_DIR. Web workers
+pick the new version up on their next query. Run after large imports or when
+the candidate pool has drifted; the task worker keeps it current in between.
+
+    python scripts/build_similarity_index.py
+"""
+import logging
+import os
+import sys
+
+# Add the parent directory (backend) to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.database import SessionLocal
+import app.main  # noqa: F401  (registers every model)
+from app.services.similarity_index import similarity_index_service
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+if __name__ == "__main__":
+    db = SessionLocal()
+    try:
+        manifest = similarity_index_service.build(db)
+        if manifest is None:
+            logger.info("No candidates to index")
+        else:
+            logger.info(f"Built similarity index v{manifest['version']} with {manifest['count']} candidates")
+    finally:
+        db.close()
@@ -0,0 +1,141 @@
+"""
+Background task worker.
+
+Polls the queued_tasks table and runs resume parsing / AI screening tasks
+outside the web process. Start as many copies as needed; tasks are claimed
+with SKIP LOCKED so workers never run the same task concurrently.
+
+    python scripts/task_worker.py            # run until stopped
+    python scripts/task_worker.py --once     # drain the queue and exit
+
+Alongside the tasks, on timers of their own so a busy queue never delays
+them, the worker also folds new and edited candidates into the "similar
+candidates" index every SIMILARITY_SYNC_SECONDS, recomputes the dashboard
+overview every DASHBOARD_REFRESH_SECONDS and deletes expired LLM cache rows
+every LLM_CACHE_PURGE_SECONDS (0 disables any of them).
+"""
+import argparse
+import logging
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+
+# Add the parent directory (backend) to sys.path
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from app.database import SessionLocal
+from app.services.task_queue import task_queue
+from app.services.similarity_index import similarity_index_service
+from app.services.dashboard_service import dashboard_service
+from app.services.llm_cache import llm_cache
+import app.services.task_handlers  # noqa: F401  (registers the task handlers)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+POLL_INTERVAL_SECONDS = float(os.getenv("TASK_POLL_INTERVAL_SECONDS", "2"))
+SIMILARITY_SYNC_SECONDS = float(os.getenv("SIMILARITY_SYNC_SECONDS", "300"))
+# Below DASHBOARD_CACHE_TTL_SECONDS so web requests find a fresh snapshot
+DASHBOARD_REFRESH_SECONDS = float(os.getenv("DASHBOARD_REFRESH_SECONDS", "30"))
+LLM_CACHE_PURGE_SECONDS = float(os.getenv("LLM_CACHE_PURGE_SECONDS", "3600"))
+
+_stopping = False
+_stopped = threading.Event()
+
+
+def _request_stop(signum, frame):
+    global _stopping
+    logger.info("Stop requested, finishing the current task...")
+    _stopping = True
+    _stopped.set()
+
+
+def _sync_similarity_index():
+    db = SessionLocal()
+    try:
+        similarity_index_service.sync(db)
+    except Exception:
+        logger.exception("Similarity index sync failed")
+    finally:
+        db.close()
+
+
+def _refresh_dashboard():
+    db = SessionLocal()
+    try:
+        dashboard_service.refresh_overview(db)
+    except Exception:
+        logger.exception("Dashboard refresh failed")
+    finally:
+        db.close()
+
+
+def _purge_llm_cache():
+    db = SessionLocal()
+    try:
+        deleted = llm_cache.purge_expired(db)
+        if deleted:
+            logger.info(f"Purged {deleted} expired LLM cache entries")
+    except Exception:
+        logger.exception("LLM cache purge failed")
+    finally:
+        db.close()
+
+
+def _every(seconds: float, job):
+    """Runs `job` now and then every `seconds` until the worker stops; each job has its own thread."""
+    while not _stopped.is_set():
+        started = time.monotonic()
+        job()
+        _stopped.wait(max(seconds - (time.monotonic() - started), 0))
+
+
+def _start_maintenance():
+    for seconds, job in (
+        (SIMILARITY_SYNC_SECONDS, _sync_similarity_index),
+        (DASHBOARD_REFRESH_SECONDS, _refresh_dashboard),
+        (LLM_CACHE_PURGE_SECONDS, _purge_llm_cache),
+    ):
+        if seconds > 0:
+            threading.Thread(target=_every, args=(seconds, job), name=job.__name__.strip("_"), daemon=True).start()
+
+
+def run(once: bool = False):
+    worker_id = f"{socket.gethostname()}:{os.getpid()}"
+    logger.info(f"Task worker {worker_id} started")
+    if not once:
+        _start_maintenance()
+    while not _stopping:
+        db = SessionLocal()
+        try:
+            task = task_queue.run_one(db, worker_id)
+        except Exception:
+            # Database hiccups should not kill the worker
+            logger.exception("Task worker loop error")
+            task = None
+        finally:
+            db.close()
+
+        if task is None:
+            if once:
+                break
+            time.sleep(POLL_INTERVAL_SECONDS)
+    _stopped.set()
+    logger.info(f"Task worker {worker_id} stopped")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run background tasks from the queued_tasks table.")
+    parser.add_argument("--once", action="store_true", help="Exit once the queue is empty")
+    args = parser.parse_args()
+
+    signal.signal(signal.SIGINT, _request_stop)
+    signal.signal(signal.SIGTERM, _request_stop)
+    run(once=args.once)
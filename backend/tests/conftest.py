@@ -77,3 +77,14 @@ def override_get_db(db_session):
     app.dependency_overrides[get_db] = _override_get_db
     yield
     app.dependency_overrides.clear()
+
+@pytest.fixture(autouse=True)
+def clear_llm_cache():
+    """
+    The LLM response cache lives in process memory; clear it so one test's
+    mocked OpenAI answer is never served to another test.
+    """
+    from app.services.llm_cache import llm_cache
+    llm_cache.clear()
+    yield
+    llm_cache.clear()
@@ -228,3 +228,52 @@ def test_my_performance_monthly(db_session, override_get_db, test_data):
     current_month_name = datetime.utcnow().strftime("%b")
     assert any(m["name"] == current_month_name for m in data)
 
+
+# ─── Funnel Tests ────────────────────────────────────────────────────────────
+
+def test_funnel_for_job(db_session, override_get_db, test_data):
+    from app.services.candidate_service import candidate_service
+
+    owner = test_data["users"]["owner"]
+    dept = Department(name=f"Funnel-{uuid4().hex[:4]}")
+    db_session.add(dept)
+    db_session.flush()
+    job = Job(title="Funnel Job", department_id=dept.id, job_code=f"FN-{uuid4().hex[:4]}", status=JobStatus.PUBLISHED.value)
+    db_session.add(job)
+    db_session.flush()
+    candidates = [Candidate(first_name=f"Funnel{i}", last_name="C", email=f"funnel{i}.{uuid4().hex[:6]}@c.com") for i in range(3)]
+    db_session.add_all(candidates)
+    db_session.flush()
+    db_session.add_all([JobApplication(candidate_id=c.id, job_id=job.id, current_stage="new") for c in candidates])
+    db_session.flush()
+    candidate_service.bulk_update_applications(db_session, job.id, [c.id for c in candidates[:2]], "move_stage", stage="shortlisted")
+    candidate_service.update_application_stage(db_session, job.id, candidates[0].id, "hired", acting_user_id=owner.id)
+    candidate_service.update_application_stage(db_session, job.id, candidates[2].id, "rejected")
+    # Going back and re-entering a stage does not count the application again
+    candidate_service.update_application_stage(db_session, job.id, candidates[1].id, "new")
+    candidate_service.update_application_stage(db_session, job.id, candidates[1].id, "shortlisted")
+
+    app.dependency_overrides[get_current_active_user] = lambda: owner
+    with TestClient(app) as client:
+        response = client.get(f"/dashboard/funnel?job_id={job.id}&days=30")
+        assert client.get(f"/dashboard/funnel?job_id={uuid4()}").status_code == 404
+    app.dependency_overrides.clear()
+
+    assert response.status_code == 200
+    data = response.json()
+    stages = {stage["stage"]: stage for stage in data["stages"]}
+    assert stages["New Candidates"]["entered"] == 3
+    assert stages["Shortlisted"]["entered"] == 2
+    assert stages["Shortlisted"]["conversion"] == pytest.approx(2 / 3, abs=1e-3)
+    assert stages["Hired"]["entered"] == 1
+    assert data["exits"] == [{"stage": "Rejected", "entered": 1}]
+    assert data["hires"] == 1 and data["median_days_to_hire"] == 0.0
+
+
+def test_funnel_forbidden_for_interviewer(db_session, override_get_db, test_data):
+    interviewer = _persist_user(db_session, UserRole.INTERVIEWER)
+    app.dependency_overrides[get_current_active_user] = lambda: interviewer
+    with TestClient(app) as client:
+        response = client.get("/dashboard/funnel")
+    app.dependency_overrides.clear()
+    assert response.status_code == 403
@@ -616,3 +616,147 @@ def test_read_jobs_interviewer_redaction_loop(db_session, override_get_db):
     assert response.status_code == 200
     assert response.json()[0]["min_salary"] is None
     app.dependency_overrides.clear()
+
+
+# ─── POST /jobs/{job_id}/screen ──────────────────────────────────────────────
+
+def test_bulk_screen_job_queues_task(db_session, override_get_db, existing_job):
+    client, user = get_client(UserRole.HR, override_get_db, db_session)
+    with patch("app.routers.job.screening_service.client", MagicMock()):
+        response = client.post(f"/jobs/{existing_job.id}/screen?force=true")
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["kind"] == "job_screening"
+    assert body["status"] == "queued"
+    app.dependency_overrides.clear()
+
+
+def test_bulk_screen_job_not_found(db_session, override_get_db):
+    client, _ = get_client(UserRole.HR, override_get_db, db_session)
+    with patch("app.routers.job.screening_service.client", MagicMock()):
+        response = client.post(f"/jobs/{uuid4()}/screen")
+    assert response.status_code == 404
+    app.dependency_overrides.clear()
+
+
+def test_bulk_screen_job_forbidden_for_interviewer(db_session, override_get_db, existing_job):
+    client, _ = get_client(UserRole.INTERVIEWER, override_get_db, db_session)
+    response = client.post(f"/jobs/{existing_job.id}/screen")
+    assert response.status_code == 403
+    app.dependency_overrides.clear()
+
+
+def test_prescreen_job_returns_ranked_scores(db_session, override_get_db, existing_job):
+    client, _ = get_client(UserRole.HR, override_get_db, db_session)
+    candidate = Candidate(first_name="Pre", last_name="Screen", email=f"pre.{uuid4().hex[:4]}@example.com", skills=["Python"])
+    db_session.add(candidate)
+    db_session.flush()
+    db_session.add(JobApplication(job_id=existing_job.id, candidate_id=candidate.id, current_stage="new"))
+    db_session.flush()
+
+    response = client.post(f"/jobs/{existing_job.id}/prescreen")
+    assert response.status_code == 200
+    assert response.json()[0]["candidate_id"] == str(candidate.id)
+
+    listed = client.get(f"/jobs/{existing_job.id}/candidates?sort=prescreen")
+    assert listed.status_code == 200
+    assert listed.json()[0]["prescreen_score"] is not None
+    app.dependency_overrides.clear()
+
+
+def test_job_matches_ranks_candidate_pool(db_session, override_get_db, existing_job):
+    from app.services.skill_index import skill_index_service
+    client, _ = get_client(UserRole.HR, override_get_db, db_session)
+    existing_job.skills = ["Terraform"]
+    candidate = Candidate(first_name="Match", last_name="Me", email=f"match.{uuid4().hex[:6]}@example.com", skills=["terraform"])
+    db_session.add(candidate)
+    db_session.flush()
+    skill_index_service.sync_candidate(db_session, candidate)
+
+    response = client.get(f"/jobs/{existing_job.id}/matches?limit=500")
+    assert response.status_code == 200
+    match = next(m for m in response.json() if m["candidate"]["id"] == str(candidate.id))
+    assert match["score"] == 100.0
+    assert match["applied"] is False
+    app.dependency_overrides.clear()
+
+
+def test_job_matches_forbidden_for_interviewer(db_session, override_get_db, existing_job):
+    client, _ = get_client(UserRole.INTERVIEWER, override_get_db, db_session)
+    response = client.get(f"/jobs/{existing_job.id}/matches")
+    assert response.status_code == 403
+    app.dependency_overrides.clear()
+
+
+def test_read_job_board_counts_and_stage_pages(db_session, override_get_db, existing_job):
+    """The board groups applications by stage; a stage's cursor pages through the rest of its cards."""
+    client, _ = get_client(UserRole.OWNER, override_get_db)
+    for i in range(3):
+        candidate = Candidate(first_name=f"Board{i}", last_name="C", email=f"board{i}.{uuid4().hex[:6]}@c.com", current_salary="100k")
+        db_session.add(candidate)
+        db_session.flush()
+        db_session.add(JobApplication(candidate_id=candidate.id, job_id=existing_job.id, current_stage="new" if i < 2 else "offer"))
+    db_session.flush()
+
+    response = client.get(f"/jobs/{existing_job.id}/board?per_stage=1")
+    assert response.status_code == 200
+    board = response.json()
+    assert board["total"] == 3
+    stages = {stage["id"]: stage for stage in board["stages"]}
+    assert [stage["id"] for stage in board["stages"]][:2] == ["new", "shortlisted"]
+    assert stages["new"]["count"] == 2 and len(stages["new"]["cards"]) == 1
+    assert stages["offer"]["next_cursor"] is None
+    assert "current_salary" not in stages["new"]["cards"][0]
+
+    cursor = stages["new"]["next_cursor"]
+    page = client.get(f"/jobs/{existing_job.id}/board", params={"stage": "new", "per_stage": 1, "cursor": cursor}).json()
+    assert [stage["id"] for stage in page["stages"]] == ["new"]
+    seen = {stages["new"]["cards"][0]["id"], page["stages"][0]["cards"][0]["id"]}
+    assert len(seen) == 2
+
+    assert client.get(f"/jobs/{existing_job.id}/board", params={"cursor": cursor}).status_code == 400
+    app.dependency_overrides.clear()
+
+
+def test_bulk_update_candidates(db_session, override_get_db, existing_job):
+    client, user = get_client(UserRole.HIRING_MANAGER, override_get_db, db_session=db_session)
+    candidates = [Candidate(first_name=f"Bulk{i}", last_name="C", email=f"bulk{i}.{uuid4().hex[:6]}@c.com") for i in range(2)]
+    db_session.add_all(candidates)
+    db_session.flush()
+    db_session.add_all([JobApplication(candidate_id=c.id, job_id=existing_job.id, current_stage="new") for c in candidates])
+    db_session.flush()
+
+    ids = [str(c.id) for c in candidates]
+    response = client.post(f"/jobs/{existing_job.id}/candidates/bulk", json={"candidate_ids": ids, "operation": "move_stage", "stage": "hired"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["succeeded"] == 2 and body["failed"] == 0
+    application = db_session.query(JobApplication).filter(JobApplication.candidate_id == candidates[0].id).one()
+    db_session.refresh(application)
+    assert application.current_stage == "hired"
+    assert application.hired_by_user_id == user.id
+
+    # Stage is required for move_stage; only HR and owners may remove applications
+    assert client.post(f"/jobs/{existing_job.id}/candidates/bulk", json={"candidate_ids": ids, "operation": "move_stage"}).status_code == 400
+    assert client.post(f"/jobs/{existing_job.id}/candidates/bulk", json={"candidate_ids": ids, "operation": "remove"}).status_code == 403
+    app.dependency_overrides.clear()
+
+
+def test_change_pipeline_template_in_background(db_session, override_get_db, existing_job):
+    client, _ = get_client(UserRole.OWNER, override_get_db, db_session=db_session)
+    template = PipelineTemplate(name="Background")
+    db_session.add(template)
+    db_session.flush()
+    db_session.add(PipelineStage(name="Screen", order=0, pipeline_template_id=template.id))
+    candidate = Candidate(first_name="Bg", last_name="C", email=f"bg.{uuid4().hex[:6]}@test.com")
+    db_session.add(candidate)
+    db_session.flush()
+    db_session.add(JobApplication(candidate_id=candidate.id, job_id=existing_job.id, current_stage="new"))
+    db_session.flush()
+
+    response = client.patch(f"/jobs/{existing_job.id}/pipeline/template?background=true", json={"pipeline_template_id": str(template.id)})
+    assert response.status_code == 202
+    task = response.json()
+    assert task["kind"] == "stage_migration" and task["status"] == "queued"
+    app.dependency_overrides.clear()
@@ -197,3 +197,24 @@ def test_delete_scorecard_template_failures(db_session, override_get_db, test_te
         response = client.delete(f"/scorecards/{uuid4()}")
     assert response.status_code == 404
     app.dependency_overrides.clear()
+
+
+def test_list_scorecard_templates_conditional(db_session, override_get_db, test_template):
+    user = _persist_user(db_session, UserRole.HR)
+    app.dependency_overrides[get_current_active_user] = lambda: user
+
+    with TestClient(app) as client:
+        first = client.get("/scorecards/")
+        etag = first.headers["ETag"]
+        unchanged = client.get("/scorecards/", headers={"If-None-Match": etag})
+
+        db_session.add(ScorecardTemplate(name="Sales Scorecard", is_default=False, sections=[]))
+        db_session.flush()
+        changed = client.get("/scorecards/", headers={"If-None-Match": etag})
+    app.dependency_overrides.clear()
+
+    assert first.status_code == 200
+    assert unchanged.status_code == 304
+    assert unchanged.content == b""
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
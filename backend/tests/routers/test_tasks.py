@@ -0,0 +1,120 @@
+import pytest
+from uuid import uuid4
+from fastapi.testclient import TestClient
+
+from app.main import app
+from app.routers.auth import get_current_active_user
+from app.models.user import User, UserRole
+from app.models.candidate import Candidate, JobApplication
+from app.models.job import Job
+from app.models.department import Department
+from app.models.queued_task import QueuedTask, TaskStatus
+from app.services.parser_service import ExtractedText
+from app.services.task_queue import task_queue
+from app.services import task_handlers  # noqa: F401
+
+
+def _persist_user(db_session, role: UserRole) -> User:
+    from app.core.security import get_password_hash
+    user = User(
+        email=f"{role.value}.{uuid4().hex[:6]}@tasks-test.com",
+        full_name=f"Test {role.value.title()}",
+        hashed_password=get_password_hash("test"),
+        role=role,
+        is_active=True,
+        is_deleted=False
+    )
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+def get_client(role: UserRole, db_session):
+    user = _persist_user(db_session, role)
+    app.dependency_overrides[get_current_active_user] = lambda: user
+    return TestClient(app), user
+
+
+@pytest.fixture
+def application(db_session):
+    dept = Department(name=f"Platform-{uuid4().hex[:4]}")
+    db_session.add(dept)
+    db_session.flush()
+    job = Job(
+        title="Backend Engineer",
+        department_id=dept.id,
+        location="Remote",
+        employment_type="Full-time",
+        job_code=f"JOB-{uuid4().hex[:4]}"
+    )
+    candidate = Candidate(first_name="Tess", last_name="Queue", email=f"tess.{uuid4().hex[:6]}@example.com")
+    db_session.add_all([job, candidate])
+    db_session.flush()
+    app_row = JobApplication(job_id=job.id, candidate_id=candidate.id, current_stage="new")
+    db_session.add(app_row)
+    db_session.flush()
+    return app_row
+
+
+def test_read_own_task(db_session, override_get_db):
+    client, user = get_client(UserRole.HIRING_MANAGER, db_session)
+    task = task_queue.enqueue(db_session, "screening", {"job_id": "x"}, created_by=user.id)
+
+    response = client.get(f"/tasks/{task.id}")
+    assert response.status_code == 200
+    assert response.json()["status"] == TaskStatus.QUEUED
+    assert response.json()["kind"] == "screening"
+    app.dependency_overrides.clear()
+
+
+def test_read_other_users_task_hidden(db_session, override_get_db):
+    owner = _persist_user(db_session, UserRole.OWNER)
+    task = task_queue.enqueue(db_session, "screening", {}, created_by=owner.id)
+    client, _ = get_client(UserRole.INTERVIEWER, db_session)
+
+    assert client.get(f"/tasks/{task.id}").status_code == 404
+    assert client.get(f"/tasks/{uuid4()}").status_code == 404
+    app.dependency_overrides.clear()
+
+
+def test_background_upload_returns_202_and_worker_finishes_it(mocker, db_session, override_get_db, tmpdir):
+    client, user = get_client(UserRole.HR, db_session)
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    parse = mocker.patch("app.services.candidate_service.parser_service.parse_with_llm", return_value=None)
+    mocker.patch("app.services.candidate_service.parser_service.extract_pdf", return_value=ExtractedText("Queued resume", 1))
+
+    files = {"file": ("queued.pdf", b"%PDF-1.4 queued", "application/pdf")}
+    response = client.post("/candidates/upload", files=files, data={"background": "true"})
+
+    assert response.status_code == 202
+    body = response.json()
+    assert body["kind"] == "resume_upload"
+    # Nothing was parsed inside the request
+    parse.assert_not_called()
+
+    task = task_queue.run_one(db_session, "test-worker")
+    assert str(task.id) == body["id"]
+    assert task.status == TaskStatus.SUCCEEDED
+    assert db_session.query(Candidate).filter(Candidate.id == task.result["candidate_id"]).count() == 1
+    app.dependency_overrides.clear()
+
+
+def test_background_screen_returns_202(mocker, db_session, override_get_db, application):
+    client, _ = get_client(UserRole.HR, db_session)
+    screen = mocker.patch("app.routers.job.screening_service.screen_candidate")
+
+    response = client.post(f"/jobs/{application.job_id}/candidates/{application.candidate_id}/screen?background=true")
+
+    assert response.status_code == 202
+    assert response.json()["kind"] == "screening"
+    screen.assert_not_called()
+    task = db_session.query(QueuedTask).filter(QueuedTask.id == response.json()["id"]).first()
+    assert task.payload == {"job_id": str(application.job_id), "candidate_id": str(application.candidate_id)}
+    app.dependency_overrides.clear()
+
+
+def test_background_screen_unknown_application(db_session, override_get_db):
+    client, _ = get_client(UserRole.HR, db_session)
+    response = client.post(f"/jobs/{uuid4()}/candidates/{uuid4()}/screen?background=true")
+    assert response.status_code == 404
+    app.dependency_overrides.clear()
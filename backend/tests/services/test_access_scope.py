@@ -0,0 +1,96 @@
+import pytest
+from uuid import uuid4
+from app.services.access_scope import access_scope_service
+from app.models.access_scope import UserVisibleCandidate, UserVisibleJob
+from app.models.candidate import Candidate, JobApplication
+from app.models.department import Department
+from app.models.job import Job, JobStatus
+from app.models.scheduled_activity import ScheduledActivity
+from app.models.user import User, UserRole
+
+
+def _user(db_session, role):
+    user = User(email=f"{role.value}.{uuid4().hex[:6]}@scope-test.com", hashed_password="x", role=role)
+    db_session.add(user)
+    db_session.flush()
+    return user
+
+
+def _visible_candidates(db_session, user):
+    return {row.candidate_id for row in db_session.query(UserVisibleCandidate).filter(UserVisibleCandidate.user_id == user.id)}
+
+
+def _visible_jobs(db_session, user):
+    return {row.job_id for row in db_session.query(UserVisibleJob).filter(UserVisibleJob.user_id == user.id)}
+
+
+@pytest.fixture
+def applicant(db_session):
+    dept = Department(name=f"Scope-{uuid4().hex[:4]}")
+    db_session.add(dept)
+    db_session.flush()
+    job = Job(title="Scoped Job", department_id=dept.id, job_code=f"SC-{uuid4().hex[:4]}", status=JobStatus.PUBLISHED.value)
+    candidate = Candidate(first_name="Scoped", last_name="Applicant", email=f"scoped.{uuid4().hex[:6]}@example.com")
+    db_session.add_all([job, candidate])
+    db_session.flush()
+    db_session.add(JobApplication(candidate_id=candidate.id, job_id=job.id))
+    db_session.flush()
+    return dept, job, candidate
+
+
+def test_hiring_manager_scope_follows_department_ownership(db_session, applicant):
+    dept, job, candidate = applicant
+    first, second = _user(db_session, UserRole.HIRING_MANAGER), _user(db_session, UserRole.HIRING_MANAGER)
+
+    dept.owner_id = first.id
+    db_session.flush()
+    assert _visible_candidates(db_session, first) == {candidate.id}
+    assert _visible_jobs(db_session, first) == {job.id}
+
+    dept.owner_id = second.id
+    db_session.flush()
+    assert _visible_candidates(db_session, first) == set()
+    assert _visible_candidates(db_session, second) == {candidate.id}
+
+
+def test_interviewer_scope_follows_assignment(db_session, applicant):
+    _, job, candidate = applicant
+    interviewer = _user(db_session, UserRole.INTERVIEWER)
+    activity = ScheduledActivity(title="Panel", candidate_id=candidate.id, job_id=job.id)
+    db_session.add(activity)
+    db_session.flush()
+    assert _visible_candidates(db_session, interviewer) == set()
+
+    activity.assignees.append(interviewer)
+    db_session.flush()
+    assert _visible_candidates(db_session, interviewer) == {candidate.id}
+    assert access_scope_service.can_see_job(db_session, interviewer, job.id)
+
+    activity.assignees.remove(interviewer)
+    db_session.flush()
+    assert not access_scope_service.can_see_candidate(db_session, interviewer, candidate.id)
+
+
+def test_role_change_clears_scope(db_session, applicant):
+    dept, _, candidate = applicant
+    manager = _user(db_session, UserRole.HIRING_MANAGER)
+    dept.owner_id = manager.id
+    db_session.flush()
+    assert _visible_candidates(db_session, manager) == {candidate.id}
+
+    manager.role = UserRole.HR
+    db_session.flush()
+    assert _visible_candidates(db_session, manager) == set()
+    # Unrestricted roles see everything without scope rows
+    assert access_scope_service.can_see_candidate(db_session, manager, candidate.id)
+
+
+def test_rebuild_matches_incremental_maintenance(db_session, applicant):
+    dept, _, candidate = applicant
+    manager = _user(db_session, UserRole.HIRING_MANAGER)
+    dept.owner_id = manager.id
+    db_session.flush()
+    before = _visible_candidates(db_session, manager)
+
+    access_scope_service.rebuild(db_session)
+    assert _visible_candidates(db_session, manager) == before == {candidate.id}
@@ -0,0 +1,124 @@
+import asyncio
+import io
+import zipfile
+import pytest
+from uuid import uuid4
+from fastapi import UploadFile
+from app.services.batch_upload_service import batch_upload_service
+from app.schemas.candidate import CandidateCreate
+from app.services.parser_service import ExtractedText
+from app.models.candidate import Candidate
+
+
+def _zip_bytes(members: dict) -> bytes:
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buffer.getvalue()
+
+
+def _upload(filename: str, content: bytes) -> UploadFile:
+    return UploadFile(file=io.BytesIO(content), filename=filename)
+
+
+async def _fake_extract(filename, path):
+    return ExtractedText(f"Resume text for {filename}", 1)
+
+
+def test_stage_streams_zip_members_into_store(mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    archive = _zip_bytes({
+        "cvs/alice.pdf": b"%PDF alice",
+        "cvs/bob.docx": b"docx bob",
+        "__MACOSX/cvs/._alice.pdf": b"junk",
+    })
+    entries = asyncio.run(batch_upload_service.stage([_upload("fair.zip", archive), _upload("carol.pdf", b"%PDF carol")]))
+    assert [entry["filename"] for entry in entries] == ["alice.pdf", "bob.docx", "carol.pdf"]
+    for entry in entries:
+        assert entry["error"] is None
+        assert entry["path"].startswith(str(tmpdir))
+    with open(entries[0]["path"], "rb") as stored:
+        assert stored.read() == b"%PDF alice"
+
+
+def test_stage_reports_bad_inputs(mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    mocker.patch("app.services.batch_upload_service.MAX_FILE_BYTES", 4)
+    entries = asyncio.run(batch_upload_service.stage([
+        _upload("broken.zip", b"not a zip"),
+        _upload("notes.txt", b"plain"),
+        _upload("huge.pdf", b"%PDF too big"),
+    ]))
+    assert [(entry["filename"], entry["error"]) for entry in entries] == [
+        ("broken.zip", "Corrupt archive"),
+        ("notes.txt", "Unsupported file type"),
+        ("huge.pdf", "File is empty or too large"),
+    ]
+
+
+def test_ingest_parses_and_reports_per_file(db_session, mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    mocker.patch.object(batch_upload_service, "_extract", side_effect=_fake_extract)
+
+    def fake_parse(text):
+        suffix = uuid4().hex[:6]
+        return CandidateCreate(first_name="Batch", last_name=suffix, email=f"batch.{suffix}@example.com")
+
+    mocker.patch("app.services.batch_upload_service.parser_service.aparse_with_llm", side_effect=fake_parse)
+
+    files = [_upload("one.pdf", b"%PDF one"), _upload("two.docx", b"docx two"), _upload("notes.txt", b"plain")]
+    report = asyncio.run(batch_upload_service.ingest(db_session, files))
+
+    assert report["total"] == 3
+    assert report["succeeded"] == 2
+    assert report["failed"] == 1
+    statuses = {item["filename"]: item["status"] for item in report["items"]}
+    assert statuses == {"one.pdf": "parsed", "two.docx": "parsed", "notes.txt": "failed"}
+
+    created_ids = [item["candidate_id"] for item in report["items"] if item["candidate_id"]]
+    assert db_session.query(Candidate).filter(Candidate.id.in_(created_ids)).count() == 2
+
+
+def test_ingest_creates_stub_when_llm_unavailable(db_session, mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    mocker.patch.object(batch_upload_service, "_extract", side_effect=_fake_extract)
+    mocker.patch("app.services.batch_upload_service.parser_service.aparse_with_llm", return_value=None)
+
+    report = asyncio.run(batch_upload_service.ingest(db_session, [_upload("stub.pdf", b"%PDF stub")]))
+    assert report["items"][0]["status"] == "stub"
+
+
+def test_ingest_rejects_oversized_batch(db_session, mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    mocker.patch("app.services.batch_upload_service.MAX_BATCH_FILES", 1)
+    with pytest.raises(ValueError):
+        asyncio.run(batch_upload_service.ingest(db_session, [_upload("a.pdf", b"a"), _upload("b.pdf", b"b")]))
+
+
+def test_stage_rejects_oversized_archive_before_writing(mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    mocker.patch("app.services.batch_upload_service.MAX_BATCH_FILES", 2)
+    archive = _zip_bytes({f"cv{i}.pdf": b"%PDF" for i in range(3)})
+    with pytest.raises(ValueError):
+        asyncio.run(batch_upload_service.stage([_upload("fair.zip", archive)]))
+    assert tmpdir.listdir() == []
+
+
+def test_stage_rejects_only_the_member_that_overruns_its_header(mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    mocker.patch("app.services.batch_upload_service.MAX_FILE_BYTES", 8)
+    archive = _zip_bytes({"alice.pdf": b"%PDF a", "bob.pdf": b"%PDF b"})
+    real_open = zipfile.ZipFile.open
+
+    def lying_open(self, info, *args, **kwargs):
+        member = real_open(self, info, *args, **kwargs)
+        # Simulate a header that understates the member's real size
+        return io.BytesIO(member.read() * 4) if info.filename == "bob.pdf" else member
+
+    mocker.patch.object(zipfile.ZipFile, "open", lying_open)
+    entries = asyncio.run(batch_upload_service.stage([_upload("fair.zip", archive)]))
+    assert [(entry["filename"], entry["error"]) for entry in entries] == [
+        ("alice.pdf", None),
+        ("bob.pdf", "File is empty or too large"),
+    ]
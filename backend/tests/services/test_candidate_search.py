@@ -0,0 +1,58 @@
+from uuid import uuid4
+from app.services.candidate_search import candidate_search_service
+from app.services.candidate_service import candidate_service
+from app.schemas.candidate import CandidateCreate
+from app.models.user import User, UserRole
+
+
+def _user(role: UserRole) -> User:
+    user = User()
+    user.id = uuid4()
+    user.role = role
+    return user
+
+
+def _create(db_session, **fields):
+    tag = uuid4().hex[:8]
+    data = {"first_name": "Search", "last_name": tag, "email": f"search.{tag}@example.com"}
+    data.update(fields)
+    return candidate_service.create_candidate(db_session, CandidateCreate(**data))
+
+
+def test_search_matches_position_and_skills(db_session):
+    marker = f"zyx{uuid4().hex[:6]}"
+    candidate = _create(db_session, current_position=f"Platform Engineer {marker}", skills=["Kubernetes"])
+
+    results = candidate_search_service.search(db_session, marker, _user(UserRole.HR))
+    assert [found.id for found, _, _ in results] == [candidate.id]
+
+    results = candidate_search_service.search(db_session, f"{marker} kubernetes", _user(UserRole.HR))
+    assert results[0][0].id == candidate.id
+    assert results[0][1] > 0
+
+
+def test_search_tolerates_typos_in_names(db_session):
+    candidate = _create(db_session, first_name="Bartholomew", last_name="Quixotewright")
+    results = candidate_search_service.search(db_session, "Bartholomew Quixotewrigth", _user(UserRole.HR), limit=100)
+    assert candidate.id in [found.id for found, _, _ in results]
+
+
+def test_search_reflects_updates(db_session):
+    from app.schemas.candidate import CandidateUpdate
+    marker = f"qqv{uuid4().hex[:6]}"
+    candidate = _create(db_session)
+    assert candidate_search_service.search(db_session, marker, _user(UserRole.HR)) == []
+
+    candidate_service.update_candidate(db_session, candidate.id, CandidateUpdate(current_company=marker))
+    results = candidate_search_service.search(db_session, marker, _user(UserRole.HR))
+    assert [found.id for found, _, _ in results] == [candidate.id]
+
+
+def test_search_is_scoped_for_interviewers(db_session):
+    marker = f"wvu{uuid4().hex[:6]}"
+    _create(db_session, current_position=marker)
+    assert candidate_search_service.search(db_session, marker, _user(UserRole.INTERVIEWER)) == []
+
+
+def test_search_blank_query_returns_nothing(db_session):
+    assert candidate_search_service.search(db_session, "   ", _user(UserRole.HR)) == []
@@ -9,6 +9,7 @@ from app.schemas.candidate import CandidateCreate, CandidateUpdate
 from app.models.candidate import Candidate, JobApplication
 from app.models.job import Job, JobStatus
 from app.models.department import Department
+from app.models.user import User, UserRole
 
 def setup_job(db_session):
     dept = Department(name="HR")
@@ -118,7 +119,8 @@ def test_upload_resume_stub_creation(db_session, tmpdir):
         assert candidate.id is not None
         assert candidate.first_name == "Parsed"
         assert candidate.email.startswith("parsed_")
-        assert candidate.resume_file_path == f"{UPLOAD_DIR}/test_resume.pdf"
+        assert candidate.resume_hash is not None
+        assert candidate.resume_file_path.endswith(f"{candidate.resume_hash}.pdf")
         
         # Cleanup
         if os.path.exists(candidate.resume_file_path):
@@ -156,6 +158,18 @@ def test_get_candidates_by_ids(db_session):
     results = candidate_service.get_candidates_by_ids(db_session, [cand1.id, cand2.id])
     assert len(results) == 2
 
+def test_get_candidate_list_rows(db_session):
+    cand = candidate_service.create_candidate(db_session, CandidateCreate(first_name="Row", last_name="L1", email="row@ex.com", experience_years=1.0))
+
+    rows = candidate_service.get_candidate_list_rows(db_session, candidate_ids=[cand.id])
+    assert len(rows) == 1
+    assert rows[0].email == "row@ex.com"
+    assert "education" not in rows[0]._fields
+
+    rows = candidate_service.get_candidate_list_rows(db_session, candidate_ids=[cand.id], expand=["education"])
+    assert "education" in rows[0]._fields
+    assert "social_links" not in rows[0]._fields
+
 def test_get_candidates_by_job(db_session):
     job = setup_job(db_session)
     cand = candidate_service.create_candidate(db_session, CandidateCreate(first_name="JobCand", last_name="Last", email="jobcand@ex.com", experience_years=1.0, job_id=job.id))
@@ -173,6 +187,31 @@ def test_update_application_stage(db_session):
     assert app is not None
     assert app.current_stage == "interview"
 
+def test_bulk_update_applications(db_session):
+    job = setup_job(db_session)
+    cands = [
+        candidate_service.create_candidate(db_session, CandidateCreate(first_name=f"Bulk{i}", last_name="Test", email=f"bulk{i}@ex.com", experience_years=1.0, job_id=job.id))
+        for i in range(3)
+    ]
+    missing = uuid4()
+
+    items = candidate_service.bulk_update_applications(db_session, job.id, [c.id for c in cands[:2]] + [missing], "move_stage", stage="Rejected")
+    assert [item["status"] for item in items] == ["updated", "updated", "not_found"]
+    assert items[0]["current_stage"] == "Rejected" and items[0]["application_status"] == "Rejected"
+
+    user = User(email=f"bulk.{uuid4().hex[:6]}@ex.com", hashed_password="x", role=UserRole.HR)
+    db_session.add(user)
+    db_session.flush()
+    items = candidate_service.bulk_update_applications(db_session, job.id, [cands[0].id], "set_status", status="Hired", acting_user_id=user.id)
+    assert items[0]["application_status"] == "Hired" and items[0]["current_stage"] == "Rejected"
+    db_session.expire_all()
+    application = db_session.query(JobApplication).filter(JobApplication.candidate_id == cands[0].id).one()
+    assert application.hired_by_user_id == user.id and application.added_by_user_id == user.id
+
+    items = candidate_service.bulk_update_applications(db_session, job.id, [cands[2].id], "remove")
+    assert items[0]["status"] == "removed"
+    assert db_session.query(JobApplication).filter(JobApplication.job_id == job.id).count() == 2
+
 def test_update_application_score(db_session):
     job = setup_job(db_session)
     cand = candidate_service.create_candidate(db_session, CandidateCreate(first_name="Score", last_name="Test", email="score@ex.com", experience_years=1.0, job_id=job.id))
@@ -0,0 +1,62 @@
+from datetime import datetime, timedelta, timezone
+from uuid import uuid4
+
+from app.models.candidate import Candidate, JobApplication
+from app.models.dashboard_snapshot import DashboardSnapshot
+from app.models.department import Department
+from app.models.job import Job, JobStatus
+from app.models.user import User
+from app.services import dashboard_service as dashboard_module
+from app.services.dashboard_service import dashboard_service, OVERVIEW
+
+
+def _add_job(db_session, **fields):
+    dept = Department(name=f"Dash-{uuid4().hex[:4]}")
+    db_session.add(dept)
+    db_session.flush()
+    job = Job(title="Dash Job", department_id=dept.id, job_code=f"DA-{uuid4().hex[:4]}", **fields)
+    db_session.add(job)
+    db_session.flush()
+    return job
+
+
+def test_compute_overview_matches_individual_counts(db_session):
+    job = _add_job(db_session, status=JobStatus.PUBLISHED.value)
+    _add_job(db_session, status=JobStatus.DRAFT.value, is_deleted=True)
+    candidate = Candidate(first_name="Dash", last_name="Test", email=f"dash.{uuid4().hex[:6]}@ex.com")
+    db_session.add(candidate)
+    db_session.flush()
+    db_session.add(JobApplication(candidate_id=candidate.id, job_id=job.id, current_stage="new", application_status="Hired"))
+    db_session.flush()
+
+    overview = dashboard_service.compute_overview(db_session)
+
+    thirty_days_ago = datetime.now(timezone.utc) - timedelta(days=30)
+    assert overview["total_jobs"] == db_session.query(Job).filter(Job.is_deleted == False).count()
+    assert overview["active_jobs"] == db_session.query(Job).filter(
+        Job.is_deleted == False, Job.status == JobStatus.PUBLISHED.value
+    ).count()
+    assert overview["recent_jobs"] == db_session.query(Job).filter(
+        Job.is_deleted == False, Job.created_at >= thirty_days_ago
+    ).count()
+    assert overview["total_candidates"] == db_session.query(Candidate).count()
+    assert overview["total_users"] == db_session.query(User).filter(User.is_deleted == False).count()
+    assert overview["hires_count"] == db_session.query(JobApplication).filter(
+        JobApplication.application_status == "Hired", JobApplication.applied_at >= thirty_days_ago
+    ).count()
+    assert set(overview["recent_growth"]) == {"jobs_growth", "candidates_growth"}
+
+
+def test_get_overview_serves_snapshot_until_stale(db_session, monkeypatch):
+    monkeypatch.setattr(dashboard_module, "DASHBOARD_CACHE_TTL_SECONDS", 60)
+    before = dashboard_service.get_overview(db_session)
+    _add_job(db_session, status=JobStatus.PUBLISHED.value)
+
+    # Still fresh: the stored snapshot is served as is
+    assert dashboard_service.get_overview(db_session)["total_jobs"] == before["total_jobs"]
+
+    snapshot = db_session.get(DashboardSnapshot, OVERVIEW)
+    snapshot.computed_at = datetime.now(timezone.utc) - timedelta(seconds=120)
+    db_session.flush()
+
+    assert dashboard_service.get_overview(db_session)["total_jobs"] == before["total_jobs"] + 1
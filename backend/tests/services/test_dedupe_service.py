@@ -0,0 +1,106 @@
+import pytest
+from uuid import uuid4
+from app.services.dedupe_service import dedupe_service, normalize_email, normalize_phone, name_tokens
+from app.core.security import get_password_hash
+from app.models.candidate import Candidate, JobApplication
+from app.models.department import Department
+from app.models.feedback import Feedback
+from app.models.job import Job, JobStatus
+from app.models.scheduled_activity import ScheduledActivity
+from app.models.user import User, UserRole
+
+
+def test_normalize_phone():
+    assert normalize_phone("+92 300 1234567") == normalize_phone("0300-1234567")
+    assert normalize_phone("123") is None
+    assert normalize_phone(None) is None
+
+
+def test_normalize_email_ignores_dots_tags_and_stubs():
+    assert normalize_email("John.Smith+cv@Gmail.com") == ("johnsmith", "gmail.com")
+    assert normalize_email(f"parsed_{uuid4()}@example.com") is None
+    assert normalize_email("not-an-email") is None
+
+
+def test_name_tokens_skip_upload_stubs():
+    assert name_tokens("Smith", "John") == ("john", "smith")
+    assert name_tokens("Parsed", "Candidate") == ()
+
+
+def _candidate(db_session, **fields):
+    data = {"first_name": "Dup", "last_name": uuid4().hex[:6], "email": f"dup.{uuid4().hex[:8]}@example.com"}
+    data.update(fields)
+    candidate = Candidate(**data)
+    db_session.add(candidate)
+    db_session.flush()
+    return candidate
+
+
+def test_find_duplicates_within_blocks(db_session):
+    tag = uuid4().hex[:8]
+    first = _candidate(db_session, first_name="Zorawar", last_name=f"Q{tag}", email=f"zq.{tag}@gmail.com", phone=f"+1 555 {tag[:3]}")
+    second = _candidate(db_session, first_name="Zorawar", last_name=f"Q{tag}", email=f"zq{tag}@company.com")
+    unrelated = _candidate(db_session)
+
+    pairs = dedupe_service.find_duplicates(db_session, min_score=0.6, limit=10000)
+    found = {frozenset((pair["first_id"], pair["second_id"])): pair for pair in pairs}
+    pair = found[frozenset((first.id, second.id))]
+    assert pair["score"] >= 0.8
+    assert "same email name" in pair["reasons"]
+    assert not any(unrelated.id in key for key in found)
+
+
+@pytest.fixture
+def job(db_session):
+    dept = Department(name=f"Dedupe-{uuid4().hex[:4]}")
+    db_session.add(dept)
+    db_session.flush()
+    job = Job(title="Dedupe Job", department_id=dept.id, job_code=f"DD-{uuid4().hex[:4]}", status=JobStatus.PUBLISHED.value)
+    db_session.add(job)
+    db_session.flush()
+    return job
+
+
+def test_merge_moves_related_rows(db_session, job):
+    user = User(email=f"dedupe.{uuid4().hex[:6]}@example.com", full_name="Dedupe", hashed_password=get_password_hash("x"), role=UserRole.HR, is_active=True, is_deleted=False)
+    db_session.add(user)
+    survivor = _candidate(db_session, first_name="Parsed", last_name="Candidate", email=f"parsed_{uuid4()}@example.com", skills=["Python"])
+    duplicate = _candidate(db_session, phone="555-0100-22", skills=["python", "SQL"])
+    other_job = Job(title="Other", department_id=job.department_id, job_code=f"DD-{uuid4().hex[:4]}", status=JobStatus.PUBLISHED.value)
+    db_session.add(other_job)
+    db_session.flush()
+
+    db_session.add(JobApplication(job_id=job.id, candidate_id=survivor.id, current_stage="new"))
+    db_session.add(JobApplication(job_id=job.id, candidate_id=duplicate.id, current_stage="new", ai_score=77.0))
+    db_session.add(JobApplication(job_id=other_job.id, candidate_id=duplicate.id, current_stage="new"))
+    activity = ScheduledActivity(job_id=job.id, candidate_id=duplicate.id, activity_type="Interview", title="Screen", created_by=user.id)
+    db_session.add(activity)
+    db_session.flush()
+    db_session.add(Feedback(activity_id=activity.id, candidate_id=duplicate.id, interviewer_id=user.id, overall_score=4, scorecard=[]))
+    db_session.flush()
+    duplicate_id, duplicate_email = duplicate.id, duplicate.email
+
+    result = dedupe_service.merge(db_session, survivor.id, [duplicate_id])
+    assert result["applications_moved"] == 1
+    assert result["applications_combined"] == 1
+    assert result["activities_moved"] == 1
+    assert result["feedbacks_moved"] == 1
+
+    assert db_session.query(Candidate).filter(Candidate.id == duplicate_id).first() is None
+    db_session.refresh(survivor)
+    assert survivor.email == duplicate_email
+    assert survivor.first_name == "Dup"
+    assert survivor.phone == "555-0100-22"
+    assert survivor.skills == ["Python", "SQL"]
+    applications = db_session.query(JobApplication).filter(JobApplication.candidate_id == survivor.id).all()
+    assert {app.job_id for app in applications} == {job.id, other_job.id}
+    assert next(app for app in applications if app.job_id == job.id).ai_score == 77.0
+    assert db_session.query(Feedback).filter(Feedback.candidate_id == survivor.id).count() == 1
+
+
+def test_merge_rejects_bad_input(db_session):
+    candidate = _candidate(db_session)
+    with pytest.raises(ValueError):
+        dedupe_service.merge(db_session, candidate.id, [candidate.id])
+    with pytest.raises(LookupError):
+        dedupe_service.merge(db_session, candidate.id, [uuid4()])
@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+from uuid import uuid4
+
+from app.models.department import Department
+from app.models.funnel_rollup import StageRollupDaily
+from app.models.job import Job, JobStatus
+from app.services.funnel_service import funnel_service
+
+
+def test_funnel_caps_conversion_when_a_later_stage_counts_more(db_session):
+    dept = Department(name=f"Funnel-{uuid4().hex[:4]}")
+    db_session.add(dept)
+    db_session.flush()
+    job = Job(
+        title="Funnel Job", department_id=dept.id, job_code=f"FS-{uuid4().hex[:4]}", status=JobStatus.PUBLISHED.value,
+        pipeline_config=[{"id": "new", "name": "New"}, {"id": "interview", "name": "Interview"}],
+    )
+    db_session.add(job)
+    db_session.flush()
+    # Applications that skipped New, or entered it before the window, still reach Interview
+    today = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+    db_session.add_all([
+        StageRollupDaily(job_id=job.id, bucket=today, stage="New", entered=1),
+        StageRollupDaily(job_id=job.id, bucket=today, stage="Interview", entered=3),
+    ])
+    db_session.flush()
+
+    stages = {stage["stage"]: stage for stage in funnel_service.funnel(db_session, [job.id], days=30)["stages"]}
+    assert stages["Interview"]["entered"] == 3
+    assert stages["Interview"]["conversion"] == 1.0
+    assert stages["Interview"]["drop_off"] == 0
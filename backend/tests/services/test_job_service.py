@@ -68,6 +68,26 @@ def test_get_jobs(db_session):
     assert "Job 1" in titles
     assert "Job 2" in titles
 
+def test_get_jobs_newest_first_with_undated_jobs_last(db_session):
+    from datetime import datetime, timedelta, timezone
+    from app.utils.pagination import next_cursor
+
+    dept = setup_department(db_session)
+    old, new, undated = [
+        job_service.create_job(db_session, JobCreate(title=title, department_id=dept.id, location="HQ", employment_type="Full"))
+        for title in ("Old", "New", "Undated")
+    ]
+    now = datetime.now(timezone.utc) + timedelta(days=1)  # ahead of the other tests' jobs
+    old.created_at, new.created_at, undated.created_at = now, now + timedelta(hours=1), None
+    db_session.flush()
+
+    jobs = job_service.get_jobs(db_session, limit=2)
+    assert [j.title for j in jobs] == ["New", "Old"]
+    rest = job_service.get_jobs(db_session, limit=500, cursor=next_cursor(jobs, 2))
+    assert rest[-1].title == "Undated"
+    # A cursor taken on an undated job continues among the undated ones
+    assert undated not in job_service.get_jobs(db_session, limit=500, cursor=next_cursor([undated], 1))
+
 def test_get_jobs_by_ids(db_session):
     dept = setup_department(db_session)
     job1 = job_service.create_job(db_session, JobCreate(title="ID Job 1", department_id=dept.id, location="HQ", employment_type="Full"))
@@ -0,0 +1,96 @@
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+from app.services.llm_cache import LLMCache, llm_cache
+from app.services.parser_service import parser_service
+from app.models.llm_cache import LLMCacheEntry
+
+
+def test_make_key_normalises_inputs():
+    cache = LLMCache()
+    a = cache.make_key("screening", "gpt-4o-mini", "v1", text="Python  developer\n", skills=["SQL", "python"])
+    b = cache.make_key("screening", "gpt-4o-mini", "v1", text="Python developer", skills=["Python", "sql"])
+    assert a == b
+
+
+def test_make_key_changes_with_model_and_prompt_version():
+    cache = LLMCache()
+    base = cache.make_key("screening", "gpt-4o-mini", "v1", text="x")
+    assert base != cache.make_key("screening", "gpt-4o", "v1", text="x")
+    assert base != cache.make_key("screening", "gpt-4o-mini", "v2", text="x")
+
+
+def test_lru_eviction():
+    cache = LLMCache(max_entries=2, ttl_seconds=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # "a" becomes most recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_ttl_expiry(mocker):
+    cache = LLMCache(max_entries=10, ttl_seconds=5)
+    clock = mocker.patch("app.services.llm_cache.time.monotonic", return_value=100.0)
+    cache.set("k", {"v": 1})
+    clock.return_value = 104.0
+    assert cache.get("k") == {"v": 1}
+    clock.return_value = 106.0
+    assert cache.get("k") is None
+
+
+def test_persistent_layer_survives_process_cache_clear(db_session):
+    cache = LLMCache()
+    cache.set("persisted-key", {"match_score": 91}, db_session, kind="screening", model="m", prompt_version="v1")
+    db_session.flush()
+
+    cache.clear()
+    assert cache.get("persisted-key") is None  # no DB given, memory only
+    assert cache.get("persisted-key", db_session) == {"match_score": 91}
+
+
+def test_expired_rows_are_ignored_and_purged(db_session):
+    db_session.add(LLMCacheEntry(
+        key="stale-key", kind="screening", model="m", prompt_version="v1",
+        response={"match_score": 1},
+        expires_at=datetime.now(timezone.utc) - timedelta(minutes=1),
+    ))
+    db_session.flush()
+
+    assert llm_cache.get("stale-key", db_session) is None
+    assert llm_cache.purge_expired(db_session) >= 1
+
+
+def test_entry_expires_in_both_layers_and_is_purged(db_session, mocker):
+    cache = LLMCache(ttl_seconds=60)
+    start = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    wall = mocker.patch("app.services.llm_cache._utcnow", return_value=start)
+    mono = mocker.patch("app.services.llm_cache.time.monotonic", return_value=1000.0)
+    cache.set("ttl-key", {"match_score": 70}, db_session, kind="screening", model="m", prompt_version="v1")
+    db_session.flush()
+
+    wall.return_value = start + timedelta(seconds=61)
+    mono.return_value = 1061.0
+    assert cache.get("ttl-key") is None
+    assert cache.get("ttl-key", db_session) is None
+
+    assert cache.purge_expired(db_session) >= 1
+    assert db_session.query(LLMCacheEntry).filter(LLMCacheEntry.key == "ttl-key").first() is None
+
+
+def test_parse_with_llm_reuses_cached_result():
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = json.dumps({
+        "first_name": "Jane", "last_name": "Doe", "email": "jane.cache@example.com"
+    })
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = mock_response
+    parser_service.client = mock_client
+
+    first = parser_service.parse_with_llm("Same resume text")
+    second = parser_service.parse_with_llm("Same   resume text ")
+
+    assert first.email == second.email == "jane.cache@example.com"
+    mock_client.chat.completions.create.assert_called_once()
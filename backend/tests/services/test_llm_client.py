@@ -0,0 +1,104 @@
+import asyncio
+import httpx
+import openai
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from app.services.llm_client import LLMClient, TokenBucket, estimate_tokens
+
+_REQUEST = httpx.Request("POST", "https://api.openai.com/v1/chat/completions")
+
+
+def _status_error(cls, status_code, headers=None):
+    response = httpx.Response(status_code, headers=headers or {}, request=_REQUEST)
+    return cls("error", response=response, body=None)
+
+
+def _response(total_tokens=100):
+    response = MagicMock()
+    response.usage.total_tokens = total_tokens
+    return response
+
+
+@pytest.fixture
+def client(mocker):
+    sleeps = []
+    mocker.patch("app.services.llm_client.time.sleep", side_effect=sleeps.append)
+    llm = LLMClient()
+    llm.sleeps = sleeps
+    return llm
+
+
+def test_token_bucket_makes_callers_wait_once_empty():
+    bucket = TokenBucket(per_minute=60)  # one unit per second
+    assert bucket.reserve(60) == 0
+    assert bucket.reserve(2) == pytest.approx(2, abs=0.1)
+
+
+def test_token_bucket_refund_after_real_usage():
+    bucket = TokenBucket(per_minute=600)
+    bucket.reserve(500)
+    bucket.adjust(-400)  # only 100 were really used
+    assert bucket.reserve(400) == 0
+
+
+def test_estimate_tokens():
+    assert estimate_tokens("a" * 400, "b" * 400, completion_tokens=50) == 250
+
+
+def test_complete_honours_retry_after(client):
+    openai_client = MagicMock()
+    openai_client.chat.completions.create.side_effect = [
+        _status_error(openai.RateLimitError, 429, {"retry-after-ms": "1500"}),
+        _response(),
+    ]
+
+    response = client.complete(openai_client, model="gpt-4o-mini", messages=[])
+
+    assert response.usage.total_tokens == 100
+    assert openai_client.chat.completions.create.call_count == 2
+    assert 1.5 in client.sleeps
+    # The estimate is not forwarded to OpenAI
+    assert "estimated_tokens" not in openai_client.chat.completions.create.call_args[1]
+
+
+def test_complete_retries_server_errors_with_backoff(client):
+    openai_client = MagicMock()
+    openai_client.chat.completions.create.side_effect = [
+        _status_error(openai.InternalServerError, 503),
+        _response(),
+    ]
+    client.complete(openai_client, model="gpt-4o-mini", messages=[])
+    assert openai_client.chat.completions.create.call_count == 2
+    assert len(client.sleeps) == 1
+
+
+def test_complete_does_not_retry_client_errors(client):
+    openai_client = MagicMock()
+    openai_client.chat.completions.create.side_effect = _status_error(openai.BadRequestError, 400)
+    with pytest.raises(openai.BadRequestError):
+        client.complete(openai_client, model="gpt-4o-mini", messages=[])
+    assert openai_client.chat.completions.create.call_count == 1
+
+
+def test_complete_gives_up_after_max_retries(client, mocker):
+    mocker.patch("app.services.llm_client.MAX_RETRIES", 2)
+    openai_client = MagicMock()
+    openai_client.chat.completions.create.side_effect = _status_error(openai.RateLimitError, 429)
+    with pytest.raises(openai.RateLimitError):
+        client.complete(openai_client, model="gpt-4o-mini", messages=[])
+    assert openai_client.chat.completions.create.call_count == 3
+
+
+def test_acomplete_retries_connection_errors(mocker):
+    mocker.patch("app.services.llm_client.asyncio.sleep", new=AsyncMock())
+    llm = LLMClient()
+    openai_client = MagicMock()
+    openai_client.chat.completions.create = AsyncMock(side_effect=[
+        openai.APIConnectionError(request=_REQUEST),
+        _response(),
+    ])
+
+    response = asyncio.run(llm.acomplete(openai_client, model="gpt-4o-mini", messages=[]))
+
+    assert response.usage.total_tokens == 100
+    assert openai_client.chat.completions.create.await_count == 2
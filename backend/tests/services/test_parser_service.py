@@ -1,4 +1,6 @@
 import pytest
+import pymupdf
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock
 from app.services.parser_service import parser_service
 import json
@@ -26,6 +28,54 @@ def test_extract_text_from_pdf_exception(mocker):
     extracted = parser_service.extract_text_from_pdf(b"fake pdf bytes")
     assert extracted == ""
 
+def _mock_pdf(mocker, page_texts):
+    mock_doc = MagicMock()
+    pages = []
+    for page_text in page_texts:
+        page = MagicMock()
+        page.get_text.return_value = page_text
+        pages.append(page)
+    mock_doc.__iter__.return_value = pages
+    mock_doc.page_count = len(pages)
+    mocker.patch("app.services.parser_service.pymupdf.open", return_value=mock_doc)
+    return pages
+
+def test_extract_pdf_respects_page_cap(mocker):
+    mocker.patch("app.services.parser_service.PDF_MAX_PAGES", 2)
+    pages = _mock_pdf(mocker, ["one ", "two ", "three "])
+    extracted = parser_service.extract_pdf(b"fake pdf bytes")
+    assert extracted.text == "one two "
+    assert extracted.page_count == 3
+    pages[2].get_text.assert_not_called()
+
+def test_extract_pdf_stops_at_text_budget(mocker):
+    mocker.patch("app.services.parser_service.TEXT_CHAR_BUDGET", 5)
+    pages = _mock_pdf(mocker, ["abcd", "efgh", "ijkl"])
+    extracted = parser_service.extract_pdf(b"fake pdf bytes")
+    assert extracted.text == "abcde"
+    pages[2].get_text.assert_not_called()
+
+def test_extract_pdf_splits_large_stored_documents(mocker, tmpdir):
+    # Build a real multi-page PDF and extract it in page ranges on a thread pool
+    path = str(tmpdir.join("portfolio.pdf"))
+    doc = pymupdf.open()
+    for number in range(6):
+        doc.new_page().insert_text((72, 72), f"Page {number}")
+    doc.save(path)
+    doc.close()
+
+    mocker.patch("app.services.parser_service.PDF_PARALLEL_MIN_PAGES", 4)
+    mocker.patch("app.services.parser_service.PDF_PAGE_WORKERS", 3)
+    mocker.patch.object(parser_service, "_get_page_pool", return_value=ThreadPoolExecutor(max_workers=3))
+    parallel_spy = mocker.spy(parser_service, "_extract_pdf_parallel")
+
+    split = parser_service.extract_pdf(path)
+    single = parser_service.extract_pdf(path, allow_split=False)
+
+    parallel_spy.assert_called_once_with(path, 6)
+    assert split.text == single.text
+    assert [line for line in split.text.split("\n") if line] == [f"Page {n}" for n in range(6)]
+
 def test_extract_text_from_docx(mocker):
     # Mock python-docx Document
     mock_doc = MagicMock()
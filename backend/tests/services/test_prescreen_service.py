@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+from types import SimpleNamespace
+from uuid import uuid4
+from app.services.prescreen_service import prescreen_service, parse_experience_range, tokenize
+from app.models.job import Job, JobStatus
+from app.models.department import Department
+from app.models.candidate import Candidate, JobApplication
+
+
+def _job(**kwargs):
+    fields = {"skills": [], "experience_range": None, "title": "", "description": None}
+    fields.update(kwargs)
+    return SimpleNamespace(**fields)
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("1-3 years", (1.0, 3.0)),
+    ("3 to 5", (3.0, 5.0)),
+    ("5+ years", (5.0, None)),
+    ("2", (2.0, 2.0)),
+    ("", (None, None)),
+    (None, (None, None)),
+])
+def test_parse_experience_range(value, expected):
+    assert parse_experience_range(value) == expected
+
+
+def test_tokenize_keeps_tech_names():
+    assert tokenize("Node.js, C++ and C# developers.") == ["node.js", "c++", "c#", "developers"]
+
+
+def test_skill_overlap_uses_listed_skills_and_resume_text():
+    overlap = prescreen_service.skill_overlap(
+        ["Python", "FastAPI", "Go"],
+        [["python"], [], None],
+        ["", "built apis in fastapi and go", "java"],
+    )
+    assert overlap.tolist() == pytest.approx([1 / 3, 2 / 3, 0.0])
+
+
+def test_experience_fit_falls_off_below_minimum():
+    fit = prescreen_service.experience_fit("4-6 years", np.array([0.0, 2.0, 5.0, 10.0]))
+    assert fit.tolist() == [0.0, 0.5, 1.0, 1.0]
+    assert prescreen_service.experience_fit(None, np.array([1.0])) is None
+
+
+def test_text_similarity_ranks_relevant_resume_first():
+    similarity = prescreen_service.text_similarity(
+        "Backend engineer building Python APIs on PostgreSQL",
+        ["python backend apis postgresql", "graphic designer", ""],
+    )
+    assert similarity[0] > similarity[1] == similarity[2] == 0
+
+
+def test_combine_renormalises_missing_signals():
+    job = _job(skills=["Python"])
+    scores = prescreen_service.combine(job, [["Python"], []], np.array([1.0, 1.0]), ["python", ""])
+    # Skills and keyword similarity are the only signals, so a full match scores 100
+    assert scores.tolist() == [100.0, 0.0]
+    assert prescreen_service.combine(_job(), [[]], np.array([1.0]), [""]).tolist() == [0.0]
+
+
+def test_score_job_stores_scores(db_session):
+    dept = Department(name=f"Prescreen-{uuid4().hex[:4]}")
+    db_session.add(dept)
+    db_session.flush()
+    job = Job(
+        title="Python Developer",
+        department_id=dept.id,
+        location="Remote",
+        employment_type="Full-time",
+        skills=["Python", "FastAPI"],
+        experience_range="2-4 years",
+        description="Python and FastAPI services.",
+        status=JobStatus.PUBLISHED.value,
+        job_code=f"JOB-{uuid4().hex[:4]}"
+    )
+    db_session.add(job)
+    db_session.flush()
+    for name, skills, years in [("Strong", ["Python", "FastAPI"], 3.0), ("Weak", ["Excel"], 0.5)]:
+        candidate = Candidate(first_name=name, last_name="Fit", email=f"{name.lower()}.{uuid4().hex[:4]}@example.com",
+                              skills=skills, experience_years=years)
+        db_session.add(candidate)
+        db_session.flush()
+        db_session.add(JobApplication(job_id=job.id, candidate_id=candidate.id, current_stage="new"))
+    db_session.flush()
+
+    ranked = prescreen_service.score_job(db_session, job.id)
+
+    assert len(ranked) == 2
+    assert ranked[0][2] > ranked[1][2]
+    stored = {a.id: a.prescreen_score for a in db_session.query(JobApplication).filter(JobApplication.job_id == job.id)}
+    assert stored[ranked[0][0]] == ranked[0][2]
@@ -0,0 +1,122 @@
+import asyncio
+import io
+import os
+import pytest
+from uuid import uuid4
+from fastapi import UploadFile
+from unittest.mock import MagicMock
+from app.services.resume_store import resume_store
+from app.services.candidate_service import candidate_service
+from app.schemas.candidate import CandidateCreate
+from app.models.resume_document import ResumeDocument
+
+
+def test_save_fileobj_uses_sharded_content_path(mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    content = b"%PDF resume bytes"
+
+    sha256, path, size = resume_store.save_fileobj(io.BytesIO(content), "CV.PDF")
+
+    assert sha256 == resume_store.hash_bytes(content)
+    assert size == len(content)
+    assert path == os.path.join(str(tmpdir), sha256[:2], sha256[2:4], f"{sha256}.pdf")
+    with open(path, "rb") as f:
+        assert f.read() == content
+    # No temporary files are left behind
+    assert not [name for name in os.listdir(str(tmpdir)) if name.endswith(".part")]
+
+
+def test_same_filename_different_content_does_not_collide(mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    _, first_path, _ = resume_store.save_fileobj(io.BytesIO(b"first"), "CV.pdf")
+    _, second_path, _ = resume_store.save_fileobj(io.BytesIO(b"second"), "CV.pdf")
+    assert first_path != second_path
+    assert os.path.exists(first_path) and os.path.exists(second_path)
+
+
+def test_save_upload_streams_in_chunks(mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    mocker.patch("app.services.resume_store.CHUNK_SIZE", 4)
+    content = b"%PDF streamed resume bytes"
+    upload = UploadFile(file=io.BytesIO(content), filename="cv.pdf")
+    read_spy = mocker.spy(upload.file, "read")
+
+    sha256, path, size = asyncio.run(resume_store.save_upload(upload))
+
+    assert sha256 == resume_store.hash_bytes(content)
+    assert size == len(content)
+    assert all(call.args == (4,) for call in read_spy.call_args_list)
+    with open(path, "rb") as f:
+        assert f.read() == content
+
+
+def test_save_upload_enforces_size_limit(mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    upload = UploadFile(file=io.BytesIO(b"x" * 32), filename="big.pdf")
+    with pytest.raises(ValueError):
+        asyncio.run(resume_store.save_upload(upload, max_bytes=16))
+    assert os.listdir(str(tmpdir)) == []
+
+
+def test_parse_result_round_trip(db_session, mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    sha256, path, size = resume_store.save_fileobj(io.BytesIO(b"roundtrip"), "cv.pdf")
+    document = resume_store.register(db_session, sha256, path, "cv.pdf", size)
+
+    parsed = CandidateCreate(first_name="Ada", last_name="Lovelace", email="ada@example.com",
+                             skills=["Math"], job_id=uuid4(), resume_file_path=path)
+    resume_store.save_parse_result(document, parsed)
+    db_session.flush()
+
+    cached = resume_store.cached_parse(resume_store.get_document(db_session, sha256))
+    assert cached.email == "ada@example.com"
+    assert cached.skills == ["Math"]
+    # Job linkage is per upload, not part of the cached content
+    assert cached.job_id is None
+    assert cached.resume_file_path is None
+
+
+def test_reupload_of_unparsed_file_reuses_stub_candidate(db_session, mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+
+    def make_upload():
+        upload = MagicMock(spec=UploadFile)
+        upload.filename = "CV.pdf"
+        upload.file = io.BytesIO(b"same stub resume")
+        return upload
+
+    first = candidate_service.upload_resume(db_session, make_upload())
+    second = candidate_service.upload_resume(db_session, make_upload())
+
+    assert first.id == second.id
+    assert db_session.query(ResumeDocument).filter(ResumeDocument.sha256 == first.resume_hash).count() == 1
+
+
+def test_upload_stores_parse_result_for_reuse(db_session, mocker, tmpdir):
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    upload = MagicMock(spec=UploadFile)
+    upload.filename = "parsed.pdf"
+    upload.file = io.BytesIO(b"parsed resume")
+    parsed = CandidateCreate(first_name="Grace", last_name="Hopper", email=f"grace.{uuid4().hex[:6]}@example.com")
+
+    candidate = candidate_service.upload_resume(db_session, upload, parsed_data=parsed)
+
+    document = resume_store.get_document(db_session, candidate.resume_hash)
+    assert document.parsed_data["email"] == candidate.email
+    assert document.parsed_at is not None
+
+
+def test_upload_persists_extracted_text(db_session, mocker, tmpdir):
+    from app.services.parser_service import ExtractedText
+
+    mocker.patch("app.services.resume_store.RESUME_STORE_DIR", str(tmpdir))
+    upload = MagicMock(spec=UploadFile)
+    upload.filename = "extracted.pdf"
+    upload.file = io.BytesIO(b"extracted resume")
+
+    candidate = candidate_service.upload_resume(db_session, upload, extracted=ExtractedText("Résumé text", 3))
+
+    document = resume_store.get_document(db_session, candidate.resume_hash)
+    assert document.extracted_text == "Résumé text"
+    assert document.text_bytes == len("Résumé text".encode("utf-8"))
+    assert document.page_count == 3
@@ -2,9 +2,10 @@ import pytest
 import os
 import json
 from uuid import uuid4
-from unittest.mock import MagicMock
+from unittest.mock import AsyncMock, MagicMock
 from fastapi import HTTPException
 from app.services.screening_service import screening_service
+from app.services.llm_cache import llm_cache
 from app.models.job import Job, JobStatus
 from app.models.department import Department
 from app.models.candidate import Candidate, JobApplication
@@ -164,3 +165,175 @@ def test_screen_candidate_api_error(db_session):
 
     assert exc_info.value.status_code == 500
     assert "screening failed" in exc_info.value.detail.lower()
+
+
+def test_screen_candidate_uses_stored_resume_text(db_session, mocker):
+    """Screening reads the text persisted at upload time instead of re-parsing the file."""
+    from app.models.resume_document import ResumeDocument
+
+    job, candidate, application = setup_data(db_session)
+    document = ResumeDocument(
+        sha256=uuid4().hex + uuid4().hex,
+        file_path="uploads/resumes/missing.pdf",
+        extracted_text="Alice built FastAPI services for six years.",
+        text_bytes=43,
+        page_count=2,
+    )
+    db_session.add(document)
+    db_session.flush()
+    candidate.resume_hash = document.sha256
+    candidate.resume_file_path = document.file_path
+
+    extract_pdf = mocker.patch("app.services.screening_service.parser_service.extract_text_from_pdf")
+
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = json.dumps({"match_score": 70})
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = mock_response
+    screening_service.client = mock_client
+
+    screening_service.screen_candidate(db_session, str(job.id), str(candidate.id))
+
+    extract_pdf.assert_not_called()
+    user_content = mock_client.chat.completions.create.call_args[1]["messages"][1]["content"]
+    assert "Alice built FastAPI services" in user_content
+
+
+def test_screening_backfill_refreshes_search_vector(db_session, mocker, tmpdir):
+    """Text extracted while screening an older resume becomes searchable."""
+    from sqlalchemy import func
+    from app.models.resume_document import ResumeDocument
+
+    job, candidate, application = setup_data(db_session)
+    resume = tmpdir.join("old.pdf")
+    resume.write_binary(b"%PDF old")
+    document = ResumeDocument(sha256=uuid4().hex + uuid4().hex, file_path=str(resume))
+    db_session.add(document)
+    db_session.flush()
+    candidate.resume_hash = document.sha256
+    candidate.resume_file_path = str(resume)
+    mocker.patch(
+        "app.services.screening_service.parser_service.extract_text_from_pdf",
+        return_value="Alice maintained the quaternion rendering pipeline.",
+    )
+
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = json.dumps({"match_score": 60})
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = mock_response
+    screening_service.client = mock_client
+
+    screening_service.screen_candidate(db_session, str(job.id), str(candidate.id))
+
+    matches = db_session.query(Candidate.id).filter(
+        Candidate.search_vector.op("@@")(func.to_tsquery("english", "quaternion"))
+    ).all()
+    assert [row.id for row in matches] == [candidate.id]
+
+
+def test_rescreen_unchanged_candidate_uses_cache(db_session):
+    """A second screen with identical inputs is served from the cache without an API call."""
+    job, candidate, application = setup_data(db_session)
+
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = json.dumps({"match_score": 77, "reasoning": "cached"})
+    mock_client = MagicMock()
+    mock_client.chat.completions.create.return_value = mock_response
+    screening_service.client = mock_client
+
+    screening_service.screen_candidate(db_session, str(job.id), str(candidate.id))
+    application.ai_score = None
+    result_app = screening_service.screen_candidate(db_session, str(job.id), str(candidate.id))
+
+    assert result_app.ai_score == 77
+    mock_client.chat.completions.create.assert_called_once()
+
+
+def _add_applicant(db_session, job, name, skills):
+    candidate = Candidate(
+        first_name=name,
+        last_name="Bulk",
+        email=f"{name.lower()}.{uuid4().hex[:4]}@example.com",
+        experience_years=3.0,
+        skills=skills
+    )
+    db_session.add(candidate)
+    db_session.flush()
+    db_session.add(JobApplication(job_id=job.id, candidate_id=candidate.id, current_stage="new"))
+    db_session.flush()
+    return candidate
+
+
+def _async_client(score=70):
+    mock_response = MagicMock()
+    mock_response.choices[0].message.content = json.dumps({"match_score": score, "reasoning": "ok"})
+    mock_client = MagicMock()
+    mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+    return mock_client
+
+
+def test_screen_job_scores_every_application_in_batches(db_session, mocker):
+    job, candidate, application = setup_data(db_session)
+    _add_applicant(db_session, job, "Bruno", ["Python"])
+    _add_applicant(db_session, job, "Chidi", ["Go"])
+    mocker.patch("app.services.screening_service.SCREEN_BATCH_SIZE", 2)
+    screening_service.client = MagicMock()
+    screening_service.async_client = _async_client(score=70)
+    progress_updates = []
+
+    progress = screening_service.screen_job(db_session, job.id, on_progress=progress_updates.append)
+
+    assert progress["total"] == 3
+    assert progress["screened"] == 3
+    assert progress["failed"] == 0
+    # Two batches of at most two applications each
+    assert [update["processed"] for update in progress_updates] == [2, 3]
+    assert progress_updates[-1]["eta_seconds"] == 0
+    scores = [a.ai_score for a in db_session.query(JobApplication).filter(JobApplication.job_id == job.id)]
+    assert scores == [70, 70, 70]
+    screening_service.async_client = None
+
+
+def test_screen_job_skips_unchanged_applications(db_session, mocker):
+    job, candidate, application = setup_data(db_session)
+    other = _add_applicant(db_session, job, "Bruno", ["Python"])
+    screening_service.client = MagicMock()
+    screening_service.async_client = _async_client()
+
+    screening_service.screen_job(db_session, job.id)
+
+    # Only the candidate whose profile changed is screened again
+    db_session.query(Candidate).filter(Candidate.id == other.id).update({"skills": ["Python", "Rust"]})
+    db_session.flush()
+    llm_cache.clear()
+    screening_service.async_client = _async_client(score=90)
+    progress = screening_service.screen_job(db_session, job.id)
+
+    assert progress["skipped"] == 1
+    assert progress["screened"] == 1
+    screening_service.async_client.chat.completions.create.assert_awaited_once()
+    rescreened = db_session.query(JobApplication).filter(JobApplication.candidate_id == other.id).first()
+    assert rescreened.ai_score == 90
+    screening_service.async_client = None
+
+
+def test_screen_job_unknown_job(db_session):
+    screening_service.client = MagicMock()
+    with pytest.raises(HTTPException) as exc_info:
+        screening_service.screen_job(db_session, uuid4())
+    assert exc_info.value.status_code == 404
+
+
+def test_screen_job_skips_applications_below_prescreen_threshold(db_session):
+    job, candidate, application = setup_data(db_session)
+    _add_applicant(db_session, job, "Dana", ["Photoshop"])
+    screening_service.client = MagicMock()
+    screening_service.async_client = _async_client()
+
+    progress = screening_service.screen_job(db_session, job.id, min_prescreen=40)
+
+    # Alice matches the job's skills; Dana is filtered out locally
+    assert progress["below_threshold"] == 1
+    assert progress["screened"] == 1
+    screening_service.async_client.chat.completions.create.assert_awaited_once()
+    screening_service.async_client = None
@@ -0,0 +1,108 @@
+import numpy as np
+import pytest
+from uuid import uuid4
+from app.services.similarity_index import LSAModel, SimilarityIndexService
+from app.models.candidate import Candidate
+from app.models.similarity_index_removal import SimilarityIndexRemoval
+
+TOPICS = {
+    "backend": "python django flask postgres api backend celery redis",
+    "frontend": "react javascript css html typescript frontend redux webpack",
+    "devops": "kubernetes docker terraform aws linux devops ansible prometheus",
+}
+
+
+def _texts(per_topic=10, seed=0):
+    rng = np.random.default_rng(seed)
+    texts, labels = [], []
+    for label, words in TOPICS.items():
+        for _ in range(per_topic):
+            texts.append(" ".join(rng.choice(words.split(), 25)))
+            labels.append(label)
+    return texts, labels
+
+
+def test_lsa_model_groups_similar_documents():
+    texts, labels = _texts()
+    model = LSAModel.fit(texts, dimensions=8)
+    vectors = model.transform(texts)
+    assert vectors.shape == (len(texts), model.dimensions)
+    np.testing.assert_allclose(np.linalg.norm(vectors, axis=1), 1.0, rtol=1e-4)
+
+    scores = vectors @ vectors[0]
+    scores[0] = -1
+    assert labels[int(np.argmax(scores))] == labels[0]
+
+
+def test_lsa_model_unknown_text_is_zero_vector():
+    texts, _ = _texts()
+    model = LSAModel.fit(texts, dimensions=4)
+    assert not model.transform(["completely unrelated words"]).any()
+
+
+def test_lsa_model_round_trips(tmpdir):
+    texts, _ = _texts()
+    model = LSAModel.fit(texts, dimensions=4)
+    path = str(tmpdir.join("model.npz"))
+    model.save(path)
+    loaded = LSAModel.load(path)
+    np.testing.assert_allclose(loaded.transform(texts[:3]), model.transform(texts[:3]), rtol=1e-5)
+
+
+@pytest.fixture
+def index_dir(mocker, tmpdir):
+    mocker.patch("app.services.similarity_index.SIMILARITY_INDEX_DIR", str(tmpdir))
+    return tmpdir
+
+
+def _candidate(db_session, topic, rng):
+    words = TOPICS[topic].split()
+    candidate = Candidate(
+        first_name="Similar",
+        last_name=uuid4().hex[:6],
+        email=f"similar.{uuid4().hex[:8]}@example.com",
+        current_position=topic,
+        skills=list(rng.choice(words, 4)),
+    )
+    db_session.add(candidate)
+    db_session.flush()
+    return candidate
+
+
+def test_build_sync_and_query(db_session, index_dir):
+    rng = np.random.default_rng(1)
+    service = SimilarityIndexService()
+    assert service.similar(db_session, Candidate(id=uuid4())) is None
+
+    backend = [_candidate(db_session, "backend", rng) for _ in range(5)]
+    [_candidate(db_session, "devops", rng) for _ in range(5)]
+    manifest = service.build(db_session)
+    assert manifest["count"] >= 10
+
+    results = service.similar(db_session, backend[0], limit=50)
+    ids = [candidate_id for candidate_id, _ in results]
+    assert backend[0].id not in ids
+    assert set(c.id for c in backend[1:]) <= set(ids)
+
+    newcomer = _candidate(db_session, "backend", rng)
+    assert service.sync(db_session) >= 1
+    assert service._read_manifest()["count"] == manifest["count"] + 1
+    assert newcomer.id in [candidate_id for candidate_id, _ in service.similar(db_session, backend[0], limit=50)]
+
+
+def test_sync_drops_deleted_candidates(db_session, index_dir):
+    rng = np.random.default_rng(2)
+    service = SimilarityIndexService()
+    backend = [_candidate(db_session, "backend", rng) for _ in range(5)]
+    service.build(db_session)
+
+    gone = backend[1]
+    db_session.delete(gone)
+    db_session.flush()
+    assert db_session.get(SimilarityIndexRemoval, gone.id) is not None
+    service.sync(db_session)
+    assert db_session.query(SimilarityIndexRemoval).count() == 0
+
+    ids = [candidate_id for candidate_id, _ in service.similar(db_session, backend[0], limit=50)]
+    assert gone.id not in ids
+    assert set(c.id for c in backend[2:]) <= set(ids)
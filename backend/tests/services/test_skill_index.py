@@ -0,0 +1,92 @@
+import pytest
+from uuid import uuid4
+from app.services.skill_index import skill_index_service, normalize_skill, normalize_skills
+from app.models.candidate_skill import CandidateSkill
+from app.models.candidate import Candidate, JobApplication
+from app.models.department import Department
+from app.models.job import Job, JobStatus
+
+
+@pytest.mark.parametrize("value, expected", [
+    ("Python", "python"),
+    ("  Machine   Learning, ", "machine learning"),
+    ("C++", "c++"),
+    ("", ""),
+    (None, ""),
+    (42, ""),
+])
+def test_normalize_skill(value, expected):
+    assert normalize_skill(value) == expected
+
+
+def test_normalize_skills_dedupes_in_order():
+    assert normalize_skills(["Go", "python", "GO ", "", None]) == ["go", "python"]
+
+
+@pytest.fixture
+def job(db_session):
+    dept = Department(name=f"Skills-{uuid4().hex[:4]}")
+    db_session.add(dept)
+    db_session.flush()
+    job = Job(
+        title="Data Engineer",
+        department_id=dept.id,
+        job_code=f"SK-{uuid4().hex[:4]}",
+        status=JobStatus.PUBLISHED.value,
+        skills=["Python", "Kafka", "Rust"],
+    )
+    db_session.add(job)
+    db_session.flush()
+    return job
+
+
+def _candidate(db_session, skills):
+    candidate = Candidate(first_name="Skill", last_name=uuid4().hex[:6], email=f"skill.{uuid4().hex[:8]}@example.com", skills=skills)
+    db_session.add(candidate)
+    db_session.flush()
+    skill_index_service.sync_candidate(db_session, candidate)
+    return candidate
+
+
+def test_sync_candidate_replaces_rows(db_session):
+    candidate = _candidate(db_session, ["Python", "python ", "SQL"])
+    rows = db_session.query(CandidateSkill.skill).filter(CandidateSkill.candidate_id == candidate.id).all()
+    assert sorted(skill for (skill,) in rows) == ["python", "sql"]
+
+    candidate.skills = ["Go"]
+    skill_index_service.sync_candidate(db_session, candidate)
+    rows = db_session.query(CandidateSkill.skill).filter(CandidateSkill.candidate_id == candidate.id).all()
+    assert rows == [("go",)]
+
+
+def test_match_job_ranks_by_weighted_overlap(db_session, job):
+    generalist = _candidate(db_session, ["Python"])
+    specialist = _candidate(db_session, ["Python", "Rust"])
+    _candidate(db_session, ["Excel"])
+
+    matches = skill_index_service.match_job(db_session, job, limit=500)
+    by_id = {match["candidate"].id: match for match in matches}
+
+    assert generalist.id in by_id and specialist.id in by_id
+    assert by_id[specialist.id]["score"] > by_id[generalist.id]["score"]
+    assert by_id[specialist.id]["matched_skills"] == ["python", "rust"]
+    assert by_id[specialist.id]["missing_skills"] == ["kafka"]
+    scores = [match["score"] for match in matches]
+    assert scores == sorted(scores, reverse=True)
+
+
+def test_match_job_can_exclude_applicants(db_session, job):
+    applicant = _candidate(db_session, ["Kafka", "Rust"])
+    db_session.add(JobApplication(job_id=job.id, candidate_id=applicant.id, current_stage="new"))
+    db_session.flush()
+
+    matches = skill_index_service.match_job(db_session, job, limit=500)
+    assert next(m for m in matches if m["candidate"].id == applicant.id)["applied"] is True
+
+    matches = skill_index_service.match_job(db_session, job, limit=500, exclude_applied=True)
+    assert applicant.id not in {m["candidate"].id for m in matches}
+
+
+def test_match_job_without_skills_returns_nothing(db_session, job):
+    job.skills = []
+    assert skill_index_service.match_job(db_session, job) == []
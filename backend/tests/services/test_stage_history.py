@@ -0,0 +1,76 @@
+import pytest
+from uuid import uuid4
+from app.models.application_stage_event import ApplicationStageEvent, StageEventSource
+from app.models.candidate import Candidate, JobApplication
+from app.models.department import Department
+from app.models.funnel_rollup import StageRollupDaily
+from app.models.job import Job, JobStatus
+from app.models.user import User, UserRole
+from app.services.candidate_service import candidate_service
+from app.services.stage_migration import stage_migration_service
+
+
+@pytest.fixture
+def application(db_session):
+    dept = Department(name=f"History-{uuid4().hex[:4]}")
+    db_session.add(dept)
+    db_session.flush()
+    job = Job(title="History Job", department_id=dept.id, job_code=f"HI-{uuid4().hex[:4]}", status=JobStatus.PUBLISHED.value)
+    candidate = Candidate(first_name="History", last_name="Test", email=f"history.{uuid4().hex[:6]}@ex.com")
+    db_session.add_all([job, candidate])
+    db_session.flush()
+    application = JobApplication(candidate_id=candidate.id, job_id=job.id, current_stage="new")
+    db_session.add(application)
+    db_session.flush()
+    return application
+
+
+def _events(db_session, application):
+    return [
+        (event.from_stage, event.to_stage, event.source)
+        for event in db_session.query(ApplicationStageEvent)
+        .filter(ApplicationStageEvent.application_id == application.id)
+        .order_by(ApplicationStageEvent.occurred_at, ApplicationStageEvent.source)
+    ]
+
+
+def test_new_application_records_its_first_stage(db_session, application):
+    assert _events(db_session, application) == [(None, "new", StageEventSource.APPLIED)]
+
+
+def test_stage_moves_are_recorded_with_who_moved(db_session, application):
+    user = User(email=f"mover.{uuid4().hex[:6]}@ex.com", hashed_password="x", role=UserRole.HR)
+    db_session.add(user)
+    db_session.flush()
+
+    candidate_service.update_application_stage(db_session, application.job_id, application.candidate_id, "interview", acting_user_id=user.id)
+    # Moving to the stage it is already in is not a transition
+    candidate_service.bulk_update_applications(db_session, application.job_id, [application.candidate_id], "move_stage", stage="interview")
+    candidate_service.bulk_update_applications(db_session, application.job_id, [application.candidate_id], "move_stage", stage="Offer")
+
+    events = db_session.query(ApplicationStageEvent).filter(
+        ApplicationStageEvent.application_id == application.id, ApplicationStageEvent.source != StageEventSource.APPLIED
+    ).all()
+    assert {(e.from_stage, e.to_stage, e.source) for e in events} == {
+        ("new", "interview", StageEventSource.MANUAL), ("interview", "Offer", StageEventSource.BULK),
+    }
+    assert next(e for e in events if e.source == StageEventSource.MANUAL).changed_by_user_id == user.id
+
+
+def test_template_migration_is_recorded(db_session, application):
+    assert stage_migration_service.migrate(db_session, application.job_id, {"new": "s1"}) == 1
+    assert ("new", "s1", StageEventSource.TEMPLATE_MIGRATION) in _events(db_session, application)
+
+
+def test_history_and_rollups_survive_removing_the_application(db_session, application):
+    candidate_service.update_application_stage(db_session, application.job_id, application.candidate_id, "interview")
+    candidate_service.bulk_update_applications(db_session, application.job_id, [application.candidate_id], "remove")
+    db_session.expire_all()
+
+    events = db_session.query(ApplicationStageEvent).filter(ApplicationStageEvent.job_id == application.job_id).all()
+    assert sorted(e.to_stage for e in events) == ["interview", "new"]
+    assert all(e.application_id is None for e in events)
+    rollups = dict(
+        db_session.query(StageRollupDaily.stage, StageRollupDaily.entered).filter(StageRollupDaily.job_id == application.job_id)
+    )
+    assert rollups == {"new": 1, "interview": 1}
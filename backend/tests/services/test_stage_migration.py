@@ -0,0 +1,62 @@
+import pytest
+from uuid import uuid4
+from app.services.stage_migration import stage_migration_service
+from app.models.candidate import Candidate, JobApplication
+from app.models.department import Department
+from app.models.job import Job, JobStatus
+
+OLD_CONFIG = [{"id": "new", "name": "New"}, {"id": "tech", "name": "Technical"}, {"id": "gone", "name": "Dropped"}]
+NEW_CONFIG = [{"id": "s1", "name": "New"}, {"id": "s2", "name": "Technical"}]
+
+
+@pytest.fixture
+def job_with_applications(db_session):
+    dept = Department(name=f"Stages-{uuid4().hex[:4]}")
+    db_session.add(dept)
+    db_session.flush()
+    job = Job(title="Stage Job", department_id=dept.id, job_code=f"ST-{uuid4().hex[:4]}", status=JobStatus.PUBLISHED.value)
+    db_session.add(job)
+    db_session.flush()
+    applications = []
+    for i, stage in enumerate(["new", "tech", "tech", "gone", "s2"]):
+        candidate = Candidate(first_name=f"Stage{i}", last_name="Test", email=f"stage{i}.{uuid4().hex[:6]}@ex.com")
+        db_session.add(candidate)
+        db_session.flush()
+        application = JobApplication(candidate_id=candidate.id, job_id=job.id, current_stage=stage)
+        db_session.add(application)
+        applications.append(application)
+    db_session.flush()
+    return job, applications
+
+
+def _stages(db_session, applications):
+    for application in applications:
+        db_session.refresh(application)
+    return [application.current_stage for application in applications]
+
+
+def test_plan_maps_by_name_and_falls_back_to_first_stage(db_session, job_with_applications):
+    job, _ = job_with_applications
+    assert stage_migration_service.plan(db_session, job.id, OLD_CONFIG, NEW_CONFIG, keep_current=True) == {
+        "new": "s1", "tech": "s2", "gone": "s1",
+    }
+    # Changing template: a stage that is not in the old config always moves to the first stage
+    assert stage_migration_service.plan(db_session, job.id, OLD_CONFIG, NEW_CONFIG)["s2"] == "s1"
+
+
+def test_migrate_applies_mapping_in_one_statement(db_session, job_with_applications):
+    job, applications = job_with_applications
+    mapping = stage_migration_service.plan(db_session, job.id, OLD_CONFIG, NEW_CONFIG, keep_current=True)
+    assert stage_migration_service.migrate(db_session, job.id, mapping) == 4
+    assert _stages(db_session, applications) == ["s1", "s2", "s2", "s1", "s2"]
+
+
+def test_migrate_in_chunks_visits_each_application_once(db_session, job_with_applications):
+    job, applications = job_with_applications
+    # s2 is both moved from and moved to; nothing may be remapped twice
+    mapping = list(stage_migration_service.plan(db_session, job.id, OLD_CONFIG, NEW_CONFIG).items())
+    reported = []
+    progress = stage_migration_service.migrate_in_chunks(db_session, job.id, mapping, chunk_size=2, on_progress=reported.append)
+    assert progress["migrated"] == 5 and progress["total"] == 5
+    assert len(reported) == 3
+    assert _stages(db_session, applications) == ["s1", "s2", "s2", "s1", "s1"]
@@ -0,0 +1,101 @@
+import pytest
+from datetime import datetime, timedelta, timezone
+from app.models.queued_task import TaskStatus
+from app.services.task_queue import task_queue, PermanentTaskError
+
+
+@pytest.fixture
+def handlers():
+    """Registers throwaway handlers and restores the registry afterwards."""
+    saved = dict(task_queue._handlers)
+    yield task_queue._handlers
+    task_queue._handlers.clear()
+    task_queue._handlers.update(saved)
+
+
+def _enqueue(db_session, kind, **kwargs):
+    return task_queue.enqueue(db_session, kind, {"value": 21}, **kwargs)
+
+
+def test_run_one_completes_task(db_session, handlers):
+    handlers["double"] = lambda db, task: {"value": task.payload["value"] * 2}
+    task = _enqueue(db_session, "double")
+
+    ran = task_queue.run_one(db_session, "worker-1")
+
+    assert ran.id == task.id
+    assert ran.status == TaskStatus.SUCCEEDED
+    assert ran.attempts == 1
+    assert ran.result == {"value": 42}
+    assert ran.locked_until is None
+    assert ran.finished_at is not None
+
+
+def test_failed_task_is_retried_with_backoff(db_session, handlers):
+    def boom(db, task):
+        raise RuntimeError("OpenAI timed out")
+    handlers["flaky"] = boom
+    task = _enqueue(db_session, "flaky")
+
+    task_queue.run_one(db_session, "worker-1")
+    db_session.refresh(task)
+
+    assert task.status == TaskStatus.QUEUED
+    assert task.attempts == 1
+    assert "timed out" in task.last_error
+    assert task.run_after > datetime.now(timezone.utc)
+    # Not runnable again until the backoff has passed
+    assert task_queue.claim(db_session, "worker-2") is None
+
+
+def test_task_fails_after_max_attempts(db_session, handlers):
+    def boom(db, task):
+        raise RuntimeError("still broken")
+    handlers["flaky"] = boom
+    task = _enqueue(db_session, "flaky", max_attempts=1)
+
+    task_queue.run_one(db_session, "worker-1")
+    db_session.refresh(task)
+    assert task.status == TaskStatus.FAILED
+
+
+def test_permanent_error_is_not_retried(db_session, handlers):
+    def missing(db, task):
+        raise PermanentTaskError("Resume document not found")
+    handlers["missing"] = missing
+    task = _enqueue(db_session, "missing")
+
+    task_queue.run_one(db_session, "worker-1")
+    db_session.refresh(task)
+    assert task.status == TaskStatus.FAILED
+    assert task.attempts == 1
+
+
+def test_expired_lease_is_reclaimed(db_session, handlers):
+    task = _enqueue(db_session, "anything")
+    claimed = task_queue.claim(db_session, "worker-1")
+    assert claimed.id == task.id
+
+    # Nobody else can take it while the lease is valid
+    assert task_queue.claim(db_session, "worker-2") is None
+
+    claimed.locked_until = datetime.now(timezone.utc) - timedelta(seconds=1)
+    db_session.commit()
+    reclaimed = task_queue.claim(db_session, "worker-2")
+    assert reclaimed.id == task.id
+    assert reclaimed.locked_by == "worker-2"
+    assert reclaimed.attempts == 2
+
+
+def test_heartbeat_extends_lease_and_records_progress(db_session):
+    task = _enqueue(db_session, "long")
+    claimed = task_queue.claim(db_session, "worker-1")
+    assert claimed.id == task.id
+    assert claimed.status == TaskStatus.RUNNING
+    assert claimed.attempts == 1
+    first_lease = claimed.locked_until
+
+    task_queue.heartbeat(db_session, claimed, {"done": 5, "total": 10})
+    db_session.refresh(claimed)
+    assert claimed.progress == {"done": 5, "total": 10}
+    assert claimed.locked_until >= first_lease
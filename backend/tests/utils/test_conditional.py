@@ -0,0 +1,43 @@
+from datetime import datetime, timezone
+
+from starlette.requests import Request
+
+from app.utils.conditional import make_etag, not_modified
+
+MODIFIED = datetime(2026, 3, 18, 9, 30, 15, 500000, tzinfo=timezone.utc)
+
+
+def _request(**headers):
+    raw = [(name.replace("_", "-").encode(), value.encode()) for name, value in headers.items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw})
+
+
+def test_make_etag_is_weak_and_stable():
+    assert make_etag("a", 1) == make_etag("a", 1)
+    assert make_etag("a", 1) != make_etag("a", 2)
+    assert make_etag("a").startswith('W/"')
+
+
+def test_if_none_match():
+    etag = make_etag("v1")
+    response = not_modified(_request(if_none_match=f'"other", {etag}'), etag, MODIFIED)
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.headers["Last-Modified"] == "Wed, 18 Mar 2026 09:30:15 GMT"
+
+    assert not_modified(_request(if_none_match=etag.removeprefix("W/")), etag) is not None
+    assert not_modified(_request(if_none_match="*"), etag) is not None
+    assert not_modified(_request(if_none_match='W/"stale"'), etag) is None
+
+
+def test_if_modified_since():
+    etag = make_etag("v1")
+    assert not_modified(_request(if_modified_since="Wed, 18 Mar 2026 09:30:15 GMT"), etag, MODIFIED) is not None
+    assert not_modified(_request(if_modified_since="Wed, 18 Mar 2026 09:30:14 GMT"), etag, MODIFIED) is None
+    assert not_modified(_request(if_modified_since="yesterday"), etag, MODIFIED) is None
+    # If-None-Match takes precedence
+    assert not_modified(_request(if_none_match='W/"stale"', if_modified_since="Wed, 18 Mar 2026 09:30:15 GMT"), etag, MODIFIED) is None
+
+
+def test_no_validators():
+    assert not_modified(_request(), make_etag("v1"), MODIFIED) is None
@@ -0,0 +1,51 @@
+import pytest
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from fastapi import HTTPException
+
+from app.utils.pagination import InvalidCursor, cursor_param, decode_cursor, encode_cursor, keyset, next_cursor
+
+
+def test_cursor_round_trip():
+    created_at = datetime(2026, 3, 18, 9, 30, 15, 123456, tzinfo=timezone.utc)
+    row_id = uuid4()
+    assert decode_cursor(encode_cursor(created_at, row_id)) == (created_at, row_id)
+
+
+@pytest.mark.parametrize("cursor", ["", "not-a-cursor", "W10", "WyJ4IiwieSJd"])
+def test_decode_cursor_rejects_garbage(cursor):
+    with pytest.raises(InvalidCursor):
+        decode_cursor(cursor)
+
+
+def test_next_cursor_only_for_full_pages():
+    rows = [SimpleNamespace(created_at=datetime(2026, 3, 18, tzinfo=timezone.utc), id=uuid4()) for _ in range(2)]
+    assert next_cursor(rows, 3) is None
+    assert next_cursor(rows, None) is None
+    assert decode_cursor(next_cursor(rows, 2)) == (rows[-1].created_at, rows[-1].id)
+
+
+def test_cursor_for_row_without_timestamp():
+    row_id = uuid4()
+    assert decode_cursor(encode_cursor(None, row_id)) == (None, row_id)
+    assert decode_cursor(next_cursor([SimpleNamespace(created_at=None, id=row_id)], 1)) == (None, row_id)
+
+
+def test_keyset_orders_missing_timestamps_last():
+    from sqlalchemy import column, select, table
+    from sqlalchemy.dialects import postgresql
+
+    jobs = table("jobs", column("id"), column("created_at")).c
+    query = keyset(select(jobs.id), jobs, encode_cursor(None, uuid4()))
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    assert "jobs.created_at DESC NULLS LAST, jobs.id DESC" in sql
+    assert "jobs.created_at IS NULL AND jobs.id <" in sql
+
+
+def test_cursor_param_is_a_bad_request():
+    assert cursor_param(None) is None
+    with pytest.raises(HTTPException) as exc:
+        cursor_param("not-a-cursor")
+    assert exc.value.status_code == 400
@@ -0,0 +1,49 @@
+import json
+from datetime import datetime, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+from app.schemas.candidate import CandidateBasicResponse, JobApplicationResponse
+from app.utils.serialization import DefaultJSONResponse, dump_model_list, list_adapter
+
+
+def _candidate(**overrides):
+    fields = dict(
+        id=uuid4(), first_name="Alice", last_name="Smith", email="alice@example.com", phone=None, location=None,
+        current_company=None, current_position=None, experience_years=3.0, nationality=None, notice_period=None,
+        current_salary="100000", expected_salary="120000", skills=["python"], education=[], experience_history=[],
+        resume_file_path=None, parsed_at=None, created_at=datetime(2026, 3, 18, tzinfo=timezone.utc), updated_at=None,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def test_dump_model_list_matches_response_model_output():
+    candidate = _candidate()
+    adapter = list_adapter(CandidateBasicResponse)
+    expected = adapter.dump_python(adapter.validate_python([candidate], from_attributes=True), mode="json")
+    assert json.loads(dump_model_list(CandidateBasicResponse, [candidate])) == expected
+    assert list_adapter(CandidateBasicResponse) is adapter
+
+
+def test_blank_fields_leave_the_source_objects_alone():
+    candidate = _candidate()
+    application = SimpleNamespace(
+        id=uuid4(), job_id=uuid4(), candidate_id=candidate.id, current_stage="new", application_status="New",
+        applied_at=datetime(2026, 3, 18, tzinfo=timezone.utc), candidate=candidate, job=None,
+    )
+    orphan = SimpleNamespace(**{**vars(application), "id": uuid4(), "candidate": None})
+
+    data = json.loads(dump_model_list(
+        JobApplicationResponse, [application, orphan], blank_fields=("candidate.current_salary", "candidate.expected_salary")
+    ))
+    assert data[0]["candidate"]["current_salary"] is None
+    assert data[0]["candidate"]["expected_salary"] is None
+    assert data[1]["candidate"] is None
+    assert candidate.current_salary == "100000"
+
+
+def test_default_json_response_renders_plain_items():
+    response = DefaultJSONResponse([{"id": "1", "skills": []}])
+    assert json.loads(response.body) == [{"id": "1", "skills": []}]
+    assert response.media_type == "application/json"
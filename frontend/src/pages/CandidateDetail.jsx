@@ -276,12 +276,12 @@ const CandidateDetail = () => {
                                 <div className="h-full min-h-[600px] bg-gray-100 rounded-lg border border-gray-200 overflow-hidden relative">
                                     {candidate.resume_file_path ? (
                                         <iframe
-                                            src={`${API_BASE_URL}/static/${candidate.resume_file_path.split('/').pop()}`}
+                                            src={`${API_BASE_URL}/static/${candidate.resume_file_path.replace(/^uploads\//, '')}`}
                                             className="w-full h-full absolute inset-0"
                                             title="Resume Preview"
                                         >
                                             <p className="p-4 text-center">Your browser does not support PDFs.
-                                                <a href={`${API_BASE_URL}/static/${candidate.resume_file_path.split('/').pop()}`} className="text-blue-600 hover:underline ml-1">Download the PDF</a>.</p>
+                                                <a href={`${API_BASE_URL}/static/${candidate.resume_file_path.replace(/^uploads\//, '')}`} className="text-blue-600 hover:underline ml-1">Download the PDF</a>.</p>
                                         </iframe>
                                     ) : (
                                         <div className="h-full flex flex-col items-center justify-center text-gray-500 p-8">
@@ -17,6 +17,10 @@ fi
 python3 -m uvicorn app.main:app --reload --port 8000 &
 BACKEND_PID=$!
 
+# Background task worker (resume parsing, AI screening)
+python3 scripts/task_worker.py &
+WORKER_PID=$!
+
 # Start Frontend
 echo "Starting Frontend..."
 cd ../frontend
@@ -25,7 +29,7 @@ npm run dev &
 FRONTEND_PID=$!
 
 # Handle shutdown
-trap "kill $BACKEND_PID $FRONTEND_PID; exit" SIGINT SIGTERM
+trap "kill $BACKEND_PID $WORKER_PID $FRONTEND_PID; exit" SIGINT SIGTERM
 
 echo "App is running. Press Ctrl+C to stop."
 